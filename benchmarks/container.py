@@ -0,0 +1,61 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of the DI Container lookups of the constructed services from 32 threads at once, as
+the pipeline threads resolve their logger and configuration, comparing the read-optimized mode
+to the default mode acquiring the lock on every lookup.
+
+Run from the root of the repository with: python -m benchmarks.container
+"""
+import threading
+import time
+
+from src.app_functions_sdk_py.bootstrap.container.configuration import ConfigurationName, \
+    configuration_from
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName, \
+    logging_client_from
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct
+
+THREAD_COUNT = 32
+LOOKUPS_PER_THREAD = 50_000
+
+
+def run(dic: Container) -> float:
+    """ Returns the seconds taken by THREAD_COUNT threads each looking the services up. """
+    barrier = threading.Barrier(THREAD_COUNT + 1)
+
+    def lookups():
+        barrier.wait()
+        for _ in range(LOOKUPS_PER_THREAD // 2):
+            logging_client_from(dic.get)
+            configuration_from(dic.get)
+
+    threads = [threading.Thread(target=lookups) for _ in range(THREAD_COUNT)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """ Runs the benchmark and prints the cost per lookup. """
+    logger = EdgeXLogger("benchmark", INFO)
+    config = ConfigurationStruct()
+    lookups = THREAD_COUNT * LOOKUPS_PER_THREAD
+    for name, read_optimized in (("locked", False), ("read-optimized", True)):
+        dic = Container({
+            LoggingClientInterfaceName: lambda get: logger,
+            ConfigurationName: lambda get: config,
+        }, read_optimized=read_optimized)
+        best = min(run(dic) for _ in range(5))
+        print(f"{name:>14}: {best * 1e9 / lookups:6.0f} ns/lookup "
+              f"({lookups / best / 1e6:.2f}M lookups/s across {THREAD_COUNT} threads)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of the per-message cost of creating a Context, cloning it for a pipeline and logging
+through it, comparing the slotted Context, whose clones share the context values until written
+and whose services are resolved once, to the previous Context.
+
+Run from the root of the repository with: python -m benchmarks.context
+"""
+import re
+import timeit
+
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName, \
+    logging_client_from
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.constants import KEY_DEVICE_NAME
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.functions.context import Context
+
+NUMBER = 100_000
+VALUE_COUNT = 5
+
+
+# pylint: disable=too-few-public-methods
+class LegacyContext:
+    """ The parts of Context exercised by the benchmark before it was slotted. """
+
+    def __init__(self, correlation_id: str, dic: Container, input_content_type: str):
+        self._correlation_id = correlation_id
+        self._dic = dic
+        self._input_content_type = input_content_type
+        self._response_data = None
+        self._response_content_type = None
+        self._retry_data = bytes()
+        self.trigger_retry = False
+        self._context_data = {}
+        self._value_placeholder_spec = re.compile("{[^}]*}")
+
+    # pylint: disable=protected-access, missing-function-docstring
+    def clone(self):
+        ctx_data_copy = {}
+        for key, value in self._context_data.items():
+            ctx_data_copy[key] = value
+        clone_ctx = LegacyContext(self._correlation_id, self._dic, self._input_content_type)
+        clone_ctx._response_data = self._response_data
+        clone_ctx._response_content_type = self._response_content_type
+        clone_ctx._retry_data = self._retry_data
+        clone_ctx._context_data = ctx_data_copy
+        return clone_ctx
+
+    def add_value(self, key: str, value: str):
+        self._context_data[key.lower()] = value
+
+    def logger(self):
+        return logging_client_from(self._dic.get)
+
+
+def message(context_class, dic: Container):
+    """ Creates, populates and clones a context, then logs through the clone 3 times. """
+    ctx = context_class("correlation-id", dic, "application/json")
+    ctx.add_value(KEY_DEVICE_NAME, "device")
+    for index in range(VALUE_COUNT - 1):
+        ctx.add_value(f"key{index}", "value")
+    clone = ctx.clone()
+    for _ in range(3):
+        clone.logger().debug("not logged at the INFO level")
+
+
+def main():
+    """ Runs the benchmark and prints the cost per message. """
+    logger = EdgeXLogger("benchmark", INFO)
+    dic = Container({LoggingClientInterfaceName: lambda get: logger})
+    for name, context_class in (("previous Context", LegacyContext),
+                                ("slotted Context", Context)):
+        best = min(timeit.Timer(lambda c=context_class: message(c, dic))
+                   .repeat(repeat=5, number=NUMBER)) / NUMBER
+        print(f"{name:>17}: {best * 1e9:8.0f} ns/message")
+
+
+if __name__ == '__main__':
+    main()
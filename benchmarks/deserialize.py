@@ -0,0 +1,57 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of the per-Event decode cost of deserialize_to_dataclass for events of 1, 100 and 10k
+readings.
+
+Run from the root of the repository with: python -m benchmarks.deserialize
+"""
+import json
+import timeit
+
+from src.app_functions_sdk_py.contracts.dtos.requests.event import AddEventRequest
+from src.app_functions_sdk_py.utils.deserialize import deserialize_to_dataclass
+
+READING_COUNTS = (1, 100, 10_000)
+
+
+def new_add_event_request(reading_count: int) -> dict:
+    """ Returns the decoded JSON of an AddEventRequest with the given number of readings. """
+    readings = [{
+        "id": f"reading-{i}",
+        "origin": 1_700_000_000_000_000_000 + i,
+        "deviceName": "device1",
+        "resourceName": "temperature",
+        "profileName": "profile1",
+        "valueType": "Float64",
+        "value": str(20.0 + i % 10),
+        "tags": {"location": "floor1"},
+    } for i in range(reading_count)]
+    return json.loads(json.dumps({
+        "apiVersion": "v3",
+        "requestId": "82eb2e26-0f24-48aa-ae4c-de9dac3fb9bc",
+        "event": {
+            "apiVersion": "v3",
+            "id": "6ac1a3ea-5b26-4d2c-a8d5-2e0a1b9bdfe4",
+            "deviceName": "device1",
+            "profileName": "profile1",
+            "sourceName": "source1",
+            "origin": 1_700_000_000_000_000_000,
+            "readings": readings,
+        },
+    }))
+
+
+def main():
+    """ Runs the benchmark and prints the decode cost per Event. """
+    for reading_count in READING_COUNTS:
+        data = new_add_event_request(reading_count)
+        number = max(1, 10_000 // reading_count)
+        timer = timeit.Timer(lambda d=data: deserialize_to_dataclass(d, AddEventRequest))
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f"{reading_count:>6} readings: {best * 1e6:12.1f} us/event "
+              f"({best * 1e6 / reading_count:.2f} us/reading)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of the per-message cost of a pipeline of 10 built-in functions (8 filters and 2 tag
+functions) processing an Event of 5 readings, with the logger at the INFO level, where the debug
+messages of the functions are discarded, and at the DEBUG level writing to memory.
+
+Run from the root of the repository with: python -m benchmarks.functions
+"""
+import copy
+import io
+import timeit
+
+from src.app_functions_sdk_py.bootstrap.container.configuration import ConfigurationName
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.contracts.common.constants import VALUE_TYPE_INT32
+from src.app_functions_sdk_py.contracts.dtos.event import new_event
+from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.functions.filters import new_filter_for, new_filter_out
+from src.app_functions_sdk_py.functions.tags import new_tags
+from src.app_functions_sdk_py.interfaces import FunctionPipeline
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct, \
+    StoreAndForwardInfo
+from src.app_functions_sdk_py.internal.runtime import FunctionsPipelineRuntime
+
+NUMBER = 10_000
+READING_COUNT = 5
+
+
+def new_pipeline() -> FunctionPipeline:
+    """ Returns the pipeline of 10 built-in functions all accepting the benchmark Event. """
+    functions = []
+    for filter_values in (["profile"], ["device"], ["source"], ["resource.*"]):
+        functions.append(new_filter_for(filter_values))
+    for filter_values in (["other-profile"], ["other-device"], ["other-source"], ["other"]):
+        functions.append(new_filter_out(filter_values))
+    return FunctionPipeline("benchmark", ["#"],
+                            functions[0].filter_by_profile_name,
+                            functions[1].filter_by_device_name,
+                            functions[2].filter_by_source_name,
+                            functions[3].filter_by_resource_name,
+                            functions[4].filter_by_profile_name,
+                            functions[5].filter_by_device_name,
+                            functions[6].filter_by_source_name,
+                            functions[7].filter_by_resource_name,
+                            new_tags({"gateway": "benchmark"}).add_tags,
+                            new_tags({"site": "benchmark"}).add_tags)
+
+
+def main():
+    """ Runs the benchmark and prints the cost per message at each level. """
+    config = ConfigurationStruct()
+    config.Writable.StoreAndForward = StoreAndForwardInfo()
+    logger = EdgeXLogger("benchmark", INFO)
+    logger.logger.handlers[-1].setStream(io.StringIO())
+    dic = Container({
+        LoggingClientInterfaceName: lambda get: logger,
+        ConfigurationName: lambda get: config,
+    })
+    runtime = FunctionsPipelineRuntime("benchmark", None, dic)
+    pipeline = new_pipeline()
+
+    event = new_event("profile", "device", "source")
+    for index in range(READING_COUNT):
+        event.add_base_reading(f"resource{index}", VALUE_TYPE_INT32, str(index))
+
+    def message():
+        ctx = Context("correlation-id", dic, "application/json")
+        runtime.process_message(ctx, copy.copy(event), pipeline)
+
+    for level in ("INFO", "DEBUG"):
+        logger.set_log_level(level)
+        best = min(timeit.Timer(message).repeat(repeat=5, number=NUMBER)) / NUMBER
+        print(f"{level:>5}: {best * 1e6:6.1f} us/message "
+              f"({best * 1e9 / len(pipeline.transforms):.0f} ns/function)")
+    runtime.stop(0)
+
+
+if __name__ == '__main__':
+    main()
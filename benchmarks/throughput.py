@@ -0,0 +1,252 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of the end-to-end throughput and latency of representative function pipelines executed
+by the MessageBus trigger, with the Events published to the trigger and its responses received
+through the loopback MessageClient, so that no broker is involved.
+
+Each pipeline is run for Events of several numbers of readings and at several concurrency levels,
+the concurrency level being the number of pipeline workers, with 4 messages in flight per worker.
+The latency of a message is the time from its publication to the reception of its response.
+
+The pipelines are:
+    - filter/transform/response: filters on the device name, adds tags, transforms the Event to
+      JSON and sets it as the response
+    - micro-batch: the same pipeline executed on micro-batches of up to 16 messages
+    - HTTP export: filters on the device name, transforms the Event to JSON and POSTs it to a
+      local stub HTTP server before setting it as the response
+
+Run from the root of the repository with: python -m benchmarks.throughput
+"""
+import io
+import queue
+import statistics
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from src.app_functions_sdk_py.bootstrap.container.configuration import ConfigurationName
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.container.messaging import MessagingClientName
+from src.app_functions_sdk_py.bootstrap.container.metrics import MetricsManagerInterfaceName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.bootstrap.metrics.manager import Manager
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, Logger, INFO
+from src.app_functions_sdk_py.contracts.common.constants import CONTENT_TYPE_JSON, \
+    VALUE_TYPE_INT32
+from src.app_functions_sdk_py.contracts.dtos.event import new_event
+from src.app_functions_sdk_py.functions.conversion import Conversion
+from src.app_functions_sdk_py.functions.filters import new_filter_for
+from src.app_functions_sdk_py.functions.http import HTTPSenderOptions, \
+    new_http_sender_with_options
+from src.app_functions_sdk_py.functions.responsedata import ResponseData
+from src.app_functions_sdk_py.functions.tags import new_tags
+from src.app_functions_sdk_py.interfaces import AppFunction
+from src.app_functions_sdk_py.interfaces.messaging import MessageEnvelope, TopicMessageQueue
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct, \
+    StoreAndForwardInfo
+from src.app_functions_sdk_py.internal.runtime import FunctionsPipelineRuntime
+from src.app_functions_sdk_py.internal.trigger.defaultservicebinding import \
+    DefaultTriggerServiceBinding, DefaultTriggerMessageProcessor
+from src.app_functions_sdk_py.internal.trigger.messagebus import MessageBusTrigger
+from src.app_functions_sdk_py.messaging.loopback.client import LoopbackMessageClient
+from src.app_functions_sdk_py.sync.waitgroup import WaitGroup
+from src.app_functions_sdk_py.utils.serialize import encode_json
+
+MESSAGE_COUNT = 2_000
+WARM_UP_COUNT = 200
+READING_COUNTS = (1, 10, 100)
+CONCURRENCY_LEVELS = (1, 4, 16)
+IN_FLIGHT_PER_WORKER = 4
+MICRO_BATCH_SIZE = 16
+DEVICE_COUNT = 8
+RESPONSE_TIMEOUT = 10
+
+BASE_TOPIC_PREFIX = "edgex"
+SUBSCRIBE_TOPIC = "events/#"
+PUBLISH_TOPIC = "responses"
+
+
+class StubExportHandler(BaseHTTPRequestHandler):
+    """ Accepts any POSTed data, as the destination of the HTTP export pipeline. """
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """ Reads the POSTed data and responds with an empty body. """
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        """ Discards the access log. """
+
+
+class StubExportServer(ThreadingHTTPServer):
+    """ The local HTTP server receiving the exports, accepting as many connections as in flight. """
+    daemon_threads = True
+    request_queue_size = max(CONCURRENCY_LEVELS) * IN_FLIGHT_PER_WORKER
+
+
+class BenchmarkService:
+    """ The part of the ApplicationService used by the service binding of the trigger. """
+
+    def __init__(self, dic: Container):
+        self._dic = dic
+
+    def logger(self) -> Logger:
+        """ Returns the logger of the service. """
+        return self._dic.get(LoggingClientInterfaceName)
+
+    def get_service_config(self) -> ConfigurationStruct:
+        """ Returns the configuration of the service. """
+        return self._dic.get(ConfigurationName)
+
+    def dic(self) -> Container:
+        """ Returns the DI container of the service. """
+        return self._dic
+
+    def load_custom_config(self, config: Any, section_name: str):
+        """ The benchmark has no custom configuration. """
+
+
+def filter_transform_response() -> tuple[AppFunction, ...]:
+    """ Returns the functions of the filter/transform/response pipeline. """
+    return (new_filter_for([f"device-{index}" for index in range(DEVICE_COUNT)])
+            .filter_by_device_name,
+            new_tags({"gateway": "benchmark"}).add_tags,
+            Conversion().transform_to_json,
+            ResponseData(CONTENT_TYPE_JSON).set_response_data)
+
+
+def http_export(url: str) -> tuple[AppFunction, ...]:
+    """ Returns the functions of the HTTP export pipeline. """
+    sender = new_http_sender_with_options(HTTPSenderOptions(
+        url=url, mime_type=CONTENT_TYPE_JSON, return_input_data=True))
+    return (new_filter_for([f"device-{index}" for index in range(DEVICE_COUNT)])
+            .filter_by_device_name,
+            Conversion().transform_to_json,
+            sender.http_post,
+            ResponseData(CONTENT_TYPE_JSON).set_response_data)
+
+
+def new_payload(reading_count: int) -> bytes:
+    """ Returns the JSON encoded Event of reading_count readings published to the trigger. """
+    event = new_event("profile", "device-0", "source")
+    for index in range(reading_count):
+        event.add_base_reading(f"resource{index}", VALUE_TYPE_INT32, str(index))
+    return encode_json(event)
+
+
+# pylint: disable=too-many-locals
+def run(functions: Callable[[], tuple[AppFunction, ...]], reading_count: int, concurrency: int,
+        micro_batch_size: int = 0) -> tuple[float, list[float]]:
+    """
+    Publishes the messages to the trigger executing the pipeline of the functions and returns
+    the throughput in messages per second along with the latency of each message in seconds.
+    """
+    config = ConfigurationStruct()
+    config.Writable.StoreAndForward = StoreAndForwardInfo()
+    config.MessageBus.BaseTopicPrefix = BASE_TOPIC_PREFIX
+    config.Trigger.SubscribeTopics = SUBSCRIBE_TOPIC
+    config.Trigger.PublishTopic = PUBLISH_TOPIC
+    config.Trigger.WorkerPool.MaxWorkers = concurrency
+    config.Trigger.MicroBatch.MaxSize = micro_batch_size
+    logger = EdgeXLogger("benchmark", INFO)
+    logger.logger.handlers[-1].setStream(io.StringIO())
+    client = LoopbackMessageClient()
+    metrics_manager = Manager(logger, timedelta(seconds=60), None)
+    dic = Container({
+        LoggingClientInterfaceName: lambda get: logger,
+        ConfigurationName: lambda get: config,
+        MessagingClientName: lambda get: client,
+        MetricsManagerInterfaceName: lambda get: metrics_manager,
+    })
+
+    runtime = FunctionsPipelineRuntime("benchmark", None, dic)
+    runtime.set_default_functions_pipeline(*functions())
+    service_binding = DefaultTriggerServiceBinding(runtime, BenchmarkService(dic))
+    message_processor = DefaultTriggerMessageProcessor(service_binding, metrics_manager)
+    trigger = MessageBusTrigger(service_binding, message_processor, dic)
+    ctx_done = threading.Event()
+    wait_group = WaitGroup()
+    disconnect = trigger.initialize(ctx_done, wait_group)
+
+    total = WARM_UP_COUNT + MESSAGE_COUNT
+    in_flight = threading.Semaphore(concurrency * IN_FLIGHT_PER_WORKER)
+    published = [0.0] * total
+    latencies = [0.0] * total
+    completed = threading.Event()
+    measure_start = [0.0]
+    responses = queue.Queue()
+    client.subscribe([TopicMessageQueue(f"{BASE_TOPIC_PREFIX}/{PUBLISH_TOPIC}", responses)],
+                     None)
+
+    def receive_responses():
+        received = 0
+        while received < total:
+            response = responses.get()
+            if response is None:
+                return
+            index = int(response.correlationID)
+            latencies[index] = time.perf_counter() - published[index]
+            in_flight.release()
+            received += 1
+            if received == WARM_UP_COUNT:
+                measure_start[0] = time.perf_counter()
+        completed.set()
+
+    receiver = threading.Thread(target=receive_responses)
+    receiver.start()
+    payload = new_payload(reading_count)
+    try:
+        for index in range(total):
+            # a message without response, e.g. failed by its pipeline, stalls the benchmark
+            if not in_flight.acquire(timeout=RESPONSE_TIMEOUT):
+                raise RuntimeError(f"no response received within {RESPONSE_TIMEOUT}s")
+            published[index] = time.perf_counter()
+            client.publish(MessageEnvelope(correlationID=str(index), payload=payload,
+                                           contentType=CONTENT_TYPE_JSON),
+                           f"{BASE_TOPIC_PREFIX}/events/device/service/profile/"
+                           f"device-{index % DEVICE_COUNT}/source")
+        if not completed.wait(RESPONSE_TIMEOUT):
+            raise RuntimeError(f"no response received within {RESPONSE_TIMEOUT}s")
+        elapsed = time.perf_counter() - measure_start[0]
+    finally:
+        ctx_done.set()
+        disconnect()
+        message_processor.stop()
+        runtime.stop(0)
+        wait_group.wait()
+        receiver.join()
+    return MESSAGE_COUNT / elapsed, latencies[WARM_UP_COUNT:]
+
+
+def main():
+    """ Runs each pipeline at each Event size and concurrency level and prints the results. """
+    server = StubExportServer(("127.0.0.1", 0), StubExportHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/export"
+
+    cases = (
+        ("filter/transform/response", filter_transform_response, 0),
+        ("micro-batch", filter_transform_response, MICRO_BATCH_SIZE),
+        ("HTTP export", lambda: http_export(url), 0),
+    )
+    print(f"{'pipeline':>26} {'readings':>8} {'workers':>7} {'msgs/s':>8} "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7}")
+    for name, functions, micro_batch_size in cases:
+        for reading_count in READING_COUNTS:
+            for concurrency in CONCURRENCY_LEVELS:
+                throughput, latencies = run(functions, reading_count, concurrency,
+                                            micro_batch_size)
+                percentiles = statistics.quantiles(latencies, n=100)
+                print(f"{name:>26} {reading_count:>8} {concurrency:>7} {throughput:>8.0f} "
+                      f"{percentiles[49] * 1e3:>7.2f} {percentiles[94] * 1e3:>7.2f} "
+                      f"{percentiles[98] * 1e3:>7.2f}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,8 @@ manage services and their instances.
 
 The container maintains a list of services, their constructors, and their constructed instances
 in a thread-safe manner. It provides methods to update the service constructors and retrieve
-constructed instances.
+constructed instances. In read-optimized mode, the constructed instances are also published into
+an immutable snapshot, so that they can be retrieved without acquiring the lock.
 
 Classes:
     Service: Represents a service with its constructor and constructed instance.
@@ -37,11 +38,21 @@ class Service:
 class Container:
     """
     Maintains a list of services, their constructors, and their constructed instances in a
-    thread-safe manner.
+    thread-safe manner. The revision is incremented on every update, so that the holders of
+    services resolved from the container can tell when to resolve them again.
+
+    When read_optimized is True, every constructed instance is published into a snapshot of the
+    instances, which is replaced rather than modified on construction and update. get then
+    returns the instances found in the snapshot without acquiring the lock, which only guards
+    the construction of instances and the updates of the service map.
     """
-    def __init__(self, service_constructors: Dict[str, ServiceConstructor] = None):
+    def __init__(self, service_constructors: Dict[str, ServiceConstructor] = None,
+                 read_optimized: bool = False):
         self.service_map: Dict[str, Service] = {}
         self.mutex = threading.RLock()
+        self.revision = 0
+        self.read_optimized = read_optimized
+        self._instances: Dict[str, Any] = {}
         if service_constructors:
             self.update(service_constructors)
 
@@ -52,6 +63,10 @@ class Container:
         with self.mutex:
             for service_name, constructor in service_constructors.items():
                 self.service_map[service_name] = Service(constructor)
+            if self.read_optimized:
+                self._instances = {name: instance for name, instance in self._instances.items()
+                                   if name not in service_constructors}
+            self.revision += 1
 
     def _get(self, service_name: str) -> Any:
         """
@@ -66,11 +81,18 @@ class Container:
         if service.instance is None:
             service.instance = service.constructor(self.get)
             self.service_map[service_name] = service
+            if self.read_optimized and service.instance is not None:
+                self._instances = {**self._instances, service_name: service.instance}
         return service.instance
 
     def get(self, service_name: str) -> Any:
         """
-        get wraps _get to make it thread-safe.
+        get wraps _get to make it thread-safe. In read-optimized mode, the instances already
+        constructed are returned from the snapshot without acquiring the lock.
         """
+        if self.read_optimized:
+            instance = self._instances.get(service_name)
+            if instance is not None:
+                return instance
         with self.mutex:
             return self._get(service_name)
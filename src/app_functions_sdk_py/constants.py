@@ -54,3 +54,4 @@ ENV_KEY_CONFIG_FILE = "EDGEX_CONFIG_FILE"
 ENV_KEY_FILE_URI_TIMEOUT = "EDGEX_FILE_URI_TIMEOUT"
 ENV_KEY_REMOTE_SERVICE_HOSTS = "EDGEX_REMOTE_SERVICE_HOSTS"
 ENV_KEY_EDGEX_MSG_BASE64_PAYLOAD = "EDGEX_MSG_BASE64_PAYLOAD"
+ENV_KEY_JSON_ENCODER = "EDGEX_JSON_ENCODER"
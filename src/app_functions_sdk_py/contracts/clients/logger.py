@@ -11,6 +11,8 @@ function to get a logger instance.
 Classes:
     Logger: An abstract base class that defines the interface for a logger.
     EdgeXLogger: An implementation of the Logger interface.
+    AsyncLogSink: A bounded queue of log records formatted and written in batches by a
+    background thread.
 
 Methods within the Logger class:
     trace(self, msg, *args, **kwargs): Abstract method for logging trace level messages.
@@ -18,6 +20,9 @@ Methods within the Logger class:
     info(self, msg, *args, **kwargs): Abstract method for logging info level messages.
     warn(self, msg, *args, **kwargs): Abstract method for logging warn level messages.
     error(self, msg, *args, **kwargs): Abstract method for logging error level messages.
+    is_enabled_for(self, level: int) -> bool: Tells whether messages of the level are logged, True
+    unless overridden.
+    is_debug_enabled(self) -> bool: Tells whether debug level messages are logged.
 
 Methods within the EdgeXLogger class:
     __init__(self, service_key: str, level=INFO): Initializes the EdgeXLogger instance.
@@ -26,13 +31,25 @@ Methods within the EdgeXLogger class:
     info(self, msg, *args, **kwargs): Implementation of info method.
     warn(self, msg, *args, **kwargs): Implementation of warn method.
     error(self, msg, *args, **kwargs): Implementation of error method.
+    is_enabled_for(self, level: int) -> bool: Implementation of is_enabled_for method, comparing
+    the level to the cached level of the logger.
+    start_async(self, queue_size: int, batch_size: int) -> AsyncLogSink: Switches to queue-based
+    logging.
+    stop_async(self, timeout: float): Flushes the queued records and switches back to synchronous
+    logging.
 
 Functions:
     get_logger(service_key: str, level=INFO) -> Logger: Function to get a logger instance.
 """
 
 import logging
+import logging.handlers
+import queue
+import threading
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from pyformance import meters
 
 
 class Logger(ABC):
@@ -76,6 +93,21 @@ class Logger(ABC):
         Abstract method for setting the log level.
         """
 
+    def is_enabled_for(self, level: int) -> bool:  # pylint: disable=unused-argument
+        """
+        Tells whether the messages of the level are logged, so that callers can skip building the
+        arguments of messages which would be discarded. Assumes every level is logged unless
+        overridden, so that the existing Logger implementations keep working.
+        """
+        return True
+
+    def is_debug_enabled(self) -> bool:
+        """
+        Tells whether debug level messages are logged, guarding the debug messages whose
+        arguments are expensive to compute.
+        """
+        return self.is_enabled_for(DEBUG)
+
 
 # Define the logging levels to be compatible with edgexfoundry logging level
 TRACE = 5
@@ -95,6 +127,105 @@ VALID_LEVELS = {
 # Add a new logging level named TRACE
 logging.addLevelName(TRACE, "TRACE")
 
+DEFAULT_LOG_QUEUE_SIZE = 8192
+DEFAULT_LOG_BATCH_SIZE = 256
+LOG_SINK_THREAD_NAME = "edgex-log-sink"
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler which counts rather than reports the records dropped when the queue is full, and
+    which leaves the formatting of the records to the thread of the sink.
+    """
+
+    def __init__(self, records: queue.Queue, dropped: meters.Counter):
+        super().__init__(records)
+        self.dropped = dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped.inc()
+
+
+class AsyncLogSink:  # pylint: disable=too-few-public-methods
+    """
+    AsyncLogSink decouples the logging threads from the output of the records. The records are
+    put on a bounded queue, without blocking, by the queue_handler and a background thread formats
+    and writes them with the target handler in batches of up to batch_size records, taking the
+    handler lock and flushing its stream once per batch. The records arriving while the queue is
+    full are dropped and counted.
+
+    Attributes:
+        queue_handler (logging.Handler): The handler to add to the loggers in place of the target.
+        dropped (meters.Counter): Number of records dropped because the queue was full.
+    """
+
+    _STOP = object()
+
+    def __init__(self, target: logging.StreamHandler, queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_LOG_BATCH_SIZE):
+        self._target = target
+        self._records = queue.Queue(maxsize=queue_size if queue_size > 0
+                                    else DEFAULT_LOG_QUEUE_SIZE)
+        self._batch_size = batch_size if batch_size > 0 else DEFAULT_LOG_BATCH_SIZE
+        self.dropped = meters.Counter("")
+        self.queue_handler = _DroppingQueueHandler(self._records, self.dropped)
+        self._thread = threading.Thread(target=self._run, name=LOG_SINK_THREAD_NAME, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            batch = []
+            record = self._records.get()
+            while True:
+                if record is self._STOP:
+                    stopped = True
+                    break
+                batch.append(record)
+                if len(batch) == self._batch_size:
+                    break
+                try:
+                    record = self._records.get_nowait()
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch: list):
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self._target.format(record))
+            except Exception:  # pylint: disable=broad-except
+                self._target.handleError(record)
+        if not lines:
+            return
+        with self._target.lock:
+            try:
+                self._target.stream.write(self._target.terminator.join(lines) +
+                                          self._target.terminator)
+                self._target.flush()
+            except Exception:  # pylint: disable=broad-except
+                self._target.handleError(batch[-1])
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        stop writes the records already queued and waits up to timeout seconds for the background
+        thread to exit. Records logged afterwards are dropped.
+        """
+        if not self._thread.is_alive():
+            return
+        try:
+            self._records.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
 
 class EdgeXLogger(Logger):
     """
@@ -118,23 +249,29 @@ class EdgeXLogger(Logger):
         self.service_key = service_key
         self.logger = logging.getLogger(service_key)
         self.logger.setLevel(level)
+        # cached so that the messages of disabled levels are discarded without calling logging
+        self._level = level
         handler = logging.StreamHandler()
         formatter = logging.Formatter(f"level=%(levelname)s ts=%(asctime)s app={self.service_key} "
                                       f"source=%(filename)s:%(lineno)d msg=%(message)s")
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        self._handler = handler
+        self._sink = None
 
     def trace(self, msg, *args, **kwargs):
         """
         Implementation of trace method.
         """
-        self.logger.log(TRACE, msg, *args, **kwargs)
+        if self._level <= TRACE:
+            self.logger.log(TRACE, msg, *args, **kwargs)
 
     def debug(self, msg, *args, **kwargs):
         """
         Implementation of debug method.
         """
-        self.logger.debug(msg, *args, **kwargs)
+        if self._level <= DEBUG:
+            self.logger.debug(msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
         """
@@ -162,6 +299,38 @@ class EdgeXLogger(Logger):
             raise ValueError(f"Unsupported log level: {level_name}. Supported levels are: "
                              f"{VALID_LEVELS.keys()}")
         self.logger.setLevel(VALID_LEVELS[level_name])
+        self._level = VALID_LEVELS[level_name]
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Implementation of is_enabled_for method.
+        """
+        return level >= self._level
+
+    def start_async(self, queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+                    batch_size: int = DEFAULT_LOG_BATCH_SIZE) -> AsyncLogSink:
+        """
+        Switch to queue-based logging, the records being written by the background thread of an
+        AsyncLogSink rather than by the logging threads. Returns the sink, whose dropped counter
+        reports the records dropped while its queue was full.
+        """
+        if self._sink is None:
+            self._sink = AsyncLogSink(self._handler, queue_size, batch_size)
+            self.logger.addHandler(self._sink.queue_handler)
+            self.logger.removeHandler(self._handler)
+        return self._sink
+
+    def stop_async(self, timeout: Optional[float] = None):
+        """
+        Flush the records queued by the AsyncLogSink, if started, and switch back to writing the
+        records synchronously.
+        """
+        sink, self._sink = self._sink, None
+        if sink is None:
+            return
+        self.logger.addHandler(self._handler)
+        self.logger.removeHandler(sink.queue_handler)
+        sink.stop(timeout)
 
 
 def get_logger(service_key: str, level=INFO) -> Logger:
@@ -23,6 +23,8 @@ Functions:
 import urllib.parse
 from typing import Any
 
+from ....utils.serialize import to_jsonable
+
 
 def url_encode(s: str) -> str:
     """
@@ -86,13 +88,7 @@ def convert_any_to_dict(obj: Any) -> dict[Any, dict[str, Any]] | list[dict[str,
     Returns:
         Dict[str, Any]: A dictionary representation of the input object.
     """
-    if isinstance(obj, dict):
-        return {k: convert_any_to_dict(v) for k, v in obj.items()}
-    if hasattr(obj, '__dict__'):
-        return {k: convert_any_to_dict(v) for k, v in obj.__dict__.items()}
-    if isinstance(obj, list):
-        return [convert_any_to_dict(e) for e in obj]
-    return obj
+    return to_jsonable(obj)
 
 
 class PathBuilder:
@@ -35,6 +35,9 @@ class StoredObject:
     payload: Any = None
     # contextData is a snapshot of data used by the pipeline at runtime
     contextData: dict = field(default_factory=dict)
+    # nextRetryAt is when this is due to be retried, in milliseconds since the epoch, 0 when due
+    # on the next retry
+    nextRetryAt: int = 0
 
     def validate_contract(self, id_required: bool) -> Optional[errors.EdgeX]:
         """ validate_contract ensures that the required fields are present on the object. """
@@ -28,7 +28,8 @@ def new_app_service(service_key: str, target_type: Any = None) -> (ApplicationSe
 
     Args:
         service_key (str): The service key for the new service.
-        target_type (Any): The target type for the new service.
+        target_type (Any): The target type for the new service. Either a class or zero-arg
+            factory creating new instances, or an instance which is copied for each message.
 
     Returns:
         tuple: A tuple containing the new ApplicationService instance (or None if initialization
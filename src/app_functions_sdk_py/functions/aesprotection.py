@@ -37,7 +37,7 @@ class AESProtection:
                 errors.ErrKind.SERVER_ERROR,
                 f"function Encrypt in pipeline '{ctx.pipeline_id()}': No Data Received")
 
-        ctx.logger().debug(f"Encrypting with AES256 in pipeline '{ctx.pipeline_id()}'")
+        ctx.logger().debug("Encrypting with AES256 in pipeline '%s'", ctx.pipeline_id())
 
         byte_data, err = coerce_type(data)
         if err is not None:
@@ -86,7 +86,7 @@ class AESProtection:
                 errors.ErrKind.SERVER_ERROR,
                 f"function Encrypt in pipeline '{ctx.pipeline_id()}': No Data Received")
 
-        ctx.logger().debug(f"Encrypting with AES256 in pipeline '{ctx.pipeline_id()}'")
+        ctx.logger().debug("Encrypting with AES256 in pipeline '%s'", ctx.pipeline_id())
 
         byte_data, err = coerce_type(data)
         if err is not None:
@@ -5,7 +5,8 @@
 This module provides the classes and functions for AppFunctionContext
 """
 import re
-from typing import Tuple, Any
+import weakref
+from typing import Tuple, Any, Callable, NamedTuple, Optional
 
 from ..bootstrap.container.clients import event_client_from, reading_client_from, \
     command_client_from, device_service_client_from, device_profile_client_from, device_client_from
@@ -32,35 +33,118 @@ from ..interfaces import AppFunctionContext
 from ..interfaces.messaging import new_message_envelope
 
 
-# pylint: disable=too-many-public-methods
-class Context(AppFunctionContext):
-    """ AppFunctionContext implementation. """
+_VALUE_PLACEHOLDER_SPEC = re.compile("{[^}]*}")
+
+
+class _ResolvedServices(NamedTuple):
+    """ The services resolved from a revision of a Container, None until first used. """
+    revision: Any
+    logger: Optional[Logger] = None
+    secret_provider: Optional[SecretProvider] = None
+    metrics_manager: Optional[MetricsManager] = None
+
+
+class ContextServices:
+    """
+    ContextServices holds the logger, secret provider and metrics manager of a Container, each
+    resolved once on first use rather than on every call, so that all the contexts created from
+    the Container share them by reference. The services are resolved again once the Container
+    has been updated.
+
+    The revision and the services resolved from it are held in a single immutable tuple, which
+    is replaced rather than modified, so that concurrent callers never observe a service reset
+    by another caller.
+    """
+    __slots__ = ("_dic", "_resolved")
 
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, correlation_id: str, dic: Container, input_content_type: str):
+    def __init__(self, dic: Container):
+        self._dic = dic
+        self._resolved = _ResolvedServices(getattr(dic, "revision", None))
+
+    def _service(self, name: str, resolve: Callable[[Callable], Any]) -> Any:
+        resolved = self._resolved
+        revision = getattr(self._dic, "revision", None)
+        if resolved.revision != revision:
+            resolved = _ResolvedServices(revision)
+        service = getattr(resolved, name)
+        if service is None:
+            service = resolve(self._dic.get)
+            self._resolved = resolved._replace(**{name: service})
+        return service
+
+    def logger(self) -> Logger:
+        """ Returns the logger. """
+        return self._service("logger", logging_client_from)
+
+    def secret_provider(self) -> SecretProvider:
+        """ Returns the secret_provider. """
+        return self._service("secret_provider", secret_provider_from)
+
+    def metrics_manager(self) -> MetricsManager:
+        """ Returns the metrics manager. """
+        return self._service("metrics_manager", metrics_manager_from)
+
+
+_services_by_dic: "weakref.WeakKeyDictionary[Container, ContextServices]" = \
+    weakref.WeakKeyDictionary()
+
+
+def context_services_from(dic: Container) -> ContextServices:
+    """
+    context_services_from returns the ContextServices shared by the contexts of the Container.
+    """
+    try:
+        services = _services_by_dic.get(dic)
+        if services is None:
+            services = _services_by_dic.setdefault(dic, ContextServices(dic))
+    except TypeError:
+        # the container can't be weakly referenced, e.g. None, so its services aren't shared
+        services = ContextServices(dic)
+    return services
+
+
+# pylint: disable=too-many-public-methods
+class Context(AppFunctionContext):  # pylint: disable=too-many-instance-attributes
+    """
+    AppFunctionContext implementation. The context values are copied on write, so that clones
+    share the values of their context until either side modifies them.
+    """
+    __slots__ = ("_correlation_id", "_dic", "_services", "_input_content_type",
+                 "_response_data", "_response_content_type", "_retry_data", "trigger_retry",
+                 "_context_data", "_context_data_shared")
+
+    def __init__(self, correlation_id: str, dic: Container, input_content_type: str,
+                 services: ContextServices = None):
         self._correlation_id = correlation_id
         self._dic = dic
+        self._services = services if services is not None else context_services_from(dic)
         self._input_content_type = input_content_type
         self._response_data = None
         self._response_content_type = None
         self._retry_data = bytes()
         self.trigger_retry = False
         self._context_data = {}
-        self._value_placeholder_spec = re.compile("{[^}]*}")
+        self._context_data_shared = False
 
     # pylint: disable=protected-access
     def clone(self) -> AppFunctionContext:
         """ Clones the context. """
-        ctx_data_copy = {}
-        for key, value in self._context_data.items():
-            ctx_data_copy[key] = value
-        clone_ctx = Context(self._correlation_id, self._dic, self._input_content_type)
+        clone_ctx = Context(self._correlation_id, self._dic, self._input_content_type,
+                            self._services)
         clone_ctx._response_data = self._response_data
         clone_ctx._response_content_type = self._response_content_type
         clone_ctx._retry_data = self._retry_data
-        clone_ctx._context_data = ctx_data_copy
+        clone_ctx._context_data = self._context_data
+        clone_ctx._context_data_shared = True
+        self._context_data_shared = True
         return clone_ctx
 
+    def _writable_context_data(self) -> dict:
+        if self._context_data_shared:
+            self._context_data = self._context_data.copy()
+            self._context_data_shared = False
+        return self._context_data
+
     def set_correlation_id(self, correlation_id: str):
         """ Sets the correlation_id. """
         self._correlation_id = correlation_id
@@ -118,11 +202,11 @@ class Context(AppFunctionContext):
 
     def secret_provider(self) -> SecretProvider:
         """ Returns the secret_provider. """
-        return secret_provider_from(self._dic.get)
+        return self._services.secret_provider()
 
     def logger(self) -> Logger:
         """ Returns the logger. """
-        return logging_client_from(self._dic.get)
+        return self._services.logger()
 
     def pipeline_id(self) -> str:
         pipelineid, exists = self.get_value(KEY_PIPELINEID)
@@ -131,10 +215,13 @@ class Context(AppFunctionContext):
         return ""
 
     def add_value(self, key: str, value: str):
-        self._context_data[key.lower()] = value
+        self._writable_context_data()[key.lower()] = value
 
     def remove_value(self, key: str):
-        del self._context_data[key.lower()]
+        key = key.lower()
+        if key not in self._context_data:
+            raise KeyError(key)
+        del self._writable_context_data()[key]
 
     def get_value(self, key: str) -> Tuple[str, bool]:
         if key in self._context_data:
@@ -148,7 +235,7 @@ class Context(AppFunctionContext):
         attempts = {}
         result = str_format
 
-        targets = self._value_placeholder_spec.findall(str_format)
+        targets = _VALUE_PLACEHOLDER_SPEC.findall(str_format)
 
         for placeholder in targets:
             if placeholder in attempts:
@@ -254,4 +341,4 @@ class Context(AppFunctionContext):
         """
         Return the Metrics Manager used to register counter, gauge, gaugeFloat64 or timer metrics.
         """
-        return metrics_manager_from(self._dic.get)
+        return self._services.metrics_manager()
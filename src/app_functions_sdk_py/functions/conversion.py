@@ -3,14 +3,13 @@
 """
 This module provides the classes and functions for Conversion
 """
-import json
 from typing import Any, Tuple
 
 from ..contracts import errors
-from ..contracts.clients.utils.common import convert_any_to_dict
 from ..contracts.common.constants import CONTENT_TYPE_XML, CONTENT_TYPE_JSON
 from ..contracts.dtos.event import Event
 from ..interfaces import AppFunctionContext
+from ..utils.serialize import encode_json
 
 TRANSFORM_TYPE = "type"
 TRANSFORM_XML = "xml"
@@ -59,7 +58,7 @@ class Conversion:
 
         if isinstance(data, Event):
             try:
-                b = json.dumps(convert_any_to_dict(data)).encode('utf-8')
+                b = encode_json(data)
             except TypeError as e:
                 return False, errors.new_common_edgex(
                     errors.ErrKind.SERVER_ERROR,
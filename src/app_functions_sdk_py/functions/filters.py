@@ -36,8 +36,8 @@ class Filter:
         if self.filter_out:
             mode = "Out"
 
-        lc.debug(f"Filtering {mode} by {filter_property} in. "
-                 f"FilterValues are: '[{self.filter_values}]'")
+        lc.debug("Filtering %s by %s in. FilterValues are: '[%s]'", mode, filter_property,
+                 self.filter_values)
 
         if data is None:
             raise errors.new_common_edgex(
@@ -60,25 +60,30 @@ class Filter:
         if len(self.filter_values) == 0:
             return True
 
+        lc = self.ctx.logger()
         for name in self.filter_values:
             if re.match(name, value):
                 if self.filter_out:
-                    self.ctx.logger().debug(f"Event not accepted for {filter_property}={value} "
-                                            f"in pipeline '{self.ctx.pipeline_id()}'")
+                    if lc.is_debug_enabled():
+                        lc.debug("Event not accepted for %s=%s in pipeline '%s'",
+                                 filter_property, value, self.ctx.pipeline_id())
                     return False
 
-                self.ctx.logger().debug(f"Event accepted for {filter_property}={value} "
-                                        f"in pipeline '{self.ctx.pipeline_id()}'")
+                if lc.is_debug_enabled():
+                    lc.debug("Event accepted for %s=%s in pipeline '%s'",
+                             filter_property, value, self.ctx.pipeline_id())
                 return True
 
         # Will only get here if Event's SourceName didn't match any names in FilterValues
         if self.filter_out:
-            self.ctx.logger().debug(f"Event accepted for {filter_property}={value} "
-                                    f"in pipeline {self.ctx.pipeline_id()}")
+            if lc.is_debug_enabled():
+                lc.debug("Event accepted for %s=%s in pipeline %s",
+                         filter_property, value, self.ctx.pipeline_id())
             return True
 
-        self.ctx.logger().debug(f"Event not accepted for {filter_property}={value} "
-                                f"in pipeline '{self.ctx.pipeline_id()}'")
+        if lc.is_debug_enabled():
+            lc.debug("Event not accepted for %s=%s in pipeline '%s'",
+                     filter_property, value, self.ctx.pipeline_id())
         return False
 
     def filter_by_profile_name(self,
@@ -155,9 +160,11 @@ class Filter:
             and stop the pipeline if a non-edgex event is received or if no data is received.
         """
         self.ctx = ctx
+        lc = ctx.logger()
+        debug_enabled = lc.is_debug_enabled()
         try:
             existing_event = self.setup_for_filtering(
-                "FilterByResourceName", "ResourceName", ctx.logger(), data)
+                "FilterByResourceName", "ResourceName", lc, data)
 
             # No filter values, so pass all event and all readings through,
             # rather than filtering them all out.
@@ -182,14 +189,13 @@ class Filter:
                             break
 
                     if not reading_filtered_out:
-                        ctx.logger().debug(
-                            f"Reading accepted in pipeline '{self.ctx.pipeline_id()}' "
-                            f"for resource {reading.resourceName}")
+                        if debug_enabled:
+                            lc.debug("Reading accepted in pipeline '%s' for resource %s",
+                                     self.ctx.pipeline_id(), reading.resourceName)
                         aux_event.readings.append(reading)
-                    else:
-                        ctx.logger().debug(
-                            f"Reading not accepted in pipeline '{self.ctx.pipeline_id()}' "
-                            f"for resource {reading.resourceName}")
+                    elif debug_enabled:
+                        lc.debug("Reading not accepted in pipeline '%s' for resource %s",
+                                 self.ctx.pipeline_id(), reading.resourceName)
             else:
                 for reading in existing_event.readings:
                     reading_filtered_for = False
@@ -200,26 +206,24 @@ class Filter:
                             break
 
                     if reading_filtered_for:
-                        self.ctx.logger().debug(
-                            f"Reading accepted in pipeline '{self.ctx.pipeline_id()}' "
-                            f"for resource {reading.resourceName}")
+                        if debug_enabled:
+                            lc.debug("Reading accepted in pipeline '%s' for resource %s",
+                                     self.ctx.pipeline_id(), reading.resourceName)
                         aux_event.readings.append(reading)
-                    else:
-                        self.ctx.logger().debug(
-                            f"Reading not accepted in pipeline '{self.ctx.pipeline_id()}' "
-                            f"for resource {reading.resourceName}")
+                    elif debug_enabled:
+                        lc.debug("Reading not accepted in pipeline '%s' for resource %s",
+                                 self.ctx.pipeline_id(), reading.resourceName)
 
             if len(aux_event.readings) > 0:
-                self.ctx.logger().debug(
-                    f"Event accepted: {len(aux_event.readings)} remaining reading(s) "
-                    f"in pipeline '{self.ctx.pipeline_id()}'")
+                lc.debug("Event accepted: %d remaining reading(s) in pipeline '%s'",
+                         len(aux_event.readings), self.ctx.pipeline_id())
                 return True, aux_event
 
         except errors.EdgeX as err:
             return False, err
 
-        self.ctx.logger().debug(
-            f"Event not accepted: 0 remaining readings in pipeline '{self.ctx.pipeline_id()}'")
+        self.ctx.logger().debug("Event not accepted: 0 remaining readings in pipeline '%s'",
+                                self.ctx.pipeline_id())
         return False, None
 
 
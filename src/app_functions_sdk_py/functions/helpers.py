@@ -26,7 +26,7 @@ def register_metric(ctx: AppFunctionContext, full_name_func: Callable[[], str],
 
     # Only register the metric if it hasn't been registered yet.
     if not metrics_manager.is_registered(full_name):
-        lc.debug(f"Registering metric {full_name}.")
+        lc.debug("Registering metric %s.", full_name)
         try:
             metrics_manager.register(full_name, get_metric(), tags)
         except errors.EdgeX as err:
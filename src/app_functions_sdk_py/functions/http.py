@@ -3,11 +3,18 @@
 """
 This module provides the classes and functions for HttpExport
 """
-from typing import Any, Tuple, Optional
+import asyncio
+import weakref
+from typing import Any, NamedTuple, Tuple, Optional
 from urllib.parse import urlparse
 import requests
 from pyformance import meters
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from .helpers import register_metric
 from .string_values_formatter import StringValuesFormatter, default_string_value_formatter
 from ..bootstrap.metrics.samples import UniformSample
@@ -17,6 +24,7 @@ from ..contracts.common.constants import CORRELATION_HEADER, CONTENT_TYPE_JSON
 from ..interfaces import AppFunctionContext
 from ..internal.constants import (METRICS_RESERVOIR_SIZE, HTTP_EXPORT_ERRORS_NAME,
                                   HTTP_EXPORT_SIZE_NAME)
+from ..utils.eventloop import close_with_loop
 from ..utils.helper import coerce_type
 
 EXPORT_METHOD = "method"
@@ -33,6 +41,13 @@ SECRET_VALUE_KEY = "secretvaluekey"
 HTTP_REQUEST_HEADERS = "httprequestheaders"
 
 
+class _Export(NamedTuple):
+    method: str
+    url: str
+    data: bytes
+    headers: dict
+
+
 class HTTPSender:
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-arguments
@@ -59,6 +74,7 @@ class HTTPSender:
         self.http_request_headers = http_request_headers
         self.http_error_metrics = meters.Counter("")
         self.http_size_metrics = meters.Histogram("", sample=UniformSample(METRICS_RESERVOIR_SIZE))
+        self._async_clients = weakref.WeakKeyDictionary()
 
     def set_retry_data(self, ctx: AppFunctionContext, export_data: bytes):
         """ set retry data in app function context """
@@ -99,29 +115,29 @@ class HTTPSender:
         # using secrets, all required fields are provided
         return True, None
 
-    def http_send(self, ctx: AppFunctionContext, data: Any, method: str) -> Tuple[bool, Any]:
+    def _prepare_export(self, ctx: AppFunctionContext, data: Any,
+                        method: str) -> Tuple[Optional[_Export], Optional[errors.EdgeX]]:
         # pylint: disable=too-many-locals
         # pylint: disable=too-many-return-statements
-        # pylint: disable=too-many-branches
-        """ util function to send the http request """
+        """ validates the sender and builds the request exporting the data """
         lc = ctx.logger()
 
-        lc.debug(f"HTTP Exporting in pipeline '{ctx.pipeline_id()}'")
+        lc.debug("HTTP Exporting in pipeline '%s'", ctx.pipeline_id())
 
         if data is None:
             # We didn't receive a result
-            return False, errors.new_common_edgex(
+            return None, errors.new_common_edgex(
                 errors.ErrKind.CONTRACT_INVALID,
                 f"function HTTP{method} in pipeline '{ctx.pipeline_id()}': No Data Received")
 
         if self.persist_on_error and self.continue_on_send_error:
-            return False, errors.new_common_edgex(
+            return None, errors.new_common_edgex(
                 errors.ErrKind.CONTRACT_INVALID,
                 f"in pipeline '{ctx.pipeline_id()}' persist_on_error & "
                 f"continue_on_send_error can not both be set to true for HTTP Export")
 
         if self.continue_on_send_error and not self.return_input_data:
-            return False, errors.new_common_edgex(
+            return None, errors.new_common_edgex(
                 errors.ErrKind.CONTRACT_INVALID,
                 f"in pipeline '{ctx.pipeline_id()}' continueOnSendError "
                 f"can only be used in conjunction returnInputData for multiple HTTP Export")
@@ -131,18 +147,18 @@ class HTTPSender:
 
         export_data, error = coerce_type(data)
         if error is not None:
-            return False, errors.new_common_edgex_wrapper(error)
+            return None, errors.new_common_edgex_wrapper(error)
 
         using_secrets, error = self.determine_if_using_secrets(ctx)
         if error is not None:
-            return False, errors.new_common_edgex_wrapper(error)
+            return None, errors.new_common_edgex_wrapper(error)
 
         formatted_url = self.url_formatter(self.url, ctx, data)
 
         try:
             parsed_url = urlparse(formatted_url)
         except TypeError as e:
-            return False, errors.new_common_edgex(
+            return None, errors.new_common_edgex(
                 errors.ErrKind.CONTRACT_INVALID,
                 f"failed to parse the formatted url '{formatted_url}'", e)
 
@@ -153,75 +169,137 @@ class HTTPSender:
                         lambda: self.http_size_metrics,
                         {"url": parsed_url.geturl()})
 
-        req = requests.Request(method, parsed_url.geturl(), data=export_data)
+        headers = {}
 
         the_secrets = {}
         if using_secrets:
             # TODO will use the secret store at milestone E  # pylint: disable=fixme
             # the_secrets = ctx.SecretProvider().GetSecret(sender.secretName, sender.secretValueKey)
 
-            lc.debug(
-                (f"Setting HTTP Header '{self.http_header_name}' with secret value "
-                 f"from SecretStore at secretName='{self.secret_name}' "
-                 f"& secretValueKey='{self.secret_value_key}' "
-                 f"in pipeline '{ctx.pipeline_id()}'"))
+            lc.debug("Setting HTTP Header '%s' with secret value from SecretStore at "
+                     "secretName='%s' & secretValueKey='%s' in pipeline '%s'",
+                     self.http_header_name, self.secret_name, self.secret_value_key,
+                     ctx.pipeline_id())
 
-            req.headers[self.http_header_name] = the_secrets[self.secret_value_key]
+            headers[self.http_header_name] = the_secrets[self.secret_value_key]
 
-        req.headers["Content-Type"] = self.mime_type
+        headers["Content-Type"] = self.mime_type
 
         # Set all the http request headers
         for key, element in self.http_request_headers.items():
-            req.headers[key] = element
+            headers[key] = element
+
+        if lc.is_debug_enabled():
+            lc.debug("POSTing data to %s %s in pipeline '%s'", parsed_url.geturl(),
+                     parsed_url.path, ctx.pipeline_id())
+
+        return _Export(method, parsed_url.geturl(), export_data, headers), None
+
+    def _export_succeeded(self, ctx: AppFunctionContext, data: Any, export_data: bytes,
+                          status_code: int, content: bytes) -> Tuple[bool, Any]:
+        lc = ctx.logger()
+
+        # Data successfully sent, so retry any failed data,
+        # if Store and Forward enabled and data has been saved
+        if self.persist_on_error:
+            ctx.trigger_retry_failed_data()
+
+        # capture the size into metrics
+        export_data_bytes = len(export_data)
+        self.http_size_metrics.add(export_data_bytes)
+
+        if lc.is_debug_enabled():
+            lc.debug("Sent %d bytes of data in pipeline '%s'. Response status is %s",
+                     export_data_bytes, ctx.pipeline_id(), status_code)
+            lc.trace("Data exported for pipeline '%s' (%s=%s)", ctx.pipeline_id(),
+                     CORRELATION_HEADER, ctx.correlation_id())
+
+        # This allows multiple HTTP Exports to be chained in the pipeline
+        # to send the same data to different destinations
+        # Don't need to read response data since not going to return it so just return now.
+        if self.return_input_data:
+            return True, data
+
+        return True, content
+
+    def _export_failed(self, ctx: AppFunctionContext, data: Any, export_data: bytes,
+                       e: Exception) -> Tuple[bool, Any]:
+        self.http_error_metrics.inc(1)
+
+        # Continuing pipeline on error
+        # This is in support of sending to multiple export destinations
+        # by chaining export functions in the pipeline.
+        ctx.logger().error(
+            f"Continuing pipeline on error in pipeline '{ctx.pipeline_id()}': {e}")
+
+        # If continuing on send error then can't be persisting on error since Store
+        # and Forward retries starting with the function that failed and
+        # stopped the execution of the pipeline.
+        if not self.continue_on_send_error:
+            self.set_retry_data(ctx, export_data)
+            return False, errors.new_common_edgex_wrapper(e)
+
+        # Return input data since must have some data for the next function to operate on.
+        return True, data
+
+    def http_send(self, ctx: AppFunctionContext, data: Any, method: str) -> Tuple[bool, Any]:
+        """ util function to send the http request """
+        export, error = self._prepare_export(ctx, data, method)
+        if error is not None:
+            return False, error
 
-        lc.debug(f"POSTing data to {parsed_url.geturl()} {parsed_url.path} "
-                 f"in pipeline '{ctx.pipeline_id()}'")
+        req = requests.Request(method, export.url, data=export.data, headers=export.headers)
 
         with requests.Session() as s:
             try:
                 response = s.send(req.prepare())
                 response.raise_for_status()
-
-                # Data successfully sent, so retry any failed data,
-                # if Store and Forward enabled and data has been saved
-                if self.persist_on_error:
-                    ctx.trigger_retry_failed_data()
-
-                # capture the size into metrics
-                export_data_bytes = len(export_data)
-                self.http_size_metrics.add(export_data_bytes)
-
-                lc.debug(
-                    f"Sent {export_data_bytes} bytes of data "
-                    f"in pipeline '{ctx.pipeline_id()}'. Response status is {response.status_code}")
-                lc.trace(
-                    f"Data exported for pipeline "
-                    f"'{ctx.pipeline_id()}' ({CORRELATION_HEADER}={ctx.correlation_id()})")
-
-                # This allows multiple HTTP Exports to be chained in the pipeline
-                # to send the same data to different destinations
-                # Don't need to read response data since not going to return it so just return now.
-                if self.return_input_data:
-                    return True, data
-
-                return True, response.content
+                return self._export_succeeded(ctx, data, export.data, response.status_code,
+                                              response.content)
             except Exception as e:  # pylint: disable=broad-exception-caught
-                self.http_error_metrics.inc(1)
+                return self._export_failed(ctx, data, export.data, e)
 
-                # Continuing pipeline on error
-                # This is in support of sending to multiple export destinations
-                # by chaining export functions in the pipeline.
-                lc.error(f"Continuing pipeline on error in pipeline '{ctx.pipeline_id()}': {e}")
-
-                # If continuing on send error then can't be persisting on error since Store
-                # and Forward retries starting with the function that failed and
-                # stopped the execution of the pipeline.
-                if not self.continue_on_send_error:
-                    self.set_retry_data(ctx, export_data)
-                    return False, errors.new_common_edgex_wrapper(e)
+    async def http_send_async(self, ctx: AppFunctionContext, data: Any,
+                              method: str) -> Tuple[bool, Any]:
+        """
+        util function to send the http request without blocking the event loop. The request is
+        sent by httpx when installed, with the connections pooled per event loop, or else by
+        requests on a worker thread.
+        """
+        export, error = self._prepare_export(ctx, data, method)
+        if error is not None:
+            return False, error
 
-                # Return input data since must have some data for the next function to operate on.
-                return True, data
+        try:
+            if httpx is None:
+                response = await asyncio.to_thread(self._send_export, export)
+            else:
+                response = await self._async_client().request(
+                    export.method, export.url, content=export.data, headers=export.headers)
+            response.raise_for_status()
+            return self._export_succeeded(ctx, data, export.data, response.status_code,
+                                          response.content)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return self._export_failed(ctx, data, export.data, e)
+
+    @staticmethod
+    def _send_export(export: _Export) -> requests.Response:
+        with requests.Session() as s:
+            return s.send(requests.Request(export.method, export.url, data=export.data,
+                                           headers=export.headers).prepare())
+
+    def _async_client(self) -> "httpx.AsyncClient":
+        # an AsyncClient is bound to the event loop it is first used on
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # no timeout nor connection limit, like the requests used by http_send; the number
+            # of exports in flight is bounded by the runtime
+            client = httpx.AsyncClient(timeout=None, limits=httpx.Limits(max_connections=None))
+            self._async_clients[loop] = client
+            # closed along with the connections it pools when the runtime stops the loop
+            close_with_loop(client.aclose)
+        return client
 
     def set_http_request_headers(self, http_request_headers: dict):
         """ SetHttpRequestHeaders will set all the header parameters for the http request """
@@ -242,6 +320,20 @@ class HTTPSender:
         An empty string for the mimetype will default to application/json. """
         return self.http_send(ctx, data, HTTPMethod.PUT.value)
 
+    async def http_post_async(self, ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        """
+        http_post_async is the AsyncAppFunction variant of http_post, which awaits the response
+        instead of blocking a thread while the request is in flight.
+        """
+        return await self.http_send_async(ctx, data, HTTPMethod.POST.value)
+
+    async def http_put_async(self, ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        """
+        http_put_async is the AsyncAppFunction variant of http_put, which awaits the response
+        instead of blocking a thread while the request is in flight.
+        """
+        return await self.http_send_async(ctx, data, HTTPMethod.PUT.value)
+
 
 class HTTPSenderOptions:
     # pylint: disable=too-many-arguments
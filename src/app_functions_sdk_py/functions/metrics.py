@@ -21,7 +21,7 @@ class MetricsProcessor:
         """ to_line_protocol transforms a Metric DTO to a string conforming to Line Protocol syntax
          which is most commonly used with InfluxDB. For more information on Line Protocol
         see: https://docs.influxdata.com/influxdb/v2.0/reference/syntax/line-protocol/ """
-        ctx.logger().debug(f"ToLineProtocol called in pipeline '{ctx.pipeline_id()}'")
+        ctx.logger().debug("ToLineProtocol called in pipeline '%s'", ctx.pipeline_id())
 
         if data is None:
             return False, errors.new_common_edgex(
@@ -41,7 +41,7 @@ class MetricsProcessor:
         # and sent in chunks to service like InfluxDB
         result = str(data.to_line_protocol())
 
-        ctx.logger().debug(f"Transformed Metric to '{result}' in pipeline '{ctx.pipeline_id()}'")
+        ctx.logger().debug("Transformed Metric to '%s' in pipeline '%s'", result, ctx.pipeline_id())
 
         return True, result
 
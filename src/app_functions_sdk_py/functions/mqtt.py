@@ -3,6 +3,7 @@
 """
 This module provides the classes and functions for MQTTExport
 """
+import asyncio
 import threading
 import time
 from datetime import datetime
@@ -144,7 +145,7 @@ class MQTTSender:
         """
         lc = ctx.logger()
 
-        lc.debug(f"MQTT Exporting in pipeline '{ctx.pipeline_id()}'")
+        lc.debug("MQTT Exporting in pipeline '%s'", ctx.pipeline_id())
 
         if data is None:
             # not receive a result
@@ -198,13 +199,25 @@ class MQTTSender:
 
         self.mqtt_size_metrics.add(len(export_data))
 
-        lc.debug(f"Sent {len(export_data)} bytes of data to MQTT Broker in pipeline "
-                 f"'{ctx.pipeline_id()}' to topic '{publish_topic}'")
-        lc.trace(f"Data exported to MQTT Broker in pipeline '{ctx.pipeline_id()}': "
-                 f"{CORRELATION_HEADER}={ctx.correlation_id()}")
+        if lc.is_debug_enabled():
+            lc.debug("Sent %d bytes of data to MQTT Broker in pipeline '%s' to topic '%s'",
+                     len(export_data), ctx.pipeline_id(), publish_topic)
+            lc.trace("Data exported to MQTT Broker in pipeline '%s': %s=%s", ctx.pipeline_id(),
+                     CORRELATION_HEADER, ctx.correlation_id())
 
         return True, None
 
+    async def mqtt_send_async(self, ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        """
+        mqtt_send_async is the AsyncAppFunction variant of mqtt_send. Publishing only queues the
+        message for the network loop of the client, so it is done on the event loop, whereas
+        initializing the client and connecting to the broker block and are run on a worker thread.
+        """
+        if self._client is None or not self._client.is_connected() or \
+                self.secrets_last_retrieved < ctx.secret_provider().secrets_last_updated():
+            return await asyncio.to_thread(self.mqtt_send, ctx, data)
+        return self.mqtt_send(ctx, data)
+
 
 def new_mqtt_sender(mqtt_config: MQTTClientConfig,
                     topic_formatter: StringValuesFormatter = default_string_value_formatter,
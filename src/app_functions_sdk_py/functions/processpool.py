@@ -0,0 +1,235 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the classes and functions to execute a segment of a function pipeline in a
+pool of worker processes, so that CPU-bound functions such as encryption, compression or model
+scoring run in parallel instead of contending for the GIL.
+
+A segment is marked by wrapping one or more contiguous AppFunctions into a ProcessPoolStage:
+
+    pipeline = (filter.filter_by_device_name,
+                new_process_pool_stage(compression.compress_with_gzip, aes.encrypt,
+                                       secret_names=["aes"]),
+                sender.http_post)
+
+The runtime sends the functions, their input data and a picklable snapshot of the context to a
+worker process, executes the functions there in sequence and merges the resulting context back,
+so the rest of the pipeline observes the same result as if the functions had run in-process.
+
+Within a worker process the context provides the logger and the values, response data and
+retry data of the snapshot. The secrets named by secret_names are retrieved before the stage is
+submitted and served by the context's secret provider; the other services, such as the clients,
+the metrics manager or publishing to the MessageBus, are not available. The functions, their
+input data and their result must be picklable.
+
+Store and Forward retries restart at the beginning of the stage, so export functions, which are
+I/O-bound anyway, should be placed after the stage rather than in it.
+"""
+
+import pickle
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+
+from .context import Context
+from ..bootstrap.container.logging import LoggingClientInterfaceName
+from ..bootstrap.container.secret import SecretProviderName
+from ..bootstrap.di.container import Container
+from ..bootstrap.interface.secret import SecretProvider
+from ..contracts import errors
+from ..contracts.clients.logger import EdgeXLogger, Logger, INFO
+from ..interfaces import AppFunction, AppFunctionContext
+from ..utils.helper import function_name
+
+DEFAULT_WORKER_SERVICE_KEY = "app-service-worker"
+
+
+class ContextSnapshot:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    ContextSnapshot is the picklable state of an AppFunctionContext exchanged with the worker
+    processes.
+    """
+    __slots__ = ("correlation_id", "input_content_type", "response_data",
+                 "response_content_type", "retry_data", "trigger_retry", "values", "secrets")
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(self, correlation_id: str, input_content_type: str, response_data: Any,
+                 response_content_type: Optional[str], retry_data: Any, trigger_retry: bool,
+                 values: dict, secrets: Optional[dict] = None):
+        self.correlation_id = correlation_id
+        self.input_content_type = input_content_type
+        self.response_data = response_data
+        self.response_content_type = response_content_type
+        self.retry_data = retry_data
+        self.trigger_retry = trigger_retry
+        self.values = values
+        self.secrets = secrets if secrets is not None else {}
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def snapshot_context(ctx: AppFunctionContext, secrets: Optional[dict] = None) -> ContextSnapshot:
+    """
+    snapshot_context captures the state of the context which is visible to the functions of a
+    ProcessPoolStage.
+    """
+    is_retry_triggered = getattr(ctx, "is_retry_triggered", None)
+    return ContextSnapshot(ctx.correlation_id(), ctx.input_content_type(), ctx.response_data(),
+                           ctx.response_content_type(), ctx.retry_data(),
+                           is_retry_triggered() if is_retry_triggered is not None else False,
+                           dict(ctx.get_values()), secrets)
+
+
+def restore_context(ctx: AppFunctionContext, snapshot: ContextSnapshot):
+    """
+    restore_context applies the state captured by the snapshot to the context, including the
+    values added or removed by the functions of a ProcessPoolStage.
+    """
+    ctx.set_correlation_id(snapshot.correlation_id)
+    ctx.set_input_content_type(snapshot.input_content_type)
+    ctx.set_response_data(snapshot.response_data)
+    ctx.set_response_content_type(snapshot.response_content_type)
+    ctx.set_retry_data(snapshot.retry_data)
+    if snapshot.trigger_retry:
+        ctx.trigger_retry_failed_data()
+    for key in list(ctx.get_values()):
+        if key not in snapshot.values:
+            ctx.remove_value(key)
+    for key, value in snapshot.values.items():
+        ctx.add_value(key, value)
+
+
+class ProcessPoolStage:
+    """
+    ProcessPoolStage marks a contiguous segment of a function pipeline to be executed in the
+    runtime's pool of worker processes, sized per Writable.Pipeline.ProcessPoolSize. It is an
+    AppFunction, which executes the segment in the calling process when not run by the runtime.
+    """
+
+    def __init__(self, *transforms: AppFunction, secret_names: Iterable[str] = ()):
+        if len(transforms) == 0:
+            raise ValueError("a process pool stage requires at least one function")
+        try:
+            pickle.dumps(transforms)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(f"the functions of a process pool stage must be picklable: {e}") \
+                from e
+        self.transforms = transforms
+        self.secret_names = tuple(secret_names)
+        self.__name__ = f"ProcessPoolStage({', '.join(function_name(f) for f in transforms)})"
+
+    def __call__(self, ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        return execute_transforms(self.transforms, ctx, data)
+
+    def snapshot(self, ctx: AppFunctionContext) -> ContextSnapshot:
+        """
+        snapshot captures the state of the context along with the secrets used by the stage
+        """
+        secrets = {}
+        if self.secret_names:
+            secret_provider = ctx.secret_provider()
+            for secret_name in self.secret_names:
+                secrets[secret_name] = dict(secret_provider.get_secrets(secret_name))
+        return snapshot_context(ctx, secrets)
+
+
+def new_process_pool_stage(*transforms: AppFunction,
+                           secret_names: Iterable[str] = ()) -> ProcessPoolStage:
+    """
+    new_process_pool_stage creates a ProcessPoolStage executing the provided functions in a
+    worker process. secret_names lists the secrets the functions retrieve from the secret
+    provider.
+    """
+    return ProcessPoolStage(*transforms, secret_names=secret_names)
+
+
+def execute_transforms(transforms: Tuple[AppFunction, ...], ctx: AppFunctionContext,
+                       data: Any) -> Tuple[bool, Any]:
+    """
+    execute_transforms executes the functions in sequence as execute_pipeline does and returns
+    whether the pipeline continues along with the last result
+    """
+    result = None
+    continue_pipeline = False
+    for func in transforms:
+        # clear retry data before each individual function execution
+        ctx.set_retry_data(None)
+        if result is None:
+            continue_pipeline, result = func(ctx, data)
+        else:
+            continue_pipeline, result = func(ctx, result)
+        if not continue_pipeline:
+            break
+    return continue_pipeline, result
+
+
+class _SnapshotSecretProvider(SecretProvider):
+    """ serves the secrets retrieved for a stage before it was submitted to the worker """
+
+    def __init__(self, secrets: dict):
+        self._secrets = secrets
+
+    def store_secrets(self, secret_name: str, secrets: dict):
+        raise errors.new_common_edgex(errors.ErrKind.NOT_IMPLEMENTED,
+                                      "secrets can't be stored from a process pool stage")
+
+    def get_secrets(self, secret_name: str, *secret_keys: str) -> dict:
+        secrets = self._secrets.get(secret_name, {})
+        if not secret_keys:
+            return dict(secrets)
+        return {key: secrets[key] for key in secret_keys if key in secrets}
+
+    def secrets_last_updated(self) -> datetime:
+        return datetime.min
+
+    def list_secret_names(self) -> list[str]:
+        return list(self._secrets)
+
+    def has_secret(self, secret_name: str) -> bool:
+        return secret_name in self._secrets
+
+    def register_secret_update_callback(self, secret_name: str, callback: Any):
+        raise errors.new_common_edgex(
+            errors.ErrKind.NOT_IMPLEMENTED,
+            "secret callbacks can't be registered from a process pool stage")
+
+    def deregister_secret_update_callback(self, secret_name: str):
+        raise errors.new_common_edgex(
+            errors.ErrKind.NOT_IMPLEMENTED,
+            "secret callbacks can't be deregistered from a process pool stage")
+
+
+_worker_logger: Optional[Logger] = None  # pylint: disable=invalid-name
+
+
+def initialize_worker(service_key: str, log_level: int):
+    """
+    initialize_worker creates the logger of a worker process, it is the initializer of the
+    runtime's process pool
+    """
+    global _worker_logger  # pylint: disable=global-statement
+    _worker_logger = EdgeXLogger(service_key, log_level)
+
+
+def execute_stage(transforms: Tuple[AppFunction, ...], snapshot: ContextSnapshot,
+                  data: Any) -> Tuple[bool, Any, ContextSnapshot]:
+    """
+    execute_stage executes the functions of a stage in a worker process against a context
+    restored from the snapshot and returns their outcome along with the resulting snapshot
+    """
+    logger = _worker_logger or EdgeXLogger(DEFAULT_WORKER_SERVICE_KEY, INFO)
+    secret_provider = _SnapshotSecretProvider(snapshot.secrets)
+    dic = Container()
+    dic.update({
+        LoggingClientInterfaceName: lambda get: logger,
+        SecretProviderName: lambda get: secret_provider,
+    })
+    ctx = Context(snapshot.correlation_id, dic, snapshot.input_content_type)
+    restore_context(ctx, snapshot)
+
+    continue_pipeline, result = execute_transforms(transforms, ctx, data)
+    return continue_pipeline, result, snapshot_context(ctx)
@@ -16,8 +16,8 @@ Classes:
 import inspect
 import threading
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from typing import Callable, Tuple, List, Any, Dict, Optional
+from copy import copy
+from typing import Awaitable, Callable, Tuple, List, Any, Dict, Optional
 
 from pyformance import meters
 
@@ -60,6 +60,7 @@ class AppFunctionContext(ABC):
         secret_provider() -> SecretProvider: Gets the secret provider.
         logger() -> 'Logger': Gets the logger.
     """
+    __slots__ = ()
 
     @abstractmethod
     def clone(self) -> 'AppFunctionContext':
@@ -284,6 +285,38 @@ class AppFunctionContext(ABC):
 
 Deferred = Callable[[], None]
 AppFunction = Callable[[AppFunctionContext, Any], Tuple[bool, Any]]
+AsyncAppFunction = Callable[[AppFunctionContext, Any], Awaitable[Tuple[bool, Any]]]
+BatchAppFunction = Callable[[List[AppFunctionContext], List[Any]], List[Tuple[bool, Any]]]
+
+BATCH_APP_FUNCTION_ATTR = "__batch_app_function__"
+
+
+def is_async_app_function(func: Any) -> bool:
+    """
+    Returns True if the application function is a coroutine function, i.e. an `async def`
+    function or method, a functools.partial of one or an object with an `async def __call__`.
+    """
+    if inspect.iscoroutinefunction(func):
+        return True
+    return inspect.iscoroutinefunction(getattr(func, '__call__', None))
+
+
+def batch_app_function(func: BatchAppFunction) -> BatchAppFunction:
+    """
+    Marks the function as a BatchAppFunction, which is called once per micro-batch with the
+    contexts and the data of the messages of the batch and returns the (continue, result) tuple
+    of each message, in order. Outside of micro-batches the function is called with single
+    element lists.
+    """
+    setattr(func, BATCH_APP_FUNCTION_ATTR, True)
+    return func
+
+
+def is_batch_app_function(func: Any) -> bool:
+    """
+    Returns True if the application function is marked as a BatchAppFunction.
+    """
+    return getattr(func, BATCH_APP_FUNCTION_ATTR, False) is True
 
 
 def validate_app_function(func: AppFunction):
@@ -327,15 +360,22 @@ def calculate_pipeline_hash(*transforms: AppFunction) -> str:
 
 def payload_with_correct_content_type(envelope: MessageEnvelope) -> MessageEnvelope:
     """
-    Ensures the payload has the correct content type.
+    Ensures the payload has the correct content type. The returned envelope is a shallow copy
+    sharing the payload of the provided envelope.
     """
-    content_type = envelope.contentType.split(';')[0]
-    copy_envelope = deepcopy(envelope)
-    copy_envelope.contentType = content_type
+    copy_envelope = copy(envelope)
+    copy_envelope.contentType = normalize_content_type(envelope.contentType)
     return copy_envelope
 
 
-class FunctionPipeline:  # pylint: disable=too-few-public-methods
+def normalize_content_type(content_type: str) -> str:
+    """
+    Returns the media type of the content type without any parameter such as the charset.
+    """
+    return content_type.split(';', 1)[0]
+
+
+class FunctionPipeline:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     Represents a pipeline of functions to be executed in sequence.
 
@@ -343,6 +383,12 @@ class FunctionPipeline:  # pylint: disable=too-few-public-methods
         pipelineid (str): The unique identifier for the pipeline.
         topics (List[str]): A list of topics associated with the pipeline.
         transforms (List[AppFunction]): A list of functions to be executed in the pipeline.
+        is_async (bool): Whether any of the functions is an AsyncAppFunction, in which case the
+         pipeline is executed on the runtime's event loop.
+        plan (Any): The execution plan compiled by the runtime from the functions, reset
+         whenever the functions are set.
+        function_metrics (list): The per-function metrics registered by the runtime for the
+         functions, empty unless the per-function metrics are enabled.
     """
     def __init__(self, pipelineid: str, topics: List[str], *transforms: AppFunction):
         self.id = pipelineid
@@ -352,6 +398,18 @@ class FunctionPipeline:  # pylint: disable=too-few-public-methods
         self.message_processed = meters.Counter("")
         self.message_processing_time = meters.Timer("")
         self.processing_errors = meters.Counter("")
+        self.function_metrics = []
+
+    @property
+    def transforms(self) -> Tuple[AppFunction, ...]:
+        """ Returns the functions executed in sequence by the pipeline. """
+        return self._transforms
+
+    @transforms.setter
+    def transforms(self, transforms: Tuple[AppFunction, ...]):
+        self._transforms = transforms
+        self.is_async = any(is_async_app_function(func) for func in transforms)
+        self.plan = None
 
 
 class Trigger(ABC):  # pylint: disable=too-few-public-methods
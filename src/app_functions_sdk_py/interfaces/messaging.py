@@ -36,10 +36,10 @@ import cbor2
 from dataclasses_json import dataclass_json
 
 from ..utils.deserialize import deserialize_to_dataclass
+from ..utils.serialize import encode_json
 from ..contracts.common.constants import API_VERSION, CONTENT_TYPE_JSON, CONTENT_TYPE_CBOR, ENV_MESSAGE_CBOR_ENCODE, \
     VALUE_TRUE
 from ..contracts.dtos.common.base import Versionable
-from ..contracts.clients.utils import common
 from ..contracts.clients.logger import Logger
 from ..utils.environment import get_env_var_as_bool
 from ..constants import ENV_KEY_EDGEX_MSG_BASE64_PAYLOAD
@@ -49,6 +49,7 @@ from ..utils.strconv import parse_bool
 # define constants for the message bus type
 MQTT = "mqtt"
 NATS_CORE = "nats-core"
+LOOPBACK = "loopback"
 
 # define the message bus authentication modes
 AUTH_MODE_NONE = "none"
@@ -244,7 +245,7 @@ def marshal_msg_payload(content_type: str, payload: Any) -> bytes:
     """
     try:
         if content_type == CONTENT_TYPE_JSON:
-            return json.dumps(common.convert_any_to_dict(payload)).encode('utf-8')
+            return encode_json(payload)
         if content_type == CONTENT_TYPE_CBOR:
             return cbor2.dumps(payload)
         raise ValueError(f"Unsupported content type: {content_type}")
@@ -252,17 +253,41 @@ def marshal_msg_payload(content_type: str, payload: Any) -> bytes:
         raise ValueError(f'Failed to marshal to {content_type}, error: {e}') from e
 
 
+def decode_msg_payload(msg: MessageEnvelope, content_type: str) -> Any:
+    """
+    Decodes the message payload once into its generic form (e.g. dict or list) based on the
+    provided content type, so that callers can inspect the data before choosing the DTO to build.
+    Base64 encoded payloads are decoded first. The provided content type takes precedence over
+    the envelope content type, which allows normalizing it without copying the envelope.
+    """
+    payload = msg.payload
+    try:
+        if not isinstance(payload, bytes):
+            payload = marshal_msg_payload(content_type, payload)
+        elif is_base64_encoded(payload):
+            payload = base64.b64decode(payload)
+        return decode_payload_data(content_type, payload)
+    except (TypeError, ValueError, UnicodeDecodeError, cbor2.CBORError) as e:
+        raise ValueError(f'Failed to decode payload: {e}') from e
+
+
+def decode_payload_data(content_type: str, payload: bytes) -> Any:
+    """
+    Decodes the payload bytes into its generic form based on the content type.
+    """
+    if content_type == CONTENT_TYPE_JSON:
+        return json.loads(payload.decode('utf-8'))
+    if content_type == CONTENT_TYPE_CBOR:
+        return cbor2.loads(payload)
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
 def unmarshal_msg_payload(content_type: str, payload: bytes, target_type: Type[T]) -> T:
     """
     Unmarshal the message payload based on the content type and target type.
     """
     try:
-        if content_type == CONTENT_TYPE_JSON:
-            data = json.loads(payload.decode('utf-8'))
-        elif content_type == CONTENT_TYPE_CBOR:
-            data = cbor2.loads(payload)
-        else:
-            raise ValueError(f"Unsupported content type: {content_type}")
+        data = decode_payload_data(content_type, payload)
 
         if isinstance(data, target_type):
             return data
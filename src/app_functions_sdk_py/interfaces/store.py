@@ -3,8 +3,9 @@
 """
 This module provides the classes and functions for StoreClient
 """
+import heapq
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Any, Iterator, Tuple, Optional
 
 from ..contracts import errors
 from ..contracts.dtos.store_object import StoredObject
@@ -18,19 +19,114 @@ class StoreClient(ABC):
     def store(self, o: StoredObject) -> Tuple[str, Optional[errors.EdgeX]]:
         """ Store persists a stored object to the data store and returns the assigned UUID """
 
+    def store_many(self, objects: list[StoredObject]) -> Tuple[list[str], Optional[errors.EdgeX]]:
+        """
+        store_many persists the stored objects to the data store and returns the assigned UUIDs.
+        By default, the objects are stored one at a time until one fails; implementations should
+        override it to store them in a single transaction.
+        """
+        ids = []
+        for o in objects:
+            object_id, err = self.store(o)
+            if err is not None:
+                return ids, err
+            ids.append(object_id)
+        return ids, None
+
     @abstractmethod
     def retrieve_from_store(self, app_service_key: str) \
             -> Tuple[list[StoredObject], Optional[errors.EdgeX]]:
         """ retrieve_from_store gets an object from the data store. """
 
+    def retrieve_page_from_store(self, app_service_key: str, cursor: Any, page_size: int,
+                                 due_before: Optional[int] = None) \
+            -> Tuple[list[StoredObject], Any, Optional[errors.EdgeX]]:
+        """
+        retrieve_page_from_store gets up to page_size objects from the data store following the
+        cursor, None starting from the first object, and returns them along with the cursor of
+        the next page, which is None once the last page is retrieved. The objects are ordered by
+        their nextRetryAt and, if due_before is set, limited to those due before it. By default,
+        all the objects are retrieved to be filtered and paged, the cursor being the (nextRetryAt,
+        id) of the last object of the previous page; implementations should override it to
+        retrieve only the page from the store.
+        """
+        if page_size <= 0:
+            return [], None, errors.new_common_edgex(
+                errors.ErrKind.CONTRACT_INVALID, f"invalid page size {page_size}")
+        objects, err = self.retrieve_from_store(app_service_key)
+        if err is not None:
+            return [], None, err
+
+        def page_key(o: StoredObject) -> Tuple[int, str]:
+            return o.nextRetryAt, o.id
+
+        after = tuple(cursor) if cursor is not None else None
+        page = heapq.nsmallest(
+            page_size,
+            (o for o in objects if (due_before is None or o.nextRetryAt < due_before)
+             and (after is None or page_key(o) > after)),
+            key=page_key)
+        next_cursor = page_key(page[-1]) if len(page) == page_size else None
+        return page, next_cursor, None
+
+    def iterate_from_store(self, app_service_key: str, page_size: int,
+                           due_before: Optional[int] = None) \
+            -> Iterator[Tuple[list[StoredObject], Optional[errors.EdgeX]]]:
+        """
+        iterate_from_store yields the objects of the data store page by page, so that only one
+        page of up to page_size objects is held in memory at a time. Iteration stops after the
+        first page failing to be retrieved, which is yielded along with its error.
+        """
+        cursor = None
+        while True:
+            page, cursor, err = self.retrieve_page_from_store(
+                app_service_key, cursor, page_size, due_before)
+            yield page, err
+            if err is not None or cursor is None:
+                return
+
+    def count(self, app_service_key: str) -> Tuple[int, Optional[errors.EdgeX]]:
+        """
+        count returns the number of objects in the data store. By default, the objects are
+        retrieved to be counted; implementations should override it to count them in the store.
+        """
+        objects, err = self.retrieve_from_store(app_service_key)
+        if err is not None:
+            return 0, err
+        return len(objects), None
+
     @abstractmethod
     def update(self, o: StoredObject) -> Optional[errors.EdgeX]:
         """ update replaces the data currently in the store with the provided data."""
 
+    def update_many(self, objects: list[StoredObject]) -> Optional[errors.EdgeX]:
+        """
+        update_many replaces the data currently in the store with the provided objects. By
+        default, the objects are updated one at a time until one fails; implementations should
+        override it to update them in a single transaction.
+        """
+        for o in objects:
+            err = self.update(o)
+            if err is not None:
+                return err
+        return None
+
     @abstractmethod
     def remove_from_store(self, o: StoredObject) -> Optional[Optional[errors.EdgeX]]:
         """ remove_from_store removes an object from the data store. """
 
+    def remove_many(self, objects: list[StoredObject]) -> Optional[errors.EdgeX]:
+        """
+        remove_many removes the objects from the data store. By default, the objects are removed
+        one at a time until one fails; implementations should override it to remove them in a
+        single transaction.
+        """
+        for o in objects:
+            err = self.remove_from_store(o)
+            if err is not None:
+                return err
+        return None
+
     @abstractmethod
     def disconnect(self) -> Optional[errors.EdgeX]:
         """ disconnect ends the connection. """
@@ -35,7 +35,7 @@ from ...bootstrap.interface.metrics import MetricsManager
 from ...bootstrap.metrics.manager import Manager
 from ...bootstrap.metrics.reporter import MessageBusReporter
 from ...bootstrap.utils import camel_to_snake, convert_dict_keys_to_snake_case
-from ..constants import API_TRIGGER_ROUTE
+from ..constants import API_TRIGGER_ROUTE, LOG_RECORDS_DROPPED_NAME
 from ...bootstrap.interface.secret import SecretProvider
 from ...contracts.clients.command import CommandClient
 from ...contracts.clients.device import DeviceClient
@@ -77,7 +77,7 @@ from ...functions.configurable import Configurable
 from ...interfaces import (AppFunction, ApplicationService, Deferred, Trigger, TriggerConfig,
                            FunctionPipeline, validate_app_function)
 from ...bootstrap.secret.secret import new_secret_provider
-from ...contracts.clients.logger import get_logger, Logger
+from ...contracts.clients.logger import get_logger, Logger, EdgeXLogger
 from ...bootstrap import environment
 from ...bootstrap.registration.registry import register_with_registry
 from ...contracts import errors
@@ -101,9 +101,11 @@ from ...utils.helper import delete_empty_and_trim
 
 def fatal_error(err: Exception, lc: Logger):
     """
-    Logs the error and exits the program.
+    Logs the error and exits the program, once the queued log records, if any, are written.
     """
     lc.error(str(err))
+    if isinstance(lc, EdgeXLogger):
+        lc.stop_async()
     sys.exit(1)
 
 
@@ -115,7 +117,8 @@ class Service(ApplicationService):
     the application context.
 
     Attributes:
-        target_type (Any): The target type for the new service.
+        target_type (Any): The target type for the new service. Either a class or zero-arg factory
+            creating new instances, or an instance which is copied for each message.
         service_key (str): The service key for the service.
         profile_suffix_placeholder (str): The profile suffix placeholder for the new service.
     """
@@ -179,7 +182,7 @@ class Service(ApplicationService):
         the pipeline and to run the configured trigger.
         :return:
         """
-        self._dic = Container()
+        self._dic = Container(read_optimized=True)
         self._dic.update({
             LoggingClientInterfaceName: lambda get: self._logger
         })
@@ -240,6 +243,8 @@ class Service(ApplicationService):
             self._initialize_service_clients(startup_timer)
             # initialize service metrics
             self._initialize_service_metrics()
+            # switch to queue-based logging once the metrics manager can report dropped records
+            self._initialize_log_sink()
         except errors.EdgeX as err:
             fatal_error(err, self._logger)
 
@@ -336,6 +341,8 @@ class Service(ApplicationService):
             return
         deferred = trigger.initialize(self.ctx_done, self.wait_group)
         self._add_deferred(deferred)
+        # stop the runtime's event loop once the trigger no longer submits async pipelines
+        self._add_deferred(self.runtime.stop)
 
         # init the persistent layer and start store forward mechanism
         err = self._initialize_store_client()
@@ -356,6 +363,7 @@ class Service(ApplicationService):
 
         service_binding = DefaultTriggerServiceBinding(self.runtime, self)
         message_processor = DefaultTriggerMessageProcessor(service_binding, self.metrics_manager())
+        self._add_deferred(message_processor.stop)
 
         if trigger_info.Type.upper() == TRIGGER_TYPE_MESSAGEBUS:
             return MessageBusTrigger(service_binding, message_processor, self._dic)
@@ -460,6 +468,8 @@ class Service(ApplicationService):
         self.ctx_done.set()
         if self.service_config.Writable.StoreAndForward.Enabled:
             self.store_forward_ctx_done.set()
+            if self.runtime is not None:
+                self.runtime.wake_store_and_forward()
             self.store_forward_wait_group.wait()
         self._logger.info(f"Service {self.service_key} received signal {signum} and frame {frame}, "
                          f"prepare to exit.")
@@ -522,6 +532,7 @@ class Service(ApplicationService):
     def _create_custom_trigger(self, factory: Callable[[TriggerConfig], Trigger]) -> Trigger:
         service_binding = DefaultTriggerServiceBinding(self.runtime, self)
         message_processor = DefaultTriggerMessageProcessor(service_binding, self.metrics_manager())
+        self._add_deferred(message_processor.stop)
 
         cfg = TriggerConfig(
             logger=self._logger,
@@ -611,6 +622,25 @@ class Service(ApplicationService):
             MetricsManagerInterfaceName: lambda get: manager
         })
 
+    def _initialize_log_sink(self):
+        """
+        Starts the queue-based logging if configured, registering the metric of the records
+        dropped and flushing the queued records on shutdown.
+        """
+        logging_config = self.service_config.Logging
+        if not logging_config.Async or not isinstance(self._logger, EdgeXLogger):
+            return
+        sink = self._logger.start_async(logging_config.QueueSize, logging_config.BatchSize)
+        try:
+            self.metrics_manager().register(LOG_RECORDS_DROPPED_NAME, sink.dropped, None)
+            self._logger.info("%s metric has been registered and will be reported (if enabled)",
+                              LOG_RECORDS_DROPPED_NAME)
+        except errors.EdgeX as e:
+            self._logger.warn("%s metric failed to register and will not be reported: %s",
+                              LOG_RECORDS_DROPPED_NAME, e)
+        self._add_deferred(self._logger.stop_async)
+        self._logger.info("Log records are queued and written in batches")
+
     def _get_client_url(self, service_key: str, default_url: str, startup_timer: Timer) -> str:
         """
         Gets the service client URL.
@@ -742,11 +772,11 @@ class Service(ApplicationService):
 
         match target_type:
             case constants.TARGET_TYPE_RAW:
-                self.target_type = bytes()
+                self.target_type = bytes
             case constants.TARGET_TYPE_METRIC:
-                self.target_type = Metric()
+                self.target_type = Metric
             case constants.TARGET_TYPE_EMPTY | constants.TARGET_TYPE_EVENT:
-                self.target_type = Event()
+                self.target_type = Event
             case _:
                 raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
                                               f"pipeline TargetType of '{target_type}' is not "
@@ -913,6 +943,7 @@ class Service(ApplicationService):
         self._logger.info("Canceling Store and Forward retry loop")
         if self.store_forward_ctx_done is not None:
             self.store_forward_ctx_done.set()
+        self.runtime.wake_store_and_forward()
         self.store_forward_wait_group.wait()
 
     def _initialize_store_client(self) -> Optional[errors.EdgeX]:
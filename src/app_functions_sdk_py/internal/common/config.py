@@ -20,6 +20,7 @@ Classes:
     MessageBusInfo: Configuration for the message bus.
     WillConfig: Configuration for MQTT Last Will and Testament.
     ExternalMqttConfig: Configuration for external MQTT brokers.
+    WorkerPoolInfo: Configuration for the pool of workers executing function pipelines.
     TriggerInfo: Configuration for triggers initiating actions.
     ClientInfo: Configuration for external clients interacting with the service.
     DatabaseInfo: Configuration for the database used by the service.
@@ -77,11 +78,14 @@ class PipelineInfo:
         TargetType (str): The object type that all configurable pipelines will receive.
         Functions (dict[str, PipelineFunction]): Defines and configures the collection of
          available pipeline functions to be used in the above functions pipelines.
+        ProcessPoolSize (int): The number of worker processes executing the ProcessPoolStages
+         of the function pipelines, defaults to the number of CPUs when 0.
     """
     ExecutionOrder: str = field(default_factory=str)
     PerTopicPipelines: dict[str, TopicPipeline] = field(default_factory=dict[str, TopicPipeline])
     TargetType: str = field(default_factory=str)
     Functions: dict[str, PipelineFunction] = field(default_factory=dict[str, PipelineFunction])
+    ProcessPoolSize: int = field(default_factory=int)
 
 
 @dataclass
@@ -92,11 +96,23 @@ class StoreAndForwardInfo:
     Attributes:
         Enabled (bool): Indicates whether the Store and Forward capability enabled or disabled.
         RetryInterval (str): Indicates the duration of time to wait before retries, aka Forward.
+         Fractional seconds such as "0.5s" are supported, down to a minimum of 0.1s.
         MaxRetryCount (int): The maximum number of retry attempts for forwarding a message.
+        RetryBatchSize (int): The number of stored messages loaded and retried at a time, so
+         that retries hold a bounded number of messages in memory. Defaults to 100 if not set.
+        MaxRetryBackoff (str): The maximum duration to wait before retrying a stored message,
+         which doubles from RetryInterval on each failed retry of the message. Each message is
+         retried on every retry if not set.
+        RetryBackoffJitter (float): The fraction, from 0 to 1, of the duration to wait before
+         retrying a stored message which is randomly taken off, so that the messages stored at
+         the same time are not all retried at the same time.
     """
     Enabled: bool = field(default_factory=bool)
     RetryInterval: str = field(default_factory=str)
     MaxRetryCount: int = field(default_factory=int)
+    RetryBatchSize: int = field(default_factory=int)
+    MaxRetryBackoff: str = field(default_factory=str)
+    RetryBackoffJitter: float = field(default_factory=float)
 
 
 @dataclass
@@ -336,6 +352,15 @@ class ExternalMqttConfig:  # pylint: disable=too-many-instance-attributes
         RetryInterval (int): Indicates the time (in seconds) that will be waited between attempts
          to create MQTT client.
         Will (WillConfig): Configuration for the Last Will message.
+        MaxConcurrency (int): Maximum number of received messages decoded and passed to the
+         pipelines concurrently when used by the MQTT trigger. The pipelines themselves are
+         executed per Trigger.WorkerPool. Defaults to 16 if not set.
+        MaxInFlight (int): Maximum number of received messages whose pipeline executions have not
+         yet completed or been discarded when used by the MQTT trigger. Defaults to 256 if not set.
+        BackpressureMode (str): What the MQTT trigger does once MaxInFlight is reached, either
+         "pause" (stop reading from the broker connection until a message completes, leaving
+         QoS 1/2 messages in the broker) or "drop" (discard the new message). Defaults to "pause"
+         if not set.
     """
     Url: str = field(default_factory=str)
     ClientId: str = field(default_factory=str)
@@ -350,6 +375,93 @@ class ExternalMqttConfig:  # pylint: disable=too-many-instance-attributes
     RetryDuration: int = field(default_factory=int)
     RetryInterval: int = field(default_factory=int)
     Will: WillConfig = field(default_factory=WillConfig)
+    MaxConcurrency: int = field(default_factory=int)
+    MaxInFlight: int = field(default_factory=int)
+    BackpressureMode: str = field(default_factory=str)
+
+
+@dataclass
+class WorkerPoolInfo:
+    """
+    Configuration for the pool of long-lived workers that execute the function pipelines for the
+    messages received by the trigger.
+
+    Attributes:
+        MaxWorkers (int): Maximum number of worker threads. Defaults to 16 if not set.
+        QueueSize (int): Maximum number of pipeline executions waiting for a free worker. Defaults
+         to 1024 if not set.
+        OverflowPolicy (str): Policy applied when the queue is full, one of "block" (wait for
+         room), "drop-oldest" (discard the longest waiting execution) or "reject" (discard the
+         new execution). Defaults to "block" if not set.
+        MaxAsyncInFlight (int): Maximum number of executions of pipelines holding async functions
+         in flight on the event loop. Once reached, the "block" policy waits for an execution to
+         complete and the other policies discard the new execution. Defaults to 1024 if not set.
+    """
+    MaxWorkers: int = field(default_factory=int)
+    QueueSize: int = field(default_factory=int)
+    OverflowPolicy: str = field(default_factory=str)
+    MaxAsyncInFlight: int = field(default_factory=int)
+
+
+@dataclass
+class MicroBatchInfo:
+    """
+    Configuration for the micro-batches of messages executed together by the function pipelines
+    which don't hold async functions.
+
+    Attributes:
+        MaxSize (int): Maximum number of messages collected per pipeline before the batch is
+         executed. Micro-batching is disabled if not set or set to 1.
+        MaxWait (str): Maximum time duration the first message of a batch waits for more messages
+         before the batch is executed. Defaults to "0.01s" if not set.
+    """
+    MaxSize: int = field(default_factory=int)
+    MaxWait: str = field(default_factory=str)
+
+
+@dataclass
+class ShardingInfo:
+    """
+    Configuration for executing the function pipelines which don't hold async functions on a
+    fixed set of single-threaded shards, which keeps the messages sharing a shard key in order.
+
+    Attributes:
+        Shards (int): Number of shards, each executing the pipelines of its messages one at a
+         time. Sharding is disabled if not set, in which case the pipelines are executed on the
+         worker pool.
+        ShardKey (str): The key of a message hashed to select its shard, either "deviceName" (the
+         device name of the decoded Event, or the received topic if not an Event) or "topic" (the
+         received topic level selected by TopicLevel). Defaults to "deviceName" if not set.
+        TopicLevel (int): The 1-based index of the topic level used as the "topic" shard key,
+         counted from the end of the topic when negative. The whole topic is used if not set.
+        QueueSize (int): Maximum number of pipeline executions waiting on each shard, beyond which
+         the Trigger.WorkerPool.OverflowPolicy applies. Defaults to 1024 if not set.
+    """
+    Shards: int = field(default_factory=int)
+    ShardKey: str = field(default_factory=str)
+    TopicLevel: int = field(default_factory=int)
+    QueueSize: int = field(default_factory=int)
+
+
+@dataclass
+class HttpTriggerConfig:
+    """
+    Configuration for the HTTP trigger.
+
+    Attributes:
+        ExecutionMode (str): How the pipeline of a request is executed, either "executor" (on a
+         bounded pool of worker threads awaited by the web server, which keeps serving other
+         requests meanwhile) or "inline" (on the event loop of the web server). Defaults to
+         "executor" if not set.
+        MaxConcurrency (int): Maximum number of requests processed concurrently in "executor"
+         mode. Further requests are rejected with 503 Service Unavailable. Defaults to 16 if not
+         set.
+        RetryAfter (str): Time duration sent in the Retry-After header of the requests rejected
+         once MaxConcurrency is reached. Defaults to "1s" if not set.
+    """
+    ExecutionMode: str = field(default_factory=str)
+    MaxConcurrency: int = field(default_factory=int)
+    RetryAfter: str = field(default_factory=str)
 
 
 @dataclass
@@ -364,11 +476,22 @@ class TriggerInfo:
         PublishTopic (str): Indicates the topic in which to publish the function pipeline response
          data, if any. Supports dynamic topic places holders.
         ExternalMqtt (ExternalMqttConfig): Configuration for an external MQTT trigger, if used.
+        WorkerPool (WorkerPoolInfo): Configuration for the workers executing the function
+         pipelines.
+        Http (HttpTriggerConfig): Configuration for the HTTP trigger, if used.
+        MicroBatch (MicroBatchInfo): Configuration for executing the function pipelines on
+         micro-batches of messages.
+        Sharding (ShardingInfo): Configuration for executing the function pipelines in order per
+         shard key, which takes precedence over MicroBatch.
     """
     Type: str = field(default_factory=str)
     SubscribeTopics: str = field(default_factory=str)
     PublishTopic: str = field(default_factory=str)
     ExternalMqtt: ExternalMqttConfig = field(default_factory=ExternalMqttConfig)
+    WorkerPool: WorkerPoolInfo = field(default_factory=WorkerPoolInfo)
+    Http: HttpTriggerConfig = field(default_factory=HttpTriggerConfig)
+    MicroBatch: MicroBatchInfo = field(default_factory=MicroBatchInfo)
+    Sharding: ShardingInfo = field(default_factory=ShardingInfo)
 
 
 @dataclass
@@ -430,6 +553,24 @@ def empty_writable_ptr() -> WritableInfo:
     return WritableInfo()
 
 
+@dataclass
+class LoggingInfo:
+    """
+    Configuration for the output of the service's log records.
+
+    Attributes:
+        Async (bool): Whether the log records are queued by the logging threads and written in
+         batches by a background thread, rather than written synchronously.
+        QueueSize (int): Maximum number of log records waiting to be written when Async is true,
+         further records being dropped. Defaults to 8192 if not set.
+        BatchSize (int): Maximum number of log records written at once when Async is true.
+         Defaults to 256 if not set.
+    """
+    Async: bool = field(default_factory=bool)
+    QueueSize: int = field(default_factory=int)
+    BatchSize: int = field(default_factory=int)
+
+
 @dataclass
 class ConfigurationStruct:  # pylint: disable=too-many-instance-attributes
     """
@@ -445,6 +586,7 @@ class ConfigurationStruct:  # pylint: disable=too-many-instance-attributes
         ApplicationSettings (dict[str, str]): Custom configuration for the Application service.
         Clients (dict[str, ClientInfo]): Configuration for the dependent EdgeX clients.
         Database (DatabaseInfo): Configuration for the database.
+        Logging (LoggingInfo): Configuration for the output of the log records.
     """
     Writable: WritableInfo = field(default_factory=WritableInfo)
     Registry: RegistryInfo = field(default_factory=RegistryInfo)
@@ -455,3 +597,4 @@ class ConfigurationStruct:  # pylint: disable=too-many-instance-attributes
     ApplicationSettings: dict[str, str] = field(default_factory=dict[str, str])
     Clients: dict[str, ClientInfo] = field(default_factory=dict[str, ClientInfo])
     Database: DatabaseInfo = field(default_factory=DatabaseInfo)
+    Logging: LoggingInfo = field(default_factory=LoggingInfo)
@@ -16,10 +16,21 @@ PIPELINE_ID_TXT = "{PipelineId}"
 PIPELINE_MESSAGES_PROCESSED_NAME = "PipelineMessagesProcessed-" + PIPELINE_ID_TXT
 PIPELINE_MESSAGE_PROCESSING_TIME_NAME = "PipelineMessageProcessingTime-" + PIPELINE_ID_TXT
 PIPELINE_PROCESSING_ERRORS_NAME = "PipelineProcessingErrors-" + PIPELINE_ID_TXT
+FUNCTION_INDEX_TXT = "{FunctionIndex}"
+PIPELINE_FUNCTION_PROCESSING_TIME_NAME = ("PipelineFunctionProcessingTime-" + PIPELINE_ID_TXT +
+                                          "-" + FUNCTION_INDEX_TXT)
+PIPELINE_FUNCTION_ERRORS_NAME = ("PipelineFunctionErrors-" + PIPELINE_ID_TXT + "-" +
+                                 FUNCTION_INDEX_TXT)
 HTTP_EXPORT_SIZE_NAME = "HttpExportSize"
 HTTP_EXPORT_ERRORS_NAME = "HttpExportErrors"
 MQTT_EXPORT_SIZE_NAME = "MqttExportSize"
 MQTT_EXPORT_ERRORS_NAME = "MqttExportErrors"
 STORE_FORWARD_QUEUE_SIZE_NAME = "StoreForwardQueueSize"
+STORE_FORWARD_RETRY_LOOP_WAKEUPS_NAME = "StoreForwardRetryLoopWakeups"
+PIPELINE_WORKER_QUEUE_DEPTH_NAME = "PipelineWorkerQueueDepth"
+PIPELINE_WORKER_REJECTIONS_NAME = "PipelineWorkerRejections"
+SHARD_ID_TXT = "{ShardId}"
+PIPELINE_SHARD_QUEUE_DEPTH_NAME = "PipelineShardQueueDepth-" + SHARD_ID_TXT
+LOG_RECORDS_DROPPED_NAME = "LogRecordsDropped"
 
 METRICS_RESERVOIR_SIZE = 1028  # The default Metrics Sample Reservoir size
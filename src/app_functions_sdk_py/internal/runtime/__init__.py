@@ -4,44 +4,51 @@
 This module provides the classes and functions for App Functions Runtime
 """
 
+import concurrent.futures
+import functools
+import inspect
 import json
 import os
 import threading
-import time
 from copy import deepcopy
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any, Optional, Tuple
-
-import isodate
-from isodate import ISO8601Error
-from pyformance.meters import Counter
-
+from typing import Any, Callable, List, Optional, Tuple
+
+from .asyncexec import AsyncPipelineExecutor, DEFAULT_SYNC_WORKERS
+from .plan import FunctionMetrics, PipelinePlan, PlanStep, compile_plan, instrument_step, \
+    function_metric_name, timed_async, timed_batch_call
+from .procexec import ProcessStageExecutor
+from .storeforward import new_store_and_forward
+from .topicindex import TopicIndex
+from ..common.config import ConfigurationStruct
 from ..constants import (PIPELINE_ID_TXT, PIPELINE_MESSAGES_PROCESSED_NAME,
                          PIPELINE_MESSAGE_PROCESSING_TIME_NAME, PIPELINE_PROCESSING_ERRORS_NAME,
-                         STORE_FORWARD_QUEUE_SIZE_NAME)
+                         PIPELINE_FUNCTION_PROCESSING_TIME_NAME, PIPELINE_FUNCTION_ERRORS_NAME)
 from ...bootstrap.container.configuration import configuration_from
 from ...bootstrap.container.logging import logging_client_from
 from ...bootstrap.container.metrics import metrics_manager_from
-from ...bootstrap.container.store import store_client_from
 from ...bootstrap.di.container import Container
 from ...bootstrap.interface.metrics import MetricsManager
 from ...constants import TOPIC_WILDCARD, TOPIC_SINGLE_LEVEL_WILDCARD, TOPIC_LEVEL_SEPERATOR, \
     KEY_RECEIVEDTOPIC, KEY_DEVICE_NAME, KEY_PROFILE_NAME, KEY_SOURCE_NAME, KEY_PIPELINEID, \
     DEFAULT_PIPELINE_ID
 from ...contracts import errors
-from ...contracts.common import constants
 from ...contracts.common.constants import CONTENT_TYPE_JSON, CORRELATION_HEADER, VALUE_TRUE, ENV_OPTIMIZE_EVENT_PAYLOAD
 from ...contracts.dtos.event import Event
 from ...contracts.dtos.requests.event import AddEventRequest
-from ...contracts.dtos.store_object import new_stored_object, StoredObject
 from ...functions.context import Context
+from ...functions.processpool import ProcessPoolStage
 from ...interfaces import FunctionPipeline, AppFunctionContext, AppFunction, calculate_pipeline_hash, \
-    payload_with_correct_content_type
-from ...interfaces.messaging import MessageEnvelope, get_msg_payload
+    normalize_content_type, is_async_app_function, is_batch_app_function, BatchAppFunction
+from ...interfaces.messaging import MessageEnvelope, decode_msg_payload
 from ...sync.waitgroup import WaitGroup
+from ...utils.deserialize import deserialize_to_dataclass
+
+ASYNC_EXECUTOR_STOP_TIMEOUT = 10
 
-DEFAULT_MIN_RETRY_INTERVAL = 1
+# top-level key identifying an AddEventRequest payload rather than a bare Event
+ADD_EVENT_REQUEST_EVENT_KEY = "event"
 
 
 @dataclass
@@ -67,7 +74,24 @@ def process_custom_payload(envelope: MessageEnvelope, target: Any):
         raise ValueError(f"failed to decode JSON payload: {e}") from e
 
 
-class FunctionsPipelineRuntime:
+def target_type_factory(target_type: Any) -> Tuple[Callable[[], Any], Any]:
+    """
+    target_type_factory returns a zero-arg callable creating fresh instances of the provided
+    target type, along with a sample instance used to identify the kind of the target type. The
+    target type may be a class, a zero-arg callable (e.g. a function or functools.partial) or an
+    instance. Instances are used as a prototype and deep copied by the returned factory, so
+    passing the class or a factory avoids the copy for each message.
+    """
+    if target_type is None:
+        return Event, Event()
+
+    if isinstance(target_type, (functools.partial, type)) or inspect.isroutine(target_type):
+        return target_type, target_type()
+
+    return functools.partial(deepcopy, target_type), target_type
+
+
+class FunctionsPipelineRuntime:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     FunctionsPipelineRuntime represents the runtime environment for App Services' Functions
     Pipelines
@@ -77,11 +101,41 @@ class FunctionsPipelineRuntime:
         self._service_key = service_key
         self._logger = logging_client_from(dic.get)
         self._pipelines = {}
+        self._topic_index = TopicIndex([])
+        self._target_factory = None
+        self._decode_target = None
         self.target_type = target_type
         self._dic = dic
+        self._config: Optional[ConfigurationStruct] = None
         self.is_busy_copying_lock = threading.Lock()
+        self._async_executor = None
+        self._async_executor_lock = threading.Lock()
+        self._process_executor = ProcessStageExecutor(self._logger)
         self.store_forward = new_store_and_forward(self, dic, service_key)
 
+    @property
+    def target_type(self) -> Any:
+        """
+        target_type returns the target type the received messages are decoded into
+        """
+        return self._target_type
+
+    @target_type.setter
+    def target_type(self, target_type: Any):
+        """
+        target_type sets the target type, which may be a class, a zero-arg factory or an instance,
+        and selects the decoder for the kind of the target type once rather than per message
+        """
+        factory, sample = target_type_factory(target_type)
+        self._target_type = target_type
+        self._target_factory = factory
+        if isinstance(sample, bytes):
+            self._decode_target = self._decode_raw_payload
+        elif isinstance(sample, Event):
+            self._decode_target = self._decode_event_payload
+        else:
+            self._decode_target = self._decode_custom_payload
+
     def get_pipeline_by_id(self, pipeline_id: str) -> FunctionPipeline:
         """
         get_pipeline_by_id returns the pipeline with the provided id
@@ -114,7 +168,10 @@ class FunctionsPipelineRuntime:
                                                 PIPELINE_MESSAGE_PROCESSING_TIME_NAME, pipeline_id)
                 self.unregister_pipeline_metric(metric_manager,
                                                 PIPELINE_PROCESSING_ERRORS_NAME, pipeline_id)
+            for pipeline in self._pipelines.values():
+                self._unregister_function_metrics(metric_manager, pipeline)
             self._pipelines.clear()
+            self._topic_index = TopicIndex([])
 
     def _add_function_pipeline(self, pipeline_id: str, topics: list[str],
                                *transforms: AppFunction) -> FunctionPipeline:
@@ -122,8 +179,10 @@ class FunctionsPipelineRuntime:
         _add_function_pipeline adds a new pipeline to the runtime
         """
         pipeline = FunctionPipeline(pipeline_id, topics, *transforms)
+        self.compile_pipeline_plan(pipeline)
         with self.is_busy_copying_lock:
             self._pipelines[pipeline_id] = pipeline
+            self._topic_index = TopicIndex(self._pipelines.values())
 
         metric_manager = metrics_manager_from(self._dic.get)
         self.register_pipeline_metric(metric_manager, PIPELINE_MESSAGES_PROCESSED_NAME,
@@ -159,6 +218,7 @@ class FunctionsPipelineRuntime:
         with self.is_busy_copying_lock:
             pipeline.transforms = transforms
             pipeline.hash = calculate_pipeline_hash(*transforms)
+            self.compile_pipeline_plan(pipeline)
 
         self._logger.info(f"Transform set for {pipeline_id} pipeline")
 
@@ -173,11 +233,7 @@ class FunctionsPipelineRuntime:
         """
         get_matching_pipelines returns a list of pipelines that match the incoming_topic
         """
-        matches = []
-        for _, pipeline in self._pipelines.items():
-            if topic_matches(incoming_topic, pipeline.topics):
-                matches.append(pipeline)
-        return matches
+        return list(self._topic_index.match(incoming_topic))
 
     def decode_message(self, ctx: AppFunctionContext, envelope: MessageEnvelope) -> Any:
         """
@@ -187,34 +243,11 @@ class FunctionsPipelineRuntime:
         if envelope is None:
             return None, False
 
-        if self.target_type is None:
-            self.target_type = Event()
-
-        # Must make a copy of the type so that data isn't retained between calls for custom types
-        target = deepcopy(self.target_type)
-
-        if isinstance(target, bytes):
-            self._logger.debug("Expecting raw byte data")
-            target = envelope.payload
-        elif isinstance(target, Event):
-            self._logger.debug("Expecting an AddEventRequest or Event DTO")
-            try:
-                target = self.process_event_payload(envelope)
-            except (ValueError, errors.EdgeX) as e:
-                self._log_error(e, envelope.correlationID)
-                return None
-            ctx.add_value(KEY_DEVICE_NAME, target.deviceName)
-            ctx.add_value(KEY_PROFILE_NAME, target.profileName)
-            ctx.add_value(KEY_SOURCE_NAME, target.sourceName)
-        else:
-            custom_type_name = type(target).__name__
-            self._logger.debug(f"Expecting a custom type of {custom_type_name}")
-            try:
-                process_custom_payload(envelope, target)
-            except ValueError as e:
-                self._log_error(ValueError(f"unable to process custom object received of type "
-                                           f"'{custom_type_name}': {e}"), envelope.correlationID)
-                return None
+        try:
+            target = self._decode_target(ctx, envelope)
+        except (ValueError, errors.EdgeX) as e:
+            self._log_error(e, envelope.correlationID)
+            return None
 
         ctx.set_correlation_id(envelope.correlationID)
         ctx.set_input_content_type(envelope.contentType)
@@ -222,59 +255,194 @@ class FunctionsPipelineRuntime:
 
         return target
 
+    def _decode_raw_payload(self, _: AppFunctionContext, envelope: MessageEnvelope) -> Any:
+        self._logger.debug("Expecting raw byte data")
+        return envelope.payload
+
+    def _decode_event_payload(self, ctx: AppFunctionContext, envelope: MessageEnvelope) -> Event:
+        self._logger.debug("Expecting an AddEventRequest or Event DTO")
+        target = self.process_event_payload(envelope)
+        ctx.add_value(KEY_DEVICE_NAME, target.deviceName)
+        ctx.add_value(KEY_PROFILE_NAME, target.profileName)
+        ctx.add_value(KEY_SOURCE_NAME, target.sourceName)
+        return target
+
+    def _decode_custom_payload(self, _: AppFunctionContext, envelope: MessageEnvelope) -> Any:
+        # Must create a new instance so that data isn't retained between calls for custom types
+        target = self._target_factory()
+        custom_type_name = type(target).__name__
+        self._logger.debug("Expecting a custom type of %s", custom_type_name)
+        try:
+            process_custom_payload(envelope, target)
+        except ValueError as e:
+            raise ValueError(f"unable to process custom object received of type "
+                             f"'{custom_type_name}': {e}") from e
+        return target
+
     def process_event_payload(self, envelope: MessageEnvelope) -> Event:
         """
-        process_event_payload processes the event payload from the message envelope
+        process_event_payload processes the event payload from the message envelope. The payload
+        is decoded once and is built into an AddEventRequest DTO when it holds the request
+        wrapper, or into an Event DTO otherwise.
         """
+        payload = envelope.payload
+        if isinstance(payload, Event):
+            return payload
+        if isinstance(payload, AddEventRequest):
+            return self._recover_event_fields(payload.event)
+
         try:
-            request_dto = get_msg_payload(payload_with_correct_content_type(envelope), AddEventRequest)
-            event = request_dto.event
-
-            if os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
-                # recover the reduced fields for the AddEventRequest
-                for r in event.readings:
-                    r.deviceName = event.deviceName
-                    r.profileName = event.profileName
-                    if r.origin == 0:
-                        r.origin = event.origin
-                    if len(event.readings) == 1 and len(r.resourceName) == 0:
-                        r.resourceName = event.sourceName
-
-            return event
-        except Exception as e: # pylint: disable=broad-exception-caught
-            self._logger.debug(f"Failed to process Payload as an AddEventRequest DTO: {e}"
-                               f"Attempting to process Payload as an Event DTO")
-        try:
-            event = get_msg_payload(payload_with_correct_content_type(envelope), Event)
-            return event
+            data = decode_msg_payload(envelope, normalize_content_type(envelope.contentType))
+            if isinstance(data, dict) and ADD_EVENT_REQUEST_EVENT_KEY in data:
+                request_dto = deserialize_to_dataclass(data, AddEventRequest)
+                return self._recover_event_fields(request_dto.event)
+            self._logger.debug("Payload is not an AddEventRequest DTO. "
+                               "Processing Payload as an Event DTO")
+            return deserialize_to_dataclass(data, Event)
         except Exception as e:  # pylint: disable=broad-exception-caught
             raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
                                           f"failed to decode message envelope into "
                                           f"Event DTO: {e}")
 
+    @staticmethod
+    def _recover_event_fields(event: Event) -> Event:
+        if os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
+            # recover the reduced fields for the AddEventRequest
+            for r in event.readings:
+                r.deviceName = event.deviceName
+                r.profileName = event.profileName
+                if r.origin == 0:
+                    r.origin = event.origin
+                if len(event.readings) == 1 and len(r.resourceName) == 0:
+                    r.resourceName = event.sourceName
+        return event
+
     def process_message(self, ctx: AppFunctionContext, data: Any, pipeline: FunctionPipeline) -> (
             MessageError | None):
         """
         process_message process the decoded data
         """
-        if len(pipeline.transforms) == 0:
-            self._logger.debug(f"Pipeline {pipeline.id} has no transforms")
+        if not self._prepare_processing(ctx, pipeline):
             return None
 
-        self._logger.debug(f"Processing message with pipeline: {pipeline.id}")
-        ctx.add_value(KEY_PIPELINEID, pipeline.id)
+        return self.execute_pipeline(ctx, data, pipeline)
 
-        self._logger.debug(f"Pipeline {pipeline.id} processing message with "
-                           f"{len(pipeline.transforms)} transforms")
+    async def process_message_async(self, ctx: AppFunctionContext, data: Any,
+                                    pipeline: FunctionPipeline) -> MessageError | None:
+        """
+        process_message_async process the decoded data on the runtime's event loop, awaiting
+        the AsyncAppFunctions of the pipeline and running its other functions on a thread pool
+        """
+        if not self._prepare_processing(ctx, pipeline):
+            return None
 
-        return self.execute_pipeline(ctx, data, pipeline)
+        return await self.execute_pipeline_async(ctx, data, pipeline)
+
+    def submit_message(self, ctx: AppFunctionContext, data: Any,
+                       pipeline: FunctionPipeline) -> concurrent.futures.Future:
+        """
+        submit_message schedules process_message_async on the runtime's event loop and returns
+        a future resolving to the MessageError, if any
+        """
+        return self.async_executor.submit(self.process_message_async(ctx, data, pipeline))
+
+    def _prepare_processing(self, ctx: AppFunctionContext, pipeline: FunctionPipeline) -> bool:
+        if len(pipeline.transforms) == 0:
+            self._logger.debug("Pipeline %s has no transforms", pipeline.id)
+            return False
+
+        self._logger.debug("Processing message with pipeline: %s", pipeline.id)
+        ctx.add_value(KEY_PIPELINEID, pipeline.id)
+
+        self._logger.debug("Pipeline %s processing message with %d transforms", pipeline.id,
+                           len(pipeline.transforms))
+        return True
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def execute_pipeline(self, ctx: AppFunctionContext, data: Any, pipeline: FunctionPipeline,
                          start_position: int = 0, is_retry: bool = False) -> MessageError | None:
         """
-        execute_pipeline executes the pipeline with the provided data
+        execute_pipeline executes the pipeline with the provided data. Pipelines holding
+        AsyncAppFunctions are executed on the runtime's event loop and waited for.
+        """
+        if pipeline.is_async:
+            return self.async_executor.submit(self.execute_pipeline_async(
+                ctx, data, pipeline, start_position, is_retry)).result()
+
+        plan = pipeline.plan or self.compile_pipeline_plan(pipeline)
+        if not self._store_forward_enabled():
+            return self._execute_plan_without_store_forward(plan, ctx, data, pipeline,
+                                                            start_position)
+
+        check_retry_trigger = not is_retry and isinstance(ctx, Context)
+        result = None
+        for function_index, step in plan.from_position(start_position):
+            # clear retry data before each individual function execution
+            ctx.set_retry_data(None)
+            continue_pipeline, result = step(ctx, data if result is None else result)
+            if not continue_pipeline:
+                return self._pipeline_stopped(ctx, pipeline, function_index, result, is_retry)
+            if check_retry_trigger and ctx.is_retry_triggered():
+                self._trigger_retry(ctx)
+
+        return None
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _execute_plan_without_store_forward(self, plan: PipelinePlan, ctx: AppFunctionContext,
+                                            data: Any, pipeline: FunctionPipeline,
+                                            start_position: int) -> MessageError | None:
+        """
+        executes the plan when Store and Forward is disabled, in which case the retry data and
+        the retry trigger of the functions are never used
+        """
+        result = None
+        for function_index, step in plan.from_position(start_position):
+            continue_pipeline, result = step(ctx, data if result is None else result)
+            if not continue_pipeline:
+                if result is not None and isinstance(result, errors.EdgeX):
+                    self._pipeline_function_failed(ctx, pipeline, function_index, result, True)
+                    return MessageError(result, HTTPStatus.UNPROCESSABLE_ENTITY)
+                return None
+
+        return None
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _pipeline_stopped(self, ctx: AppFunctionContext, pipeline: FunctionPipeline,
+                          function_index: int, result: Any,
+                          is_retry: bool) -> MessageError | None:
+        """
+        handles the result of the function which stopped the pipeline, storing the data for
+        later retry when it failed
+        """
+        if result is None or not isinstance(result, errors.EdgeX):
+            return None
+        retry_data = self._pipeline_function_failed(ctx, pipeline, function_index, result,
+                                                    is_retry)
+        if retry_data is not None:
+            self.store_forward.store_for_later_retry(retry_data, ctx, pipeline, function_index)
+        return MessageError(result, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def _store_forward_enabled(self) -> bool:
+        config = self._config or self._resolve_config()
+        return config is not None and config.Writable.StoreAndForward.Enabled
+
+    def _resolve_config(self) -> Optional[ConfigurationStruct]:
+        # the service's configuration is registered once and its Writable section is updated in
+        # place, so it is resolved from the DIC once rather than per message
+        self._config = configuration_from(self._dic.get)
+        return self._config
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def execute_pipeline_async(self, ctx: AppFunctionContext, data: Any,
+                                     pipeline: FunctionPipeline, start_position: int = 0,
+                                     is_retry: bool = False) -> MessageError | None:
+        """
+        execute_pipeline_async executes the pipeline with the provided data, awaiting the
+        AsyncAppFunctions and running the other functions on the runtime's thread pool so they
+        never block the event loop
         """
+        executor = self.async_executor
+        plan = pipeline.plan or self.compile_pipeline_plan(pipeline)
         result = None
         continue_pipeline = False
         for function_index, func in enumerate(pipeline.transforms):
@@ -282,30 +450,227 @@ class FunctionsPipelineRuntime:
                 continue
             # clear retry data before each individual function execution
             ctx.set_retry_data(None)
-            if result is None:
-                continue_pipeline, result = func(ctx, data)
+            func_input = data if result is None else result
+            if isinstance(func, ProcessPoolStage):
+                continue_pipeline, result = await timed_async(
+                    pipeline, function_index, self._process_executor.run_async(
+                        func, ctx, func_input, self._process_pool_size()))
+            elif is_async_app_function(func):
+                continue_pipeline, result = await timed_async(
+                    pipeline, function_index, func(ctx, func_input))
             else:
-                continue_pipeline, result = func(ctx, result)
+                continue_pipeline, result = await executor.run_sync(
+                    plan.steps[function_index], ctx, func_input)
 
             if not continue_pipeline:
                 if result is not None and isinstance(result, errors.EdgeX):
-                    self._logger.error(f"Pipeline {pipeline.id} function #{function_index} resulted"
-                                       f" in error: {result.debug_messages()} "
-                                       f"({CORRELATION_HEADER}={ctx.correlation_id()})")
-                    retry_data = ctx.retry_data()
-                    if retry_data is not None and not is_retry:
-                        self.store_forward.store_for_later_retry(
-                            retry_data, ctx, pipeline, function_index)
-                    pipeline.processing_errors.inc(1)
+                    retry_data = self._pipeline_function_failed(ctx, pipeline, function_index,
+                                                                result, is_retry)
+                    if retry_data is not None:
+                        await executor.run_sync(self.store_forward.store_for_later_retry,
+                                                retry_data, ctx, pipeline, function_index)
                     return MessageError(result, HTTPStatus.UNPROCESSABLE_ENTITY)
                 break
 
-            if isinstance(ctx, Context) and not is_retry and ctx.is_retry_triggered():
-                threading.Thread(target=self.store_forward.trigger_retry).start()
-                ctx.clone()
+            self._trigger_retry_if_requested(ctx, is_retry)
 
         return None
 
+    def process_batch(self, ctxs: List[AppFunctionContext], data: List[Any],
+                      pipeline: FunctionPipeline) -> List[MessageError | None]:
+        """
+        process_batch process the decoded data of a micro-batch of messages and returns the
+        MessageError of each message, in order
+        """
+        if len(pipeline.transforms) == 0:
+            self._logger.debug("Pipeline %s has no transforms", pipeline.id)
+            return [None] * len(ctxs)
+
+        self._logger.debug("Processing batch of %d messages with pipeline: %s", len(ctxs),
+                           pipeline.id)
+        for ctx in ctxs:
+            ctx.add_value(KEY_PIPELINEID, pipeline.id)
+
+        return self.execute_pipeline_batch(ctxs, data, pipeline)
+
+    # pylint: disable=too-many-locals
+    def execute_pipeline_batch(self, ctxs: List[AppFunctionContext], data: List[Any],
+                               pipeline: FunctionPipeline) -> List[MessageError | None]:
+        """
+        execute_pipeline_batch executes the pipeline with the data of a micro-batch of messages.
+        BatchAppFunctions are called once with the messages still in flight and the other
+        functions are called per message, so each message stops, fails and is stored for later
+        retry on its own as with execute_pipeline, including when a function raises for it.
+        Returns the MessageError of each message, in order.
+        """
+        plan = pipeline.plan or self.compile_pipeline_plan(pipeline)
+        message_errors: List[MessageError | None] = [None] * len(ctxs)
+        results: List[Any] = [None] * len(ctxs)
+        in_flight = list(range(len(ctxs)))
+        for function_index, func in enumerate(pipeline.transforms):
+            if not in_flight:
+                break
+            for i in in_flight:
+                # clear retry data before each individual function execution
+                ctxs[i].set_retry_data(None)
+            func_inputs = [data[i] if results[i] is None else results[i] for i in in_flight]
+            if is_batch_app_function(func):
+                outcomes = timed_batch_call(pipeline, function_index, func,
+                                            [ctxs[i] for i in in_flight], func_inputs)
+                if len(outcomes) != len(in_flight):
+                    err = errors.new_common_edgex(
+                        errors.ErrKind.SERVER_ERROR,
+                        f"batch function returned {len(outcomes)} results for "
+                        f"{len(in_flight)} messages")
+                    outcomes = [(False, err)] * len(in_flight)
+            else:
+                outcomes = _execute_step_per_message(plan.steps[function_index],
+                                                     [ctxs[i] for i in in_flight], func_inputs)
+
+            still_in_flight = []
+            for i, (continue_pipeline, result) in zip(in_flight, outcomes):
+                results[i] = result
+                if not continue_pipeline:
+                    message_errors[i] = self._pipeline_stopped(ctxs[i], pipeline,
+                                                               function_index, result, False)
+                    continue
+                self._trigger_retry_if_requested(ctxs[i], False)
+                still_in_flight.append(i)
+            in_flight = still_in_flight
+
+        return message_errors
+
+    def compile_pipeline_plan(self, pipeline: FunctionPipeline) -> PipelinePlan:
+        """
+        compile_pipeline_plan compiles the execution plan of the pipeline's functions, routing
+        ProcessPoolStages to the process pool and calling BatchAppFunctions with single element
+        lists, and sets it as the plan of the pipeline. When the per-function metrics are
+        enabled, they are registered and each step is instrumented to report them.
+        """
+        plan = compile_plan(pipeline.transforms, self._plan_step)
+        self._update_function_metrics(pipeline)
+        if pipeline.function_metrics:
+            plan = PipelinePlan(plan.transforms, tuple(
+                instrument_step(step, metrics)
+                for step, metrics in zip(plan.steps, pipeline.function_metrics)))
+        pipeline.plan = plan
+        return plan
+
+    def _function_metrics_enabled(self) -> bool:
+        config = self._config or self._resolve_config()
+        if config is None:
+            return False
+        telemetry = config.Writable.Telemetry
+        return any(telemetry.get_enabled_metric_name(name)[1]
+                   for name in (PIPELINE_FUNCTION_PROCESSING_TIME_NAME,
+                                PIPELINE_FUNCTION_ERRORS_NAME))
+
+    def _update_function_metrics(self, pipeline: FunctionPipeline):
+        """
+        replaces the per-function metrics of the pipeline by those of its current functions, if
+        enabled in the Telemetry configuration when the pipeline's functions are set
+        """
+        metric_manager = metrics_manager_from(self._dic.get)
+        self._unregister_function_metrics(metric_manager, pipeline)
+        if not self._function_metrics_enabled():
+            pipeline.function_metrics = []
+            return
+
+        pipeline.function_metrics = [FunctionMetrics(index, func)
+                                     for index, func in enumerate(pipeline.transforms)]
+        if metric_manager is None:
+            return
+        for metrics in pipeline.function_metrics:
+            tags = {"pipeline": pipeline.id, "function": metrics.name,
+                    "index": str(metrics.index)}
+            for metric_name, metric in (
+                    (PIPELINE_FUNCTION_PROCESSING_TIME_NAME, metrics.processing_time),
+                    (PIPELINE_FUNCTION_ERRORS_NAME, metrics.processing_errors)):
+                registered_name = function_metric_name(metric_name, pipeline.id, metrics.index)
+                try:
+                    metric_manager.register(registered_name, metric, tags)
+                except errors.EdgeX as e:
+                    self._logger.warn("Unable to register %s metric. Metric will not be "
+                                      "reported : %s", registered_name, e)
+
+    @staticmethod
+    def _unregister_function_metrics(metric_manager: Optional[MetricsManager],
+                                     pipeline: FunctionPipeline):
+        if metric_manager is None:
+            return
+        for metrics in pipeline.function_metrics:
+            for metric_name in (PIPELINE_FUNCTION_PROCESSING_TIME_NAME,
+                                PIPELINE_FUNCTION_ERRORS_NAME):
+                metric_manager.unregister(
+                    function_metric_name(metric_name, pipeline.id, metrics.index))
+
+    def _plan_step(self, func: AppFunction) -> PlanStep:
+        if isinstance(func, ProcessPoolStage):
+            return functools.partial(self._run_process_stage, func)
+        if is_batch_app_function(func):
+            return functools.partial(_call_batch_function, func)
+        return func
+
+    def _run_process_stage(self, stage: ProcessPoolStage, ctx: AppFunctionContext,
+                           data: Any) -> Tuple[bool, Any]:
+        return self._process_executor.run(stage, ctx, data, self._process_pool_size())
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _pipeline_function_failed(self, ctx: AppFunctionContext, pipeline: FunctionPipeline,
+                                  function_index: int, err: errors.EdgeX,
+                                  is_retry: bool) -> Optional[bytes]:
+        """
+        logs and counts the error of the pipeline function and returns the data to store for
+        later retry, if any
+        """
+        self._logger.error(f"Pipeline {pipeline.id} function #{function_index} resulted"
+                           f" in error: {err.debug_messages()} "
+                           f"({CORRELATION_HEADER}={ctx.correlation_id()})")
+        pipeline.processing_errors.inc(1)
+        if is_retry:
+            return None
+        return ctx.retry_data()
+
+    def _trigger_retry_if_requested(self, ctx: AppFunctionContext, is_retry: bool):
+        if isinstance(ctx, Context) and not is_retry and ctx.is_retry_triggered():
+            self._trigger_retry(ctx)
+
+    def _trigger_retry(self, ctx: Context):
+        if self.store_forward.is_retry_loop_running():
+            self.store_forward.trigger_retry()
+        else:
+            threading.Thread(target=self.store_forward.trigger_retry).start()
+        ctx.clone()
+
+    @property
+    def async_executor(self) -> AsyncPipelineExecutor:
+        """
+        async_executor returns the executor owning the event loop of the async pipelines, which
+        is created on first use with a thread pool sized per Trigger.WorkerPool.MaxWorkers
+        """
+        executor = self._async_executor
+        if executor is None:
+            with self._async_executor_lock:
+                if self._async_executor is None:
+                    config = configuration_from(self._dic.get)
+                    max_sync_workers = config.Trigger.WorkerPool.MaxWorkers \
+                        if config is not None else DEFAULT_SYNC_WORKERS
+                    self._async_executor = AsyncPipelineExecutor(self._logger, max_sync_workers)
+                executor = self._async_executor
+        return executor
+
+    def _process_pool_size(self) -> int:
+        config = self._config or self._resolve_config()
+        return config.Writable.Pipeline.ProcessPoolSize if config is not None else 0
+
+    def stop(self, timeout: Optional[float] = ASYNC_EXECUTOR_STOP_TIMEOUT):
+        """
+        stop waits up to timeout seconds for the async pipeline executions in flight to complete
+        and stops the runtime's event loop and the worker processes of the ProcessPoolStages
+        """
+        self.async_executor.stop(timeout)
+        self._process_executor.stop()
+
     # pylint: disable=too-many-positional-arguments
     def start_store_and_forward(
             self,
@@ -316,6 +681,10 @@ class FunctionsPipelineRuntime:
         self.store_forward.start_store_and_forward_retry_loop(
             app_wg, app_ctx_done, store_forward_wg, store_forward_ctx_done, service_key)
 
+    def wake_store_and_forward(self):
+        """ wakes up the store and forward retry loop so that it exits once stopped """
+        self.store_forward.wake_retry_loop()
+
     def register_pipeline_metric(self, metric_manager: MetricsManager, metric_name: str,
                                  pipeline_id: str, metric: Any):
         """
@@ -339,6 +708,26 @@ class FunctionsPipelineRuntime:
         metric_manager.unregister(registered_name)
 
 
+def _call_batch_function(func: BatchAppFunction, ctx: AppFunctionContext,
+                         data: Any) -> Tuple[bool, Any]:
+    return func([ctx], [data])[0]
+
+
+def _execute_step_per_message(step: PlanStep, ctxs: List[AppFunctionContext],
+                              data: List[Any]) -> List[Tuple[bool, Any]]:
+    """
+    executes the step with the data of each message, an exception raised for a message failing
+    that message only rather than the whole batch
+    """
+    outcomes = []
+    for ctx, func_input in zip(ctxs, data):
+        try:
+            outcomes.append(step(ctx, func_input))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            outcomes.append((False, errors.new_common_edgex_wrapper(e)))
+    return outcomes
+
+
 def topic_matches(incoming_topic: str, pipeline_topics: list[str]) -> bool:
     """
     topic_matches returns true if the incoming_topic matches any of the pipeline_topics
@@ -369,287 +758,3 @@ def topic_matches(incoming_topic: str, pipeline_topics: list[str]) -> bool:
             if incoming_with_wildcards.find(topic) == 0:
                 return True
     return False
-
-
-class StoreForwardInfo:
-    """ StoreForwardInfo handle the retry process """
-
-    # pylint: disable=too-many-arguments
-    def __init__(self, runtime: FunctionsPipelineRuntime, dic: Container, service_key: str):
-        self.runtime = runtime
-        self.dic = dic
-        self.lc = logging_client_from(dic.get)
-        self.service_key = service_key
-        self.data_count = Counter("")
-        self.retry_in_progress_lock = threading.Lock()
-        self.retry_in_progress = False
-
-    # pylint: disable=too-many-positional-arguments
-    def start_store_and_forward_retry_loop(
-            self, app_wg: WaitGroup, app_ctx_done: threading.Event,
-            store_forward_wg: WaitGroup, store_forward_ctx_done: threading.Event, service_key: str):
-        """ start a loop for store and forward """
-
-        app_wg.add(1)
-        store_forward_wg.add(1)
-
-        config = configuration_from(self.dic.get)
-        store_client = store_client_from(self.dic.get)
-        self.service_key = service_key
-
-        items, err = store_client.retrieve_from_store(service_key)
-        if err is not None:
-            self.lc.error("Unable to initialize Store and Forward data count: "
-                          "Failed to load items from DB: %v", err)
-        else:
-            self.data_count.clear()
-            self.data_count.inc(len(items))
-
-        def retry_loop():
-            try:
-                retry_interval_duration = isodate.parse_duration(
-                    "PT" + config.Writable.StoreAndForward.RetryInterval.upper())
-                retry_interval = retry_interval_duration.seconds
-            except ISO8601Error as e:
-                self.lc.warn(
-                    "StoreAndForward RetryInterval failed to parse, %s",
-                    e)
-                retry_interval = DEFAULT_MIN_RETRY_INTERVAL
-
-            if retry_interval < DEFAULT_MIN_RETRY_INTERVAL:
-                self.lc.warn(
-                    "StoreAndForward RetryInterval value %s is less than the allowed minimum value,"
-                    " defaulting to %s seconds", retry_interval, DEFAULT_MIN_RETRY_INTERVAL)
-
-            if config.Writable.StoreAndForward.MaxRetryCount < 0:
-                self.lc.warn(
-                    "StoreAndForward MaxRetryCount can not be less than 0, "
-                    "defaulting to 1 seconds")
-                config.Writable.StoreAndForward.MaxRetryCount = 1
-
-            self.lc.info(
-                "Starting StoreAndForward Retry Loop with %s seconds retry interval "
-                "and %d max retries. %d stored items waiting for retry.",
-                retry_interval,
-                config.Writable.StoreAndForward.MaxRetryCount,
-                len(items))
-
-            start_time = time.time()
-            next_time = start_time + retry_interval
-
-            try:
-                while not app_ctx_done.is_set() and not store_forward_ctx_done.is_set():
-                    if time.time() < next_time:
-                        continue
-
-                    self.retry_stored_data(service_key)
-
-                    start_time = time.time()
-                    next_time = start_time + retry_interval
-            finally:
-                app_wg.done()
-                store_forward_wg.done()
-                self.lc.info("Exiting StoreAndForward Retry Loop")
-
-        threading.Thread(target=retry_loop).start()
-
-    def store_for_later_retry(
-            self,
-            payload: bytes,
-            app_context: AppFunctionContext,
-            pipeline: FunctionPipeline,
-            pipeline_position: int):
-        """ store data for later retry """
-
-        item = new_stored_object(self.service_key, payload, pipeline.id,
-                                 pipeline_position, pipeline.hash,
-                                 app_context.get_values())
-        item.correlationID = app_context.correlation_id()
-
-        self.lc.trace("Storing data for later retry for pipeline '%s' (%s=%s)",
-                      pipeline.id,
-                      constants.CORRELATION_HEADER,
-                      app_context.correlation_id())
-
-        config = configuration_from(self.dic.get)
-        if not config.Writable.StoreAndForward.Enabled:
-            self.lc.error("Failed to store item for later retry for "
-                          "pipeline '%s': StoreAndForward not enabled",
-                          pipeline.id)
-            return
-
-        store_client = store_client_from(self.dic.get)
-        _, err = store_client.store(item)
-        if err is not None:
-            self.lc.error(
-                "Failed to store item for later retry for pipeline '%s': %s", pipeline.id, err)
-
-        self.data_count.inc(1)
-
-    def retry_stored_data(self, service_key: str):
-        """ Skip if another thread is already doing the retry """
-        if self.retry_in_progress:
-            return
-
-        with self.retry_in_progress_lock:
-            try:
-                self.retry_in_progress = True
-
-                store_client = store_client_from(self.dic.get)
-
-                items, err = store_client.retrieve_from_store(service_key)
-                if err is not None:
-                    self.lc.error("Unable to load store and forward items from DB: %s", err)
-                    return
-
-                self.lc.debug("%d stored data items found for retrying", len(items))
-
-                if len(items) > 0:
-                    items_to_remove, items_to_update = self.process_retry_items(items)
-
-                    self.lc.debug(
-                        " %d stored data items will be removed post retry", len(items_to_remove))
-                    self.lc.debug(
-                        " %d stored data items will be updated post retry", len(items_to_update))
-
-                    for item in items_to_remove:
-                        err = store_client.remove_from_store(item)
-                        if err is not None:
-                            self.lc.error(
-                                "Unable to remove stored data item for "
-                                "pipeline '%s' from DB, objectID=%s: %s",
-                                item.pipelineId, err, item.id)
-
-                    for item in items_to_update:
-                        err = store_client.update(item)
-                        if err is not None:
-                            self.lc.error(
-                                "Unable to update stored data item for "
-                                "pipeline '%s' from DB, objectID=%s: %s",
-                                item.pipelineId, err, item.id)
-
-                    self.data_count.dec(len(items_to_remove))
-            finally:
-                self.retry_in_progress = False
-
-    def process_retry_items(
-            self, items: list[StoredObject]) -> Tuple[list[StoredObject], list[StoredObject]]:
-        """ process the retry items """
-        config = configuration_from(self.dic.get)
-
-        items_to_remove: list[StoredObject] = []
-        items_to_update: list[StoredObject] = []
-
-        # Item will be removed from store if:
-        #    - successfully retried
-        #    - max retries exceeded
-        #    - version no longer matches current Pipeline
-        # Item will not be removed if retry failed and more retries available (hit 'continue' above)
-        max_retry_count = config.Writable.StoreAndForward.MaxRetryCount
-        for item in items:
-            pipeline = self.runtime.get_pipeline_by_id(item.pipelineId)
-
-            if pipeline is None:
-                self.lc.error(
-                    "Stored data item's pipeline '%s' no longer exists. Removing item from DB",
-                    item.pipelineId)
-                items_to_remove.append(item)
-                continue
-
-            if item.version != pipeline.hash:
-                self.lc.error(
-                    "Stored data item's pipeline Version doesn't match '%s' pipeline's Version. "
-                    "Removing item from DB",
-                    item.pipelineId)
-                items_to_remove.append(item)
-                continue
-
-            if not self.retry_export_function(item, pipeline):
-                item.retryCount += 1
-                if max_retry_count == 0 or item.retryCount < max_retry_count:
-                    self.lc.trace(
-                        "Export retry failed for pipeline '%s'. retries=%d, "
-                        "Incrementing retry count (%s=%s)",
-                        item.pipelineId,
-                        item.retryCount,
-                        CORRELATION_HEADER,
-                        item.correlationID)
-                    items_to_update.append(item)
-                    continue
-
-                self.lc.trace(
-                    "Max retries exceeded for pipeline '%s'. retries=%d, "
-                    "Removing item from DB (%s=%s)",
-                    item.pipelineId,
-                    item.retryCount,
-                    CORRELATION_HEADER,
-                    item.correlationID)
-                items_to_remove.append(item)
-
-                # Note that item will be removed for DB below.
-            else:
-                self.lc.trace("Retry successful for pipeline '%s'. Removing item from DB (%s=%s)",
-                              item.pipelineId,
-                              CORRELATION_HEADER,
-                              item.correlationID)
-                items_to_remove.append(item)
-
-        return items_to_remove, items_to_update
-
-    def retry_export_function(self, item: StoredObject, pipeline: FunctionPipeline) -> bool:
-        """ retry the export function """
-        app_context = Context(item.correlationID, self.dic, "")
-
-        for k, v in item.contextData.items():
-            app_context.add_value(k.lower(), v)
-
-        self.lc.trace("Retrying stored data for pipeline '%s' (%s=%s)",
-                      item.pipelineId,
-                      CORRELATION_HEADER,
-                      app_context.correlation_id())
-
-        return self.runtime.execute_pipeline(
-            app_context,
-            item.payload,
-            pipeline,
-            item.pipelinePosition,
-            True) is None
-
-    def trigger_retry(self):
-        """ trigger the retry process """
-        if self.data_count.counter > 0:
-            config = configuration_from(self.dic.get)
-            if not config.Writable.StoreAndForward.Enabled:
-                self.lc.debug(
-                    "Store and Forward not enabled, skipping triggering retry of failed data")
-                return
-
-            self.lc.debug("Triggering Store and Forward retry of failed data")
-            self.retry_stored_data(self.service_key)
-
-
-def new_store_and_forward(
-        runtime: FunctionsPipelineRuntime, dic: Container, service_key: str) -> StoreForwardInfo:
-    """ creates new StoreForward """
-    sf = StoreForwardInfo(
-        runtime=runtime,
-        dic=dic,
-        service_key=service_key,
-    )
-    lc = logging_client_from(dic.get)
-    metrics_manager = metrics_manager_from(dic.get)
-    if metrics_manager is None:
-        lc.error("Unable to register %s metric: MetricsManager is not available.",
-                 STORE_FORWARD_QUEUE_SIZE_NAME)
-        return sf
-
-    try:
-        metrics_manager.register(STORE_FORWARD_QUEUE_SIZE_NAME, sf.data_count, None)
-        lc.info("%s metric has been registered and will be reported (if enabled)",
-                STORE_FORWARD_QUEUE_SIZE_NAME)
-    except errors.EdgeX as e:
-        lc.error("Unable to register metric %s. Collection will continue, "
-                 "but metric will not be reported: %v",
-                 STORE_FORWARD_QUEUE_SIZE_NAME, e)
-
-    return sf
@@ -0,0 +1,125 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `AsyncPipelineExecutor` class, which owns the event loop used to execute
+the function pipelines holding AsyncAppFunctions.
+
+The event loop runs on a dedicated daemon thread started on first use. AsyncAppFunctions are
+awaited on that loop, so a single thread keeps any number of them in flight while they wait on
+I/O, and the synchronous AppFunctions of the same pipelines are run on a bounded thread pool so
+they never block the loop.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Coroutine, Optional
+
+from ...contracts.clients.logger import Logger
+from ...utils.eventloop import close_loop_resources
+
+DEFAULT_SYNC_WORKERS = 16
+DEFAULT_MAX_ASYNC_IN_FLIGHT = 1024
+
+ASYNC_LOOP_THREAD_NAME = "async-pipeline-loop"
+SYNC_WORKER_THREAD_PREFIX = "async-pipeline-sync"
+
+
+class AsyncPipelineExecutor:
+    """
+    AsyncPipelineExecutor executes coroutines on a dedicated event loop thread and runs the
+    synchronous functions they depend on in a thread pool of at most max_sync_workers threads.
+    """
+
+    def __init__(self, lc: Logger, max_sync_workers: int = DEFAULT_SYNC_WORKERS):
+        self._lc = lc
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._sync_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_sync_workers if max_sync_workers > 0 else DEFAULT_SYNC_WORKERS,
+            thread_name_prefix=SYNC_WORKER_THREAD_PREFIX)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """ Returns the event loop, starting its thread if not already running. """
+        loop = self._loop
+        if loop is not None:
+            return loop
+        return self._start()
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        submit schedules the coroutine on the event loop and returns a future resolving to its
+        result. Raises RuntimeError if the executor is stopped.
+        """
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop)
+        except RuntimeError:
+            coro.close()
+            raise
+
+    async def run_sync(self, fn: Callable, *args: Any) -> Any:
+        """
+        run_sync runs fn(*args) on the thread pool and awaits its result, so a synchronous
+        function can be called from a coroutine without blocking the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._sync_executor, fn, *args)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        stop refuses any further coroutine, waits up to timeout seconds in total for the
+        coroutines in flight to complete, closes the resources registered with close_with_loop
+        and then stops the event loop and the thread pool.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            loop, thread = self._loop, self._thread
+            self._loop = None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if loop is not None:
+            drained = asyncio.run_coroutine_threadsafe(self._drain(timeout), loop)
+            try:
+                drained.result(None if deadline is None else max(deadline - time.monotonic(), 0))
+            except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+                self._lc.warn("timed out waiting for the async pipeline executions to complete")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        self._sync_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("async pipeline executor is stopped")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._run_loop, args=(loop,),
+                                          name=ASYNC_LOOP_THREAD_NAME, daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._lc.debug("async pipeline event loop started")
+            return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    @staticmethod
+    async def _drain(timeout: Optional[float]):
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+        # closes the resources bound to the loop, such as the clients of the HTTP exports
+        await close_loop_resources()
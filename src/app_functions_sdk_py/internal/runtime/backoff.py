@@ -0,0 +1,73 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `RetryBackoff` class, which computes when the stored data items failing
+to be retried by Store and Forward are due to be retried next, so that an item failing again and
+again is retried less and less often rather than on every retry.
+"""
+
+import random
+from typing import Optional
+
+import isodate
+from isodate import ISO8601Error
+
+from ..common.config import StoreAndForwardInfo
+
+# caps the exponent of the backoff, far beyond any MaxRetryBackoff, so that it can't overflow
+MAX_BACKOFF_EXPONENT = 32
+
+
+class RetryBackoff:
+    """
+    RetryBackoff holds the exponential backoff of the retries of the stored data items, the
+    delay before the next retry of an item doubling from the interval on each of its failed
+    retries up to the maximum backoff, minus up to the jitter fraction of it taken at random.
+
+    Attributes:
+        interval (float): The delay in seconds after the first failed retry.
+        max_backoff (float): The maximum delay in seconds, no backoff if 0.
+        jitter (float): The fraction of the delay randomly taken off.
+    """
+    __slots__ = ("interval", "max_backoff", "jitter")
+
+    def __init__(self, interval: float, max_backoff: float, jitter: float):
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.jitter = min(max(jitter, 0.0), 1.0)
+
+    def delay(self, retry_count: int) -> float:
+        """
+        delay returns the delay in seconds before the next retry of an item which failed
+        retry_count times, 0 if there is no backoff so that the item is retried on the next retry
+        """
+        if self.max_backoff <= 0:
+            return 0.0
+        exponent = min(max(retry_count - 1, 0), MAX_BACKOFF_EXPONENT)
+        delay = min(self.interval * 2 ** exponent, self.max_backoff)
+        return delay * (1 - self.jitter * random.random())
+
+    def next_retry_at(self, retry_count: int, now: int) -> int:
+        """
+        next_retry_at returns when an item which failed retry_count times is due to be retried
+        next, in milliseconds since the epoch as now is
+        """
+        return now + int(self.delay(retry_count) * 1000)
+
+
+def parse_seconds(duration: str) -> Optional[float]:
+    """ parse_seconds returns the seconds of the duration, such as "5m", or None if invalid """
+    try:
+        return isodate.parse_duration("PT" + duration.upper()).total_seconds()
+    except ISO8601Error:
+        return None
+
+
+def new_retry_backoff(config: StoreAndForwardInfo) -> RetryBackoff:
+    """
+    new_retry_backoff returns the RetryBackoff of the Store and Forward configuration, the
+    durations failing to parse having no backoff, as reported by the retry loop
+    """
+    interval = parse_seconds(config.RetryInterval) or 0.0
+    max_backoff = parse_seconds(config.MaxRetryBackoff) if config.MaxRetryBackoff else 0.0
+    return RetryBackoff(interval, max_backoff or 0.0, config.RetryBackoffJitter)
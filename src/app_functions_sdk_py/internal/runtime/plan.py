@@ -0,0 +1,151 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `PipelinePlan` class, the execution plan compiled from the functions of
+a FunctionPipeline when they are set, so that executing the pipeline for a message only calls
+the prebuilt steps in sequence rather than inspecting each function per message.
+
+When the per-function metrics are enabled, the steps are wrapped once, at compile time, to time
+each function and count its errors, so that the plans of the pipelines without them execute no
+instrumentation at all.
+"""
+
+from typing import Any, Callable, List, Tuple
+
+from pyformance.meters import Counter, Timer
+
+from ..constants import PIPELINE_ID_TXT, FUNCTION_INDEX_TXT
+from ...contracts import errors
+from ...interfaces import AppFunction, AppFunctionContext, BatchAppFunction, FunctionPipeline
+from ...utils.helper import function_name
+
+PlanStep = Callable[[AppFunctionContext, Any], Tuple[bool, Any]]
+
+
+class PipelinePlan:  # pylint: disable=too-few-public-methods
+    """
+    PipelinePlan holds one step per function of the pipeline, each calling its function in the
+    way the runtime executes it, along with the steps remaining from each start position.
+    """
+    __slots__ = ("transforms", "steps", "_from_position")
+
+    def __init__(self, transforms: Tuple[AppFunction, ...], steps: Tuple[PlanStep, ...]):
+        self.transforms = transforms
+        self.steps = steps
+        self._from_position = {0: tuple(enumerate(steps))}
+
+    def from_position(self, start_position: int) -> Tuple[Tuple[int, PlanStep], ...]:
+        """
+        from_position returns the (function index, step) pairs executed when the pipeline
+        starts at start_position, as Store and Forward retries do
+        """
+        indexed_steps = self._from_position.get(start_position)
+        if indexed_steps is None:
+            indexed_steps = self._from_position[0][start_position:]
+            self._from_position[start_position] = indexed_steps
+        return indexed_steps
+
+
+def compile_plan(transforms: Tuple[AppFunction, ...],
+                 adapt: Callable[[AppFunction], PlanStep]) -> PipelinePlan:
+    """
+    compile_plan builds the plan of the functions, adapt returning the step executing each
+    function
+    """
+    return PipelinePlan(transforms, tuple(adapt(func) for func in transforms))
+
+
+class FunctionMetrics:  # pylint: disable=too-few-public-methods
+    """
+    FunctionMetrics holds the metrics of the function at the index of a pipeline.
+
+    Attributes:
+        index (int): The index of the function in the pipeline.
+        name (str): The name of the function.
+        processing_time (Timer): The time taken by each execution of the function.
+        processing_errors (Counter): Number of executions which failed, either returning an
+         error or raising an exception.
+    """
+    __slots__ = ("index", "name", "processing_time", "processing_errors")
+
+    def __init__(self, index: int, func: AppFunction):
+        self.index = index
+        self.name = function_name(func)
+        self.processing_time = Timer("")
+        self.processing_errors = Counter("")
+
+
+def instrument_step(step: PlanStep, metrics: FunctionMetrics) -> PlanStep:
+    """
+    instrument_step returns the step timing each execution of the wrapped step and counting its
+    errors in the metrics
+    """
+    processing_time = metrics.processing_time
+    processing_errors = metrics.processing_errors
+
+    def instrumented(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        with processing_time.time():
+            try:
+                continue_pipeline, result = step(ctx, data)
+            except Exception:
+                processing_errors.inc()
+                raise
+        if not continue_pipeline and isinstance(result, errors.EdgeX):
+            processing_errors.inc()
+        return continue_pipeline, result
+
+    return instrumented
+
+
+def function_metric_name(metric_name: str, pipeline_id: str, function_index: int) -> str:
+    """
+    function_metric_name returns the name the metric of the function at the index of the
+    pipeline is registered with
+    """
+    return metric_name.replace(PIPELINE_ID_TXT, pipeline_id, 1).replace(
+        FUNCTION_INDEX_TXT, str(function_index), 1)
+
+
+def count_function_errors(metrics: FunctionMetrics, outcomes: List[Tuple[bool, Any]]):
+    """ count_function_errors counts the outcomes which are errors in the metrics """
+    for continue_pipeline, result in outcomes:
+        if not continue_pipeline and isinstance(result, errors.EdgeX):
+            metrics.processing_errors.inc()
+
+
+async def timed_async(pipeline: FunctionPipeline, function_index: int,
+                      awaitable: Any) -> Tuple[bool, Any]:
+    """
+    timed_async awaits the execution of the function at the index of the pipeline, reporting it
+    in its metrics if enabled
+    """
+    if not pipeline.function_metrics:
+        return await awaitable
+    metrics = pipeline.function_metrics[function_index]
+    with metrics.processing_time.time():
+        try:
+            outcome = await awaitable
+        except Exception:
+            metrics.processing_errors.inc()
+            raise
+    count_function_errors(metrics, [outcome])
+    return outcome
+
+
+def timed_batch_call(pipeline: FunctionPipeline, function_index: int, func: BatchAppFunction,
+                     ctxs: List[AppFunctionContext], data: List[Any]) -> List[Tuple[bool, Any]]:
+    """
+    timed_batch_call calls the batch function at the index of the pipeline, reporting each call
+    in its metrics if enabled
+    """
+    if not pipeline.function_metrics:
+        return func(ctxs, data)
+    metrics = pipeline.function_metrics[function_index]
+    with metrics.processing_time.time():
+        try:
+            outcomes = func(ctxs, data)
+        except Exception:
+            metrics.processing_errors.inc()
+            raise
+    count_function_errors(metrics, outcomes)
+    return outcomes
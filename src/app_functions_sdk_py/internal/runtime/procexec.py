@@ -0,0 +1,110 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `ProcessStageExecutor` class, which owns the pool of worker processes
+executing the ProcessPoolStages of the function pipelines.
+
+The pool is created on first use with the spawn start method, as forking a process running the
+service's threads could leave locks held in the child, and is recreated whenever the configured
+size changes.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional, Tuple
+
+from ...contracts.clients.logger import EdgeXLogger, Logger, INFO
+from ...functions.processpool import ProcessPoolStage, DEFAULT_WORKER_SERVICE_KEY, \
+    execute_stage, initialize_worker, restore_context
+from ...interfaces import AppFunctionContext
+
+PROCESS_START_METHOD = "spawn"
+
+
+def default_process_pool_size() -> int:
+    """ Returns the number of worker processes used when the pool size isn't configured. """
+    return os.cpu_count() or 1
+
+
+class ProcessStageExecutor:
+    """
+    ProcessStageExecutor executes ProcessPoolStages in a pool of worker processes and applies the
+    context they return to the context of the pipeline.
+    """
+
+    def __init__(self, lc: Logger):
+        self._lc = lc
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = 0
+        self._stopped = False
+
+    def run(self, stage: ProcessPoolStage, ctx: AppFunctionContext, data: Any,
+            pool_size: int) -> Tuple[bool, Any]:
+        """
+        run executes the stage in a worker process and waits for its result
+        """
+        return self._completed(ctx, self._submit(stage, ctx, data, pool_size).result())
+
+    async def run_async(self, stage: ProcessPoolStage, ctx: AppFunctionContext, data: Any,
+                        pool_size: int) -> Tuple[bool, Any]:
+        """
+        run_async executes the stage in a worker process and awaits its result
+        """
+        return self._completed(
+            ctx, await asyncio.wrap_future(self._submit(stage, ctx, data, pool_size)))
+
+    def stop(self):
+        """
+        stop refuses any further stage and shuts the worker processes down once the stages
+        already submitted have completed
+        """
+        with self._lock:
+            self._stopped = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _submit(self, stage: ProcessPoolStage, ctx: AppFunctionContext, data: Any,
+                pool_size: int) -> Future:
+        return self._executor(pool_size).submit(execute_stage, stage.transforms,
+                                                stage.snapshot(ctx), data)
+
+    @staticmethod
+    def _completed(ctx: AppFunctionContext, outcome: Tuple[bool, Any, Any]) -> Tuple[bool, Any]:
+        continue_pipeline, result, snapshot = outcome
+        restore_context(ctx, snapshot)
+        return continue_pipeline, result
+
+    def _executor(self, pool_size: int) -> ProcessPoolExecutor:
+        if pool_size <= 0:
+            pool_size = default_process_pool_size()
+        pool = self._pool
+        if pool is not None and self._pool_size == pool_size:
+            return pool
+
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("process pool stage executor is stopped")
+            previous = None
+            if self._pool is None or self._pool_size != pool_size:
+                previous = self._pool
+                service_key, log_level = DEFAULT_WORKER_SERVICE_KEY, INFO
+                if isinstance(self._lc, EdgeXLogger):
+                    service_key, log_level = self._lc.service_key, self._lc.logger.level
+                self._pool = ProcessPoolExecutor(
+                    max_workers=pool_size,
+                    mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+                    initializer=initialize_worker, initargs=(service_key, log_level))
+                self._pool_size = pool_size
+                self._lc.info("process pool for pipeline stages sized to %d worker processes",
+                              pool_size)
+            pool = self._pool
+
+        if previous is not None:
+            # the stages already submitted to the previous pool complete in its processes
+            previous.shutdown(wait=False)
+        return pool
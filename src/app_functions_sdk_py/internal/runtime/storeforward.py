@@ -0,0 +1,371 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `StoreForwardInfo` class, which stores the data failing to be exported
+by the function pipelines and retries exporting it in the Store and Forward retry loop.
+"""
+
+import threading
+import time
+from typing import Tuple
+
+import isodate
+from isodate import ISO8601Error
+from pyformance.meters import Counter
+
+from .backoff import RetryBackoff, new_retry_backoff, parse_seconds
+from ..constants import STORE_FORWARD_QUEUE_SIZE_NAME, STORE_FORWARD_RETRY_LOOP_WAKEUPS_NAME
+from ...bootstrap.container.configuration import configuration_from
+from ...bootstrap.container.logging import logging_client_from
+from ...bootstrap.container.metrics import metrics_manager_from
+from ...bootstrap.container.store import store_client_from
+from ...bootstrap.di.container import Container
+from ...contracts import errors
+from ...contracts.common import constants
+from ...contracts.common.constants import CORRELATION_HEADER
+from ...contracts.dtos.store_object import new_stored_object, StoredObject
+from ...functions.context import Context
+from ...interfaces import FunctionPipeline, AppFunctionContext
+from ...interfaces.store import StoreClient
+from ...sync.waitgroup import WaitGroup
+
+DEFAULT_MIN_RETRY_INTERVAL = 1
+DEFAULT_RETRY_BATCH_SIZE = 100
+MIN_RETRY_INTERVAL = 0.1
+
+
+class StoreForwardInfo:  # pylint: disable=too-many-instance-attributes
+    """ StoreForwardInfo handle the retry process """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, runtime: "FunctionsPipelineRuntime", dic: Container, service_key: str):
+        self.runtime = runtime
+        self.dic = dic
+        self.lc = logging_client_from(dic.get)
+        self.service_key = service_key
+        self.data_count = Counter("")
+        self.retry_loop_wakeups = Counter("")
+        self.retry_in_progress_lock = threading.Lock()
+        self.retry_in_progress = False
+        # set to wake up the retry loop, either to retry early or to exit
+        self._retry_loop_wakeup = threading.Event()
+        self._retry_requested = False
+        self._retry_loop_running = False
+
+    # pylint: disable=too-many-positional-arguments
+    def start_store_and_forward_retry_loop(
+            self, app_wg: WaitGroup, app_ctx_done: threading.Event,
+            store_forward_wg: WaitGroup, store_forward_ctx_done: threading.Event, service_key: str):
+        """ start a loop for store and forward """
+
+        app_wg.add(1)
+        store_forward_wg.add(1)
+
+        config = configuration_from(self.dic.get)
+        store_client = store_client_from(self.dic.get)
+        self.service_key = service_key
+
+        count, err = store_client.count(service_key)
+        if err is not None:
+            self.lc.error("Unable to initialize Store and Forward data count: "
+                          "Failed to count items in DB: %s", err)
+        else:
+            self.data_count.clear()
+            self.data_count.inc(count)
+
+        def retry_loop():
+            try:
+                retry_interval_duration = isodate.parse_duration(
+                    "PT" + config.Writable.StoreAndForward.RetryInterval.upper())
+                retry_interval = retry_interval_duration.total_seconds()
+            except ISO8601Error as e:
+                self.lc.warn(
+                    "StoreAndForward RetryInterval failed to parse, %s",
+                    e)
+                retry_interval = DEFAULT_MIN_RETRY_INTERVAL
+
+            if retry_interval < MIN_RETRY_INTERVAL:
+                self.lc.warn(
+                    "StoreAndForward RetryInterval value %s is less than the allowed minimum value,"
+                    " defaulting to %s seconds", retry_interval, MIN_RETRY_INTERVAL)
+                retry_interval = MIN_RETRY_INTERVAL
+
+            if config.Writable.StoreAndForward.MaxRetryCount < 0:
+                self.lc.warn(
+                    "StoreAndForward MaxRetryCount can not be less than 0, "
+                    "defaulting to 1 seconds")
+                config.Writable.StoreAndForward.MaxRetryCount = 1
+
+            max_retry_backoff = config.Writable.StoreAndForward.MaxRetryBackoff
+            if max_retry_backoff and parse_seconds(max_retry_backoff) is None:
+                self.lc.warn(
+                    "StoreAndForward MaxRetryBackoff %s failed to parse, retrying the stored items "
+                    "without backoff", max_retry_backoff)
+
+            self.lc.info(
+                "Starting StoreAndForward Retry Loop with %s seconds retry interval "
+                "and %d max retries. %d stored items waiting for retry.",
+                retry_interval,
+                config.Writable.StoreAndForward.MaxRetryCount,
+                self.data_count.get_count())
+
+            next_time = time.monotonic() + retry_interval
+
+            try:
+                while True:
+                    # sleeps until the next retry is due unless woken up early by trigger_retry
+                    # or wake_retry_loop
+                    self._retry_loop_wakeup.wait(max(next_time - time.monotonic(), 0))
+                    self._retry_loop_wakeup.clear()
+                    self.retry_loop_wakeups.inc(1)
+                    if app_ctx_done.is_set() or store_forward_ctx_done.is_set():
+                        break
+                    if not self._retry_requested and time.monotonic() < next_time:
+                        continue
+
+                    self._retry_requested = False
+                    self.retry_stored_data(service_key)
+
+                    next_time = time.monotonic() + retry_interval
+            finally:
+                self._retry_loop_running = False
+                app_wg.done()
+                store_forward_wg.done()
+                self.lc.info("Exiting StoreAndForward Retry Loop")
+
+        self._retry_loop_wakeup.clear()
+        self._retry_loop_running = True
+        threading.Thread(target=retry_loop).start()
+
+    def is_retry_loop_running(self) -> bool:
+        """ returns whether the retry loop is running """
+        return self._retry_loop_running
+
+    def wake_retry_loop(self):
+        """
+        wakes up the retry loop so that it exits without waiting for the next retry once its
+        done events are set
+        """
+        self._retry_loop_wakeup.set()
+
+    def store_for_later_retry(
+            self,
+            payload: bytes,
+            app_context: AppFunctionContext,
+            pipeline: FunctionPipeline,
+            pipeline_position: int):
+        """ store data for later retry """
+
+        item = new_stored_object(self.service_key, payload, pipeline.id,
+                                 pipeline_position, pipeline.hash,
+                                 app_context.get_values())
+        item.correlationID = app_context.correlation_id()
+
+        self.lc.trace("Storing data for later retry for pipeline '%s' (%s=%s)",
+                      pipeline.id,
+                      constants.CORRELATION_HEADER,
+                      app_context.correlation_id())
+
+        config = configuration_from(self.dic.get)
+        if not config.Writable.StoreAndForward.Enabled:
+            self.lc.error("Failed to store item for later retry for "
+                          "pipeline '%s': StoreAndForward not enabled",
+                          pipeline.id)
+            return
+
+        store_client = store_client_from(self.dic.get)
+        _, err = store_client.store(item)
+        if err is not None:
+            self.lc.error(
+                "Failed to store item for later retry for pipeline '%s': %s", pipeline.id, err)
+
+        self.data_count.inc(1)
+
+    def retry_stored_data(self, service_key: str):
+        """ Skip if another thread is already doing the retry """
+        if self.retry_in_progress:
+            return
+
+        with self.retry_in_progress_lock:
+            try:
+                self.retry_in_progress = True
+
+                store_client = store_client_from(self.dic.get)
+                store_forward_config = configuration_from(self.dic.get).Writable.StoreAndForward
+                batch_size = store_forward_config.RetryBatchSize
+                if batch_size <= 0:
+                    batch_size = DEFAULT_RETRY_BATCH_SIZE
+                backoff = new_retry_backoff(store_forward_config)
+                # only the items due before the retry started are retried, the items failing
+                # again being due after it
+                now = int(time.time() * 1000)
+
+                # the items are retried one batch at a time, so that only one batch is held in
+                # memory however many items are stored
+                for items, err in store_client.iterate_from_store(service_key, batch_size, now):
+                    if err is not None:
+                        self.lc.error("Unable to load store and forward items from DB: %s", err)
+                        return
+
+                    self.lc.debug("%d stored data items due for retrying", len(items))
+                    if len(items) > 0:
+                        self.retry_items(store_client, items, backoff, now)
+            finally:
+                self.retry_in_progress = False
+
+    def retry_items(self, store_client: StoreClient, items: list[StoredObject],
+                    backoff: RetryBackoff, now: int):
+        """
+        retry the items and remove or update them in the store accordingly, the items failing
+        again being due to be retried after their backoff from now
+        """
+        items_to_remove, items_to_update = self.process_retry_items(items)
+        for item in items_to_update:
+            item.nextRetryAt = backoff.next_retry_at(item.retryCount, now)
+
+        self.lc.debug(" %d stored data items will be removed post retry", len(items_to_remove))
+        self.lc.debug(" %d stored data items will be updated post retry", len(items_to_update))
+
+        # the items are removed and updated in one transaction each rather than one per item
+        if items_to_remove:
+            err = store_client.remove_many(items_to_remove)
+            if err is not None:
+                self.lc.error("Unable to remove %d stored data items from DB: %s",
+                              len(items_to_remove), err)
+            else:
+                self.data_count.dec(len(items_to_remove))
+
+        if items_to_update:
+            err = store_client.update_many(items_to_update)
+            if err is not None:
+                self.lc.error("Unable to update %d stored data items in DB: %s",
+                              len(items_to_update), err)
+
+    def process_retry_items(
+            self, items: list[StoredObject]) -> Tuple[list[StoredObject], list[StoredObject]]:
+        """ process the retry items """
+        config = configuration_from(self.dic.get)
+
+        items_to_remove: list[StoredObject] = []
+        items_to_update: list[StoredObject] = []
+
+        # Item will be removed from store if:
+        #    - successfully retried
+        #    - max retries exceeded
+        #    - version no longer matches current Pipeline
+        # Item will not be removed if retry failed and more retries available (hit 'continue' above)
+        max_retry_count = config.Writable.StoreAndForward.MaxRetryCount
+        for item in items:
+            pipeline = self.runtime.get_pipeline_by_id(item.pipelineId)
+
+            if pipeline is None:
+                self.lc.error(
+                    "Stored data item's pipeline '%s' no longer exists. Removing item from DB",
+                    item.pipelineId)
+                items_to_remove.append(item)
+                continue
+
+            if item.version != pipeline.hash:
+                self.lc.error(
+                    "Stored data item's pipeline Version doesn't match '%s' pipeline's Version. "
+                    "Removing item from DB",
+                    item.pipelineId)
+                items_to_remove.append(item)
+                continue
+
+            if not self.retry_export_function(item, pipeline):
+                item.retryCount += 1
+                if max_retry_count == 0 or item.retryCount < max_retry_count:
+                    self.lc.trace(
+                        "Export retry failed for pipeline '%s'. retries=%d, "
+                        "Incrementing retry count (%s=%s)",
+                        item.pipelineId,
+                        item.retryCount,
+                        CORRELATION_HEADER,
+                        item.correlationID)
+                    items_to_update.append(item)
+                    continue
+
+                self.lc.trace(
+                    "Max retries exceeded for pipeline '%s'. retries=%d, "
+                    "Removing item from DB (%s=%s)",
+                    item.pipelineId,
+                    item.retryCount,
+                    CORRELATION_HEADER,
+                    item.correlationID)
+                items_to_remove.append(item)
+
+                # Note that item will be removed for DB below.
+            else:
+                self.lc.trace("Retry successful for pipeline '%s'. Removing item from DB (%s=%s)",
+                              item.pipelineId,
+                              CORRELATION_HEADER,
+                              item.correlationID)
+                items_to_remove.append(item)
+
+        return items_to_remove, items_to_update
+
+    def retry_export_function(self, item: StoredObject, pipeline: FunctionPipeline) -> bool:
+        """ retry the export function """
+        app_context = Context(item.correlationID, self.dic, "")
+
+        for k, v in item.contextData.items():
+            app_context.add_value(k.lower(), v)
+
+        self.lc.trace("Retrying stored data for pipeline '%s' (%s=%s)",
+                      item.pipelineId,
+                      CORRELATION_HEADER,
+                      app_context.correlation_id())
+
+        return self.runtime.execute_pipeline(
+            app_context,
+            item.payload,
+            pipeline,
+            item.pipelinePosition,
+            True) is None
+
+    def trigger_retry(self):
+        """ trigger the retry process """
+        if self.data_count.counter > 0:
+            config = configuration_from(self.dic.get)
+            if not config.Writable.StoreAndForward.Enabled:
+                self.lc.debug(
+                    "Store and Forward not enabled, skipping triggering retry of failed data")
+                return
+
+            self.lc.debug("Triggering Store and Forward retry of failed data")
+            if self._retry_loop_running:
+                # the retry loop retries the data once woken up, rather than the caller
+                self._retry_requested = True
+                self._retry_loop_wakeup.set()
+                return
+            self.retry_stored_data(self.service_key)
+
+
+def new_store_and_forward(
+        runtime: "FunctionsPipelineRuntime", dic: Container, service_key: str) -> StoreForwardInfo:
+    """ creates new StoreForward """
+    sf = StoreForwardInfo(
+        runtime=runtime,
+        dic=dic,
+        service_key=service_key,
+    )
+    lc = logging_client_from(dic.get)
+    metrics_manager = metrics_manager_from(dic.get)
+    if metrics_manager is None:
+        lc.error("Unable to register %s and %s metrics: MetricsManager is not available.",
+                 STORE_FORWARD_QUEUE_SIZE_NAME, STORE_FORWARD_RETRY_LOOP_WAKEUPS_NAME)
+        return sf
+
+    for metric_name, metric in ((STORE_FORWARD_QUEUE_SIZE_NAME, sf.data_count),
+                                (STORE_FORWARD_RETRY_LOOP_WAKEUPS_NAME, sf.retry_loop_wakeups)):
+        try:
+            metrics_manager.register(metric_name, metric, None)
+            lc.info("%s metric has been registered and will be reported (if enabled)",
+                    metric_name)
+        except errors.EdgeX as e:
+            lc.error("Unable to register metric %s. Collection will continue, "
+                     "but metric will not be reported: %s",
+                     metric_name, e)
+
+    return sf
@@ -0,0 +1,110 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the `TopicIndex` class, a compiled index over the topics of the function
+pipelines used to find the pipelines matching an incoming topic.
+
+Matching follows the same rules as `topic_matches`:
+    - a pipeline topic of '#' matches any incoming topic
+    - a pipeline topic without wildcards must be equal to the incoming topic
+    - a pipeline topic with wildcards is compared level by level against the leading levels of
+      the incoming topic, where a '#' or '+' level matches any single level and the last level
+      of the pipeline topic only needs to prefix the corresponding incoming level
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from ...constants import TOPIC_WILDCARD, TOPIC_SINGLE_LEVEL_WILDCARD, TOPIC_LEVEL_SEPERATOR
+
+DEFAULT_TOPIC_CACHE_SIZE = 1024
+
+
+class _TopicNode:  # pylint: disable=too-few-public-methods
+    """ A level of the wildcard topic trie. """
+    __slots__ = ("children", "wildcard", "wildcard_terminals", "literal_terminals")
+
+    def __init__(self):
+        # literal level -> node for the next level
+        self.children: dict[str, _TopicNode] = {}
+        # node reached by a '#' or '+' level
+        self.wildcard: _TopicNode | None = None
+        # pipelines whose topic ends with the wildcard level leading to this node
+        self.wildcard_terminals: list[int] = []
+        # pipelines whose topic ends with a literal level at this depth, keyed by that literal
+        self.literal_terminals: dict[str, list[int]] = {}
+
+
+class TopicIndex:  # pylint: disable=too-few-public-methods
+    """
+    TopicIndex is an immutable index over the topics of a set of pipelines. It must be rebuilt
+    whenever the set of pipelines changes. The result of each lookup is kept in an LRU cache
+    keyed by the incoming topic.
+    """
+
+    def __init__(self, pipelines: Iterable[Any], cache_size: int = DEFAULT_TOPIC_CACHE_SIZE):
+        self._pipelines = list(pipelines)
+        self._match_all: list[int] = []
+        self._exact: dict[str, list[int]] = {}
+        self._root = _TopicNode()
+
+        for position, pipeline in enumerate(self._pipelines):
+            for topic in pipeline.topics:
+                self._add_topic(topic, position)
+
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _add_topic(self, topic: str, position: int):
+        if topic == TOPIC_WILDCARD:
+            self._match_all.append(position)
+            return
+
+        if TOPIC_WILDCARD not in topic and TOPIC_SINGLE_LEVEL_WILDCARD not in topic:
+            self._exact.setdefault(topic, []).append(position)
+            return
+
+        node = self._root
+        levels = topic.split(TOPIC_LEVEL_SEPERATOR)
+        for level in levels[:-1]:
+            node = self._next_node(node, level)
+
+        last_level = levels[-1]
+        if last_level in (TOPIC_WILDCARD, TOPIC_SINGLE_LEVEL_WILDCARD):
+            self._next_node(node, last_level).wildcard_terminals.append(position)
+        else:
+            node.literal_terminals.setdefault(last_level, []).append(position)
+
+    @staticmethod
+    def _next_node(node: _TopicNode, level: str) -> _TopicNode:
+        if level in (TOPIC_WILDCARD, TOPIC_SINGLE_LEVEL_WILDCARD):
+            if node.wildcard is None:
+                node.wildcard = _TopicNode()
+            return node.wildcard
+        child = node.children.get(level)
+        if child is None:
+            child = node.children[level] = _TopicNode()
+        return child
+
+    def _match(self, incoming_topic: str) -> tuple:
+        matched = set(self._match_all)
+        matched.update(self._exact.get(incoming_topic, ()))
+
+        levels = incoming_topic.split(TOPIC_LEVEL_SEPERATOR)
+        nodes = [self._root]
+        for level in levels:
+            if not nodes:
+                break
+            next_nodes = []
+            for node in nodes:
+                for literal, positions in node.literal_terminals.items():
+                    if level.startswith(literal):
+                        matched.update(positions)
+                if node.wildcard is not None:
+                    matched.update(node.wildcard.wildcard_terminals)
+                    next_nodes.append(node.wildcard)
+                child = node.children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            nodes = next_nodes
+
+        return tuple(self._pipelines[position] for position in sorted(matched))
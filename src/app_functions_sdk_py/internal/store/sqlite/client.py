@@ -2,14 +2,18 @@
 #  SPDX-License-Identifier: Apache-2.0
 """
 This module provides the classes and functions for Sqlite store client
+
+Each stored object is kept as a row of typed columns, with its payload as a BLOB, rather than as
+a JSON document with its payload encoded in base64, as done by the version 1 of the schema. The
+schema version is recorded as the user_version of the database, and the version 1 store table is
+migrated to the current schema when the client is created.
 """
 import base64
-import copy
 import json
 import sqlite3
 import threading
 import time
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from ....contracts import errors
 from ....contracts.clients.logger import Logger
@@ -17,6 +21,36 @@ from ....contracts.clients.utils.common import convert_any_to_dict
 from ....contracts.dtos.store_object import StoredObject
 from ....interfaces.store import StoreClient
 
+SCHEMA_VERSION = 2
+MIGRATION_BATCH_SIZE = 1000
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS store (
+        id TEXT PRIMARY KEY,
+        app_service_key TEXT NOT NULL,
+        created INTEGER NOT NULL,
+        pipeline_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        version TEXT NOT NULL,
+        correlation_id TEXT NOT NULL,
+        retry_count INTEGER NOT NULL,
+        next_retry_at INTEGER NOT NULL DEFAULT 0,
+        context_data TEXT NOT NULL,
+        payload BLOB NOT NULL
+    )
+    """
+CREATE_INDEX = """
+    CREATE INDEX IF NOT EXISTS store_app_service_key_next_retry_at
+    ON store (app_service_key, next_retry_at)
+    """
+
+COLUMNS = ("id, app_service_key, pipeline_id, position, version, correlation_id, retry_count, "
+           "next_retry_at, context_data, payload")
+INSERT = (f"INSERT OR IGNORE INTO store (created, {COLUMNS}) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+UPDATE = ("UPDATE store SET pipeline_id = ?, position = ?, version = ?, correlation_id = ?, "
+          "retry_count = ?, next_retry_at = ?, context_data = ?, payload = ? WHERE id = ?")
+
 
 class Client(StoreClient):
     """ Sqlite store client """
@@ -27,22 +61,61 @@ class Client(StoreClient):
             return [], errors.new_common_edgex(
                 errors.ErrKind.CONTRACT_INVALID, "no AppServiceKey provided")
         with self.conn_mutex:
-            with self.conn:
-                try:
-                    cur = self.conn.execute(
-                        "SELECT content FROM store WHERE app_service_key = $1", [app_service_key])
-                    objects: list[sqlite3.Row] = cur.fetchall()
-                except sqlite3.Error as e:
-                    return [], errors.new_common_edgex_wrapper(e)
-                res = []
-                for row in objects:
-                    payload_dict = json.loads(row['content'])
-                    obj = StoredObject(**payload_dict)
-                    if is_base64(obj.payload):
-                        # convert base64 back to bytes
-                        obj.payload = base64.b64decode(obj.payload)
-                    res.append(obj)
-                return res, None
+            try:
+                cur = self.conn.execute(
+                    f"SELECT {COLUMNS} FROM store WHERE app_service_key = ?", [app_service_key])
+                rows: list[sqlite3.Row] = cur.fetchall()
+            except sqlite3.Error as e:
+                return [], errors.new_common_edgex_wrapper(e)
+        return [row_to_object(row) for row in rows], None
+
+    def retrieve_page_from_store(self, app_service_key: str, cursor: Any, page_size: int,
+                                 due_before: Optional[int] = None) \
+            -> Tuple[list[StoredObject], Any, Optional[errors.EdgeX]]:
+        """
+        retrieve_page_from_store gets up to page_size objects following the cursor, which is the
+        (next_retry_at, rowid) of the last object of the previous page, so that each page is read
+        from the (app_service_key, next_retry_at) index however many objects precede it, and
+        objects removed in between pages neither shift nor repeat the following pages. Objects
+        updated in between pages are retrieved again if their next_retry_at moves past the cursor
+        and before due_before.
+        """
+        if app_service_key == "":
+            return [], None, errors.new_common_edgex(
+                errors.ErrKind.CONTRACT_INVALID, "no AppServiceKey provided")
+        if page_size <= 0:
+            return [], None, errors.new_common_edgex(
+                errors.ErrKind.CONTRACT_INVALID, f"invalid page size {page_size}")
+        query = f"SELECT rowid, {COLUMNS} FROM store WHERE app_service_key = ?"
+        params: list[Any] = [app_service_key]
+        if cursor is not None:
+            query += " AND (next_retry_at, rowid) > (?, ?)"
+            params.extend(cursor)
+        if due_before is not None:
+            query += " AND next_retry_at < ?"
+            params.append(due_before)
+        query += " ORDER BY next_retry_at, rowid LIMIT ?"
+        params.append(page_size)
+        with self.conn_mutex:
+            try:
+                rows: list[sqlite3.Row] = self.conn.execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                return [], None, errors.new_common_edgex_wrapper(e)
+        next_cursor = (rows[-1]['next_retry_at'], rows[-1]['rowid']) \
+            if len(rows) == page_size else None
+        return [row_to_object(row) for row in rows], next_cursor, None
+
+    def count(self, app_service_key: str) -> Tuple[int, Optional[errors.EdgeX]]:
+        if app_service_key == "":
+            return 0, errors.new_common_edgex(
+                errors.ErrKind.CONTRACT_INVALID, "no AppServiceKey provided")
+        with self.conn_mutex:
+            try:
+                cur = self.conn.execute(
+                    "SELECT COUNT(*) FROM store WHERE app_service_key = ?", [app_service_key])
+                return cur.fetchone()[0], None
+            except sqlite3.Error as e:
+                return 0, errors.new_common_edgex_wrapper(e)
 
     def update(self, o: StoredObject) -> Optional[errors.EdgeX]:
         err = o.validate_contract(True)
@@ -52,25 +125,15 @@ class Client(StoreClient):
         with self.conn_mutex:
             with self.conn:
                 try:
-                    data = copy.deepcopy(o)
-                    cur = self.conn.execute("SELECT id FROM store WHERE id = $1", [data.id])
-                    res = cur.fetchone()
-                    if res is None:
-                        self.lc.info("stored object %s not exists, can not update", data.id)
-                        return errors.new_common_edgex(
-                            errors.ErrKind.ENTITY_DOES_NOT_EXIST,
-                            f"stored object {data.id} not exists, can not update")
-
-                    if isinstance(o.payload, bytes):
-                        # encode to base64 string for JSON serialize
-                        data.payload = base64.b64encode(data.payload).decode()
-                    json_data = json.dumps(convert_any_to_dict(data))
-                    self.conn.execute(
-                        "UPDATE store SET content = ? WHERE id = ?",
-                        (json_data, data.id))
-                    return None
+                    cur = self.conn.execute(UPDATE, update_params(o))
                 except sqlite3.Error as e:
                     return errors.new_common_edgex_wrapper(e)
+        if cur.rowcount == 0:
+            self.lc.info("stored object %s not exists, can not update", o.id)
+            return errors.new_common_edgex(
+                errors.ErrKind.ENTITY_DOES_NOT_EXIST,
+                f"stored object {o.id} not exists, can not update")
+        return None
 
     def remove_from_store(self, o: StoredObject) -> Optional[errors.EdgeX]:
         err = o.validate_contract(True)
@@ -93,16 +156,11 @@ class Client(StoreClient):
         self.conn.row_factory = sqlite3.Row
         self.conn_mutex = threading.Lock()
         with self.conn_mutex:
-            with conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS store (
-                        id character PRIMARY KEY,
-                        app_service_key character NOT NULL,
-                        created int NOT NULL,
-                        content text NOT NULL
-                    )
-                    """)
+            # the write-ahead log lets the retries read the store while the pipelines write to
+            # it, and only needs to be synced at checkpoints rather than on each commit
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            migrate(conn, lc)
 
     def store(self, o: StoredObject) -> Tuple[str, Optional[errors.EdgeX]]:
         """ Store persists a stored object to the store table and returns the assigned UUID """
@@ -110,29 +168,72 @@ class Client(StoreClient):
         if err is not None:
             return "", errors.new_common_edgex_wrapper(err)
 
-        data = copy.deepcopy(o)
-        if isinstance(data.payload, bytes):
-            # encode to base64 string for JSON serialize
-            data.payload = base64.b64encode(data.payload).decode()
-
         with self.conn_mutex:
             with self.conn:
                 try:
-                    cur = self.conn.execute("SELECT id FROM store WHERE id = $1", [data.id])
-                    res = cur.fetchone()
-                    if res:
-                        self.lc.info("stored object %s already exists, not persist", data.id)
-                        return "", None
-
-                    json_data = json.dumps(convert_any_to_dict(data))
-                    timestamp = time.time() * 1000
-                    self.conn.execute(
-                        "INSERT INTO store(id, app_service_key, content, created) "
-                        "VALUES ($1, $2, $3, $4)",
-                        (data.id, data.appServiceKey, json_data, timestamp))
-                    return data.id, None
+                    cur = self.conn.execute(INSERT, insert_params(o, time.time() * 1000))
                 except sqlite3.Error as e:
                     return "", errors.new_common_edgex_wrapper(e)
+        if cur.rowcount == 0:
+            self.lc.info("stored object %s already exists, not persist", o.id)
+            return "", None
+        return o.id, None
+
+    def store_many(self, objects: list[StoredObject]) -> Tuple[list[str], Optional[errors.EdgeX]]:
+        """
+        store_many persists the stored objects to the store table in a single transaction and
+        returns their assigned UUIDs, leaving the objects already stored unchanged
+        """
+        for o in objects:
+            err = o.validate_contract(False)
+            if err is not None:
+                return [], errors.new_common_edgex_wrapper(err)
+
+        timestamp = time.time() * 1000
+        with self.conn_mutex:
+            with self.conn:
+                try:
+                    self.conn.executemany(INSERT, [insert_params(o, timestamp) for o in objects])
+                except sqlite3.Error as e:
+                    return [], errors.new_common_edgex_wrapper(e)
+        return [o.id for o in objects], None
+
+    def update_many(self, objects: list[StoredObject]) -> Optional[errors.EdgeX]:
+        """
+        update_many replaces the stored objects in a single transaction, skipping the objects
+        which no longer exist
+        """
+        for o in objects:
+            err = o.validate_contract(True)
+            if err is not None:
+                return errors.new_common_edgex_wrapper(err)
+
+        with self.conn_mutex:
+            with self.conn:
+                try:
+                    cur = self.conn.executemany(UPDATE, [update_params(o) for o in objects])
+                except sqlite3.Error as e:
+                    return errors.new_common_edgex_wrapper(e)
+        if cur.rowcount < len(objects):
+            self.lc.info("%d stored objects not exist, can not update",
+                         len(objects) - cur.rowcount)
+        return None
+
+    def remove_many(self, objects: list[StoredObject]) -> Optional[errors.EdgeX]:
+        """ remove_many removes the stored objects from the store table in a single transaction """
+        for o in objects:
+            err = o.validate_contract(True)
+            if err is not None:
+                return errors.new_common_edgex_wrapper(err)
+
+        with self.conn_mutex:
+            with self.conn:
+                try:
+                    self.conn.executemany("DELETE FROM store WHERE id = ?",
+                                          [(o.id,) for o in objects])
+                except sqlite3.Error as e:
+                    return errors.new_common_edgex_wrapper(e)
+        return None
 
 
 def new_sqlite_client(path: str, lc: Logger) -> StoreClient:
@@ -145,6 +246,73 @@ def new_sqlite_client(path: str, lc: Logger) -> StoreClient:
     return Client(conn, lc)
 
 
+def migrate(conn: sqlite3.Connection, lc: Logger):
+    """
+    Create the store table of the current schema version, moving the objects of the version 1
+    store table to it if any, within a single transaction
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
+    with conn:
+        # the DDL statements don't implicitly begin a transaction
+        conn.execute("BEGIN")
+        legacy = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'store'").fetchone()
+        if legacy is not None:
+            conn.execute("ALTER TABLE store RENAME TO store_v1")
+        conn.execute(CREATE_TABLE)
+        conn.execute(CREATE_INDEX)
+        if legacy is not None:
+            cur = conn.execute("SELECT created, content FROM store_v1 ORDER BY rowid")
+            migrated = 0
+            while rows := cur.fetchmany(MIGRATION_BATCH_SIZE):
+                conn.executemany(INSERT, [insert_params(decode_content(row['content']),
+                                                        row['created']) for row in rows])
+                migrated += len(rows)
+            conn.execute("DROP TABLE store_v1")
+            lc.info("migrated %d stored objects to the store schema version %d",
+                    migrated, SCHEMA_VERSION)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def insert_params(o: StoredObject, created: float) -> tuple:
+    """ Returns the parameters of the INSERT statement of the stored object """
+    return (int(created), o.id, o.appServiceKey, o.pipelineId, o.pipelinePosition, o.version,
+            o.correlationID, o.retryCount, o.nextRetryAt,
+            json.dumps(convert_any_to_dict(o.contextData)), o.payload)
+
+
+def update_params(o: StoredObject) -> tuple:
+    """ Returns the parameters of the UPDATE statement of the stored object """
+    return (o.pipelineId, o.pipelinePosition, o.version, o.correlationID, o.retryCount,
+            o.nextRetryAt, json.dumps(convert_any_to_dict(o.contextData)), o.payload, o.id)
+
+
+def row_to_object(row: sqlite3.Row) -> StoredObject:
+    """ Returns the stored object of the row of the store table """
+    return StoredObject(
+        id=row['id'],
+        appServiceKey=row['app_service_key'],
+        pipelineId=row['pipeline_id'],
+        pipelinePosition=row['position'],
+        version=row['version'],
+        correlationID=row['correlation_id'],
+        retryCount=row['retry_count'],
+        nextRetryAt=row['next_retry_at'],
+        contextData=json.loads(row['context_data']),
+        payload=row['payload'])
+
+
+def decode_content(content: str) -> StoredObject:
+    """ Decode the stored object from the JSON content of its version 1 row """
+    obj = StoredObject(**json.loads(content))
+    if is_base64(obj.payload):
+        # convert base64 back to bytes
+        obj.payload = base64.b64decode(obj.payload)
+    return obj
+
+
 def is_base64(s):
     """ Checker whether the string is valid base64 format """
     try:
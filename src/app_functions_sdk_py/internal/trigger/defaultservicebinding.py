@@ -22,16 +22,26 @@ Example:
                                                    pipeline_runtime)
     message_processor = DefaultTriggerMessageProcessor(service_binding)
 """
+import concurrent.futures
+import functools
 import threading
-from typing import Any
+from typing import Any, Callable, NamedTuple, Optional
 
+import isodate
+from isodate import ISO8601Error
 from pyformance import meters
 
 from .messageprocessor import MessageProcessor, PipelineResponseHandler
+from .microbatch import MicroBatcher, BatchItem, DEFAULT_MAX_WAIT
 from .servicebinding import ServiceBinding
+from .sharding import ShardedDispatcher, new_shard_key_func, SHARD_KEY_DEVICE_NAME
+from .workerpool import WorkerPool, OVERFLOW_POLICY_BLOCK
 from ..common.config import ConfigurationStruct
-from ..constants import MESSAGES_RECEIVED_NAME, INVALID_MESSAGES_RECEIVED_NAME
-from ..runtime import FunctionsPipelineRuntime
+from ..constants import (MESSAGES_RECEIVED_NAME, INVALID_MESSAGES_RECEIVED_NAME,
+                         PIPELINE_WORKER_QUEUE_DEPTH_NAME, PIPELINE_WORKER_REJECTIONS_NAME,
+                         PIPELINE_SHARD_QUEUE_DEPTH_NAME, SHARD_ID_TXT)
+from ..runtime import FunctionsPipelineRuntime, MessageError
+from ..runtime.asyncexec import DEFAULT_MAX_ASYNC_IN_FLIGHT
 from ...bootstrap.container.messaging import messaging_client_from
 from ...bootstrap.container.secret import secret_provider_from
 from ...bootstrap.interface.metrics import MetricsManager
@@ -41,7 +51,51 @@ from ...contracts import errors
 from ...functions.context import Context
 from ...interfaces import FunctionPipeline, AppFunctionContext, ApplicationService
 from ...interfaces.messaging import MessageClient, MessageEnvelope
-from ...sync.waitgroup import WaitGroup
+
+WORKER_POOL_STOP_TIMEOUT = 10
+
+
+class _PendingPipelines:
+    """
+    Counts the pipeline executions of a received message that have yet to complete, calling
+    on_processed once the last of them has completed or been discarded. The count starts at one
+    for the dispatch of the message itself, so that on_processed is not called before the
+    message has been passed to all of its pipelines.
+    """
+    def __init__(self, on_processed: Optional[Callable[[], Any]]):
+        self._lock = threading.Lock()
+        self._count = 1
+        self._on_processed = on_processed
+
+    def add(self):
+        """ add counts a pipeline execution the message has been passed to. """
+        with self._lock:
+            self._count += 1
+
+    def done(self):
+        """ done marks a pipeline execution, or the dispatch, of the message as complete. """
+        with self._lock:
+            self._count -= 1
+            processed = self._count == 0
+        if processed and self._on_processed is not None:
+            self._on_processed()
+
+
+class _ReceivedMessage(NamedTuple):
+    """ A message received by the trigger, passed to each of the pipelines it matches. """
+    ctx: AppFunctionContext
+    envelope: MessageEnvelope
+    data: Any
+    output_handler: Optional[PipelineResponseHandler]
+    pending: _PendingPipelines
+
+
+class _PipelineExecution(NamedTuple):
+    """ The execution of a pipeline for a message completing on a future. """
+    pipeline: FunctionPipeline
+    ctx: AppFunctionContext
+    timing: Any
+    in_flight: Optional[threading.BoundedSemaphore]
 
 
 class DefaultTriggerServiceBinding(ServiceBinding):
@@ -60,6 +114,10 @@ class DefaultTriggerServiceBinding(ServiceBinding):
                         processed.
         process_message: Provides access to the runtime's ProcessMessage function to process the
                          decoded data.
+        submit_message: Schedules the processing of the decoded data by an async pipeline on the
+                        runtime's event loop.
+        process_batch: Provides access to the runtime's process_batch function to process the
+                       decoded data of a micro-batch of messages.
         logger: Provides access to this service's logger.
         config: Provides access to this service's configuration.
         messaging_client: Provides access to this service's messaging client.
@@ -84,7 +142,23 @@ class DefaultTriggerServiceBinding(ServiceBinding):
         provides access to the runtime's ProcessMessage function to process the
         decoded data
         """
-        self._runtime.process_message(ctx, data, pipeline)
+        return self._runtime.process_message(ctx, data, pipeline)
+
+    def submit_message(self, ctx: AppFunctionContext, data: Any,
+                       pipeline: FunctionPipeline) -> concurrent.futures.Future:
+        """
+        provides access to the runtime's submit_message function to process the decoded data
+        with an async pipeline on the runtime's event loop
+        """
+        return self._runtime.submit_message(ctx, data, pipeline)
+
+    def process_batch(self, ctxs: list[AppFunctionContext], data: list[Any],
+                      pipeline: FunctionPipeline) -> list[MessageError | None]:
+        """
+        provides access to the runtime's process_batch function to process the decoded data of
+        a micro-batch of messages
+        """
+        return self._runtime.process_batch(ctxs, data, pipeline)
 
     def logger(self) -> Logger:
         """
@@ -143,6 +217,15 @@ class DefaultTriggerMessageProcessor(MessageProcessor):
     Attributes:
         service_binding (ServiceBinding): The service binding instance for managing configuration,
                                           messaging client, and runtime.
+        worker_pool (WorkerPool): The pool of workers executing the matching pipelines, sized per
+                                  the Trigger.WorkerPool configuration.
+        micro_batcher (Optional[MicroBatcher]): Collects the messages of the pipelines without
+                                                async functions into micro-batches, if enabled
+                                                per the Trigger.MicroBatch configuration.
+        sharded_dispatcher (Optional[ShardedDispatcher]): Executes the pipelines without async
+                                                          functions in order per the shard key of
+                                                          the messages, if enabled per the
+                                                          Trigger.Sharding configuration.
 
     Methods:
         __init__: Initializes the DefaultTriggerMessageProcessor with the given service binding.
@@ -150,6 +233,8 @@ class DefaultTriggerMessageProcessor(MessageProcessor):
                           appropriate pipelines.
         received_invalid_message: Handles the event when an invalid message is received, allowing
                                   for metrics counter increment.
+        stop: Dispatches the pending micro-batches and stops the shards and the worker pool once
+              the queued pipeline executions have completed.
     """
     def __init__(self, service_binding: ServiceBinding, metrics_manager: MetricsManager):
         self.service_binding = service_binding
@@ -158,76 +243,255 @@ class DefaultTriggerMessageProcessor(MessageProcessor):
 
         lc = service_binding.logger()
 
+        pool_config = service_binding.config().Trigger.WorkerPool
+        overflow_policy = pool_config.OverflowPolicy or OVERFLOW_POLICY_BLOCK
         try:
-            metrics_manager.register(MESSAGES_RECEIVED_NAME, self.messages_received, None)
-            lc.info("%s metric has been registered and will be reported", MESSAGES_RECEIVED_NAME)
-        except errors.EdgeX as e:
-            lc.warn("%s metric failed to register and will not be reported: %s",
-                    MESSAGES_RECEIVED_NAME, e)
-
-        try:
-            metrics_manager.register(INVALID_MESSAGES_RECEIVED_NAME,
-                                     self.invalid_messages_received, None)
-            lc.info("%s metric has been registered and will be reported (if enabled)",
-                    INVALID_MESSAGES_RECEIVED_NAME)
-        except errors.EdgeX as e:
-            lc.warn("%s metric failed to register and will not be reported: %s",
-                    INVALID_MESSAGES_RECEIVED_NAME, e)
+            self.worker_pool = WorkerPool(lc, pool_config.MaxWorkers, pool_config.QueueSize,
+                                          overflow_policy)
+        except ValueError as e:
+            lc.warn("invalid Trigger.WorkerPool configuration, defaulting to '%s' overflow "
+                    "policy: %s", OVERFLOW_POLICY_BLOCK, e)
+            self.worker_pool = WorkerPool(lc, pool_config.MaxWorkers, pool_config.QueueSize)
+        lc.info("pipeline worker pool configured with %d max workers and '%s' overflow policy",
+                self.worker_pool.max_workers, self.worker_pool.overflow_policy)
+
+        self._async_in_flight = threading.BoundedSemaphore(
+            pool_config.MaxAsyncInFlight if pool_config.MaxAsyncInFlight > 0
+            else DEFAULT_MAX_ASYNC_IN_FLIGHT)
+
+        self.micro_batcher = self._new_micro_batcher(lc, service_binding.config())
+        self.sharded_dispatcher = self._new_sharded_dispatcher(lc, service_binding.config())
+
+        metrics = [(MESSAGES_RECEIVED_NAME, self.messages_received, None),
+                   (INVALID_MESSAGES_RECEIVED_NAME, self.invalid_messages_received, None),
+                   (PIPELINE_WORKER_QUEUE_DEPTH_NAME, self.worker_pool.queue_depth, None),
+                   (PIPELINE_WORKER_REJECTIONS_NAME, self.worker_pool.rejected, None)]
+        shards = self.sharded_dispatcher.shards if self.sharded_dispatcher is not None else []
+        metrics.extend((PIPELINE_SHARD_QUEUE_DEPTH_NAME.replace(SHARD_ID_TXT, str(index), 1),
+                        shard.queue_depth, {"shard": str(index)})
+                       for index, shard in enumerate(shards))
+        for metric_name, metric, tags in metrics:
+            try:
+                metrics_manager.register(metric_name, metric, tags)
+                lc.info("%s metric has been registered and will be reported (if enabled)",
+                        metric_name)
+            except errors.EdgeX as e:
+                lc.warn("%s metric failed to register and will not be reported: %s",
+                        metric_name, e)
 
     def message_received(self, ctx: AppFunctionContext,
                          envelope: MessageEnvelope,
-                         output_handler: PipelineResponseHandler):
+                         output_handler: PipelineResponseHandler,
+                         on_processed: Optional[Callable[[], Any]] = None):
         """
         message_received provides runtime orchestration to pass the envelope to configured
-        pipeline(s)
+        pipeline(s), calling on_processed once their executions have completed or been discarded
         """
         self.messages_received.inc(1)
-        # pylint: disable=broad-exception-caught
+        pending = _PendingPipelines(on_processed)
+        try:
+            self._dispatch_message(ctx, envelope, output_handler, pending)
+        finally:
+            pending.done()
+
+    def _dispatch_message(self, ctx: AppFunctionContext, envelope: MessageEnvelope,
+                          output_handler: PipelineResponseHandler, pending: _PendingPipelines):
         lc = self.service_binding.logger()
-        lc.debug(f"trigger attempting to find pipeline(s) for topic '{envelope.receivedTopic}'")
+        lc.debug("trigger attempting to find pipeline(s) for topic '%s'", envelope.receivedTopic)
         if not isinstance(ctx, Context):
             ctx = self.service_binding.build_context(envelope)
 
         pipelines = self.service_binding.get_matching_pipelines(envelope.receivedTopic)
-        lc.debug(f"trigger found {len(pipelines)} pipeline(s) that match the incoming topic "
-                 f"'{envelope.receivedTopic}'")
+        lc.debug("trigger found %d pipeline(s) that match the incoming topic '%s'",
+                 len(pipelines), envelope.receivedTopic)
         if not pipelines:
             return
 
-        def pipeline_process_message(function_pipeline: FunctionPipeline,
-                                     wait_group: WaitGroup,
-                                     data: Any):
-            with function_pipeline.message_processing_time.time():
-                lc.debug(f"trigger sending message to pipeline {function_pipeline.id} for "
-                         f"envelope {envelope.correlationID}")
-                try:
-                    self.service_binding.process_message(ctx.clone(), data, function_pipeline)
-                except Exception as ex:
-                    lc.error(f"error processing message in pipeline {function_pipeline.id} for "
-                             f"envelope {envelope.correlationID}: {ex}")
-                else:
-                    if output_handler is not None:
-                        try:
-                            output_handler(ctx, function_pipeline)
-                        except Exception as ex:
-                            lc.error(f"failed to process output for message {ctx.correlation_id()}"
-                                     f" on pipeline {function_pipeline.id} : {ex}")
-                finally:
-                    wait_group.done()
-
-        pipeline_wg = WaitGroup()
-
         try:
-            target_data = self.service_binding.decode_message(ctx, envelope)
+            message = _ReceivedMessage(ctx, envelope,
+                                       self.service_binding.decode_message(ctx, envelope),
+                                       output_handler, pending)
+            shard_key = self.sharded_dispatcher.message_key(ctx, envelope) \
+                if self.sharded_dispatcher is not None else None
             for pipeline in pipelines:
-                pipeline_wg.add(1)
+                pending.add()
                 pipeline.message_processed.inc(1)
-                threading.Thread(target=pipeline_process_message,
-                                 args=(pipeline, pipeline_wg, target_data)).start()
-        except Exception as e:
+                if pipeline.is_async:
+                    self._submit_message(message, pipeline)
+                    continue
+                if shard_key is not None:
+                    self.sharded_dispatcher.submit(
+                        shard_key, self._process_message, message, pipeline,
+                        on_discard=functools.partial(self._message_discarded, message, pipeline))
+                    continue
+                if self.micro_batcher is not None:
+                    self._batch_message(message, pipeline)
+                    continue
+                self.worker_pool.submit(
+                    self._process_message, message, pipeline,
+                    on_discard=functools.partial(self._message_discarded, message, pipeline))
+        except Exception as e:  # pylint: disable=broad-exception-caught
             self.invalid_messages_received.inc(1)
             lc.error(f"failed to decode message: {e}")
 
+    def _process_message(self, message: "_ReceivedMessage", pipeline: FunctionPipeline):
+        lc = self.service_binding.logger()
+        with pipeline.message_processing_time.time():
+            lc.debug("trigger sending message to pipeline %s for envelope %s",
+                     pipeline.id, message.envelope.correlationID)
+            # the response data is set on the context the pipeline is executed with
+            pipeline_ctx = message.ctx.clone()
+            try:
+                self.service_binding.process_message(pipeline_ctx, message.data, pipeline)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                lc.error(f"error processing message in pipeline {pipeline.id} for "
+                         f"envelope {message.envelope.correlationID}: {ex}")
+            else:
+                self._handle_output(message, pipeline, pipeline_ctx)
+            finally:
+                message.pending.done()
+
+    def _handle_output(self, message: "_ReceivedMessage", pipeline: FunctionPipeline,
+                       pipeline_ctx: AppFunctionContext):
+        if message.output_handler is None:
+            return
+        try:
+            message.output_handler(pipeline_ctx, pipeline)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.service_binding.logger().error(
+                f"failed to process output for message {message.ctx.correlation_id()}"
+                f" on pipeline {pipeline.id} : {ex}")
+
+    def _message_discarded(self, message: "_ReceivedMessage", pipeline: FunctionPipeline):
+        self.service_binding.logger().error(
+            f"pipeline worker pool is saturated, message for envelope "
+            f"{message.envelope.correlationID} discarded from pipeline {pipeline.id}")
+        message.pending.done()
+
+    def _message_processed(self, message: "_ReceivedMessage", execution: "_PipelineExecution",
+                           future: concurrent.futures.Future):
+        lc = self.service_binding.logger()
+        try:
+            if future.cancelled():
+                lc.error(f"pipeline worker pool is saturated, message for envelope "
+                         f"{message.envelope.correlationID} discarded from pipeline "
+                         f"{execution.pipeline.id}")
+                return
+            future.result()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            lc.error(f"error processing message in pipeline {execution.pipeline.id} for "
+                     f"envelope {message.envelope.correlationID}: {ex}")
+        else:
+            self._handle_output(message, execution.pipeline, execution.ctx)
+        finally:
+            execution.timing.stop()
+            if execution.in_flight is not None:
+                execution.in_flight.release()
+            message.pending.done()
+
+    def _submit_message(self, message: "_ReceivedMessage", pipeline: FunctionPipeline):
+        lc = self.service_binding.logger()
+        # async pipelines are awaited on the runtime's event loop rather than holding a
+        # worker, so the number in flight is bounded here instead of by the worker pool. The
+        # slot is released by _message_processed once the execution completes.
+        blocking = self.worker_pool.overflow_policy == OVERFLOW_POLICY_BLOCK
+        if not self._async_in_flight.acquire(  # pylint: disable=consider-using-with
+                blocking=blocking):
+            self.worker_pool.rejected.inc(1)
+            self._message_discarded(message, pipeline)
+            return
+
+        timing = pipeline.message_processing_time.time()
+        lc.debug("trigger sending message to async pipeline %s for envelope %s",
+                 pipeline.id, message.envelope.correlationID)
+        pipeline_ctx = message.ctx.clone()
+        try:
+            future = self.service_binding.submit_message(pipeline_ctx, message.data, pipeline)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            lc.error(f"error processing message in pipeline {pipeline.id} for "
+                     f"envelope {message.envelope.correlationID}: {ex}")
+            timing.stop()
+            self._async_in_flight.release()
+            message.pending.done()
+            return
+        future.add_done_callback(functools.partial(
+            self._message_processed, message,
+            _PipelineExecution(pipeline, pipeline_ctx, timing, self._async_in_flight)))
+
+    def _batch_message(self, message: "_ReceivedMessage", pipeline: FunctionPipeline):
+        lc = self.service_binding.logger()
+        timing = pipeline.message_processing_time.time()
+        lc.debug("trigger adding message to micro-batch of pipeline %s for envelope %s",
+                 pipeline.id, message.envelope.correlationID)
+        pipeline_ctx = message.ctx.clone()
+        try:
+            future = self.micro_batcher.add(pipeline, pipeline_ctx, message.data)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            lc.error(f"error processing message in pipeline {pipeline.id} for "
+                     f"envelope {message.envelope.correlationID}: {ex}")
+            timing.stop()
+            message.pending.done()
+            return
+        future.add_done_callback(functools.partial(
+            self._message_processed, message,
+            _PipelineExecution(pipeline, pipeline_ctx, timing, None)))
+
+    def _new_micro_batcher(self, lc: Logger,
+                           config: ConfigurationStruct) -> Optional[MicroBatcher]:
+        batch_config = config.Trigger.MicroBatch
+        if batch_config.MaxSize <= 1:
+            return None
+
+        max_wait = batch_config.MaxWait or DEFAULT_MAX_WAIT
+        try:
+            max_wait_seconds = isodate.parse_duration("PT" + max_wait.upper()).total_seconds()
+        except ISO8601Error as e:
+            lc.warn("invalid Trigger.MicroBatch.MaxWait value '%s', defaulting to '%s': %s",
+                    max_wait, DEFAULT_MAX_WAIT, e)
+            max_wait = DEFAULT_MAX_WAIT
+            max_wait_seconds = isodate.parse_duration("PT" + max_wait.upper()).total_seconds()
+        lc.info("pipelines executing micro-batches of up to %d messages collected for up to %s",
+                batch_config.MaxSize, max_wait)
+        return MicroBatcher(lc, batch_config.MaxSize, max_wait_seconds, self._dispatch_batch)
+
+    def _new_sharded_dispatcher(self, lc: Logger,
+                                config: ConfigurationStruct) -> Optional[ShardedDispatcher]:
+        sharding_config = config.Trigger.Sharding
+        if sharding_config.Shards <= 0:
+            return None
+
+        try:
+            shard_key = new_shard_key_func(sharding_config.ShardKey, sharding_config.TopicLevel)
+        except ValueError as e:
+            raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
+                                          f"invalid Trigger.Sharding configuration: {e}")
+        lc.info("pipelines executing in order per '%s' key on %d shards",
+                sharding_config.ShardKey or SHARD_KEY_DEVICE_NAME, sharding_config.Shards)
+        return ShardedDispatcher(lc, sharding_config.Shards, sharding_config.QueueSize,
+                                 self.worker_pool.overflow_policy, shard_key)
+
+    def _dispatch_batch(self, pipeline: FunctionPipeline, items: list[BatchItem]):
+        """
+        queues the execution of the micro-batch on the worker pool. The futures of the messages
+        are cancelled if the overflow policy discards the batch.
+        """
+        def discard():
+            for item in items:
+                item.future.cancel()
+
+        self.worker_pool.submit(self._execute_batch, pipeline, items, on_discard=discard)
+
+    def _execute_batch(self, pipeline: FunctionPipeline, items: list[BatchItem]):
+        try:
+            message_errors = self.service_binding.process_batch(
+                [item.ctx for item in items], [item.data for item in items], pipeline)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for item in items:
+                item.future.set_exception(e)
+            return
+        for item, message_error in zip(items, message_errors):
+            item.future.set_result(message_error)
+
     def received_invalid_message(self):
         """
         ReceivedInvalidMessage is called when an invalid message is received so the metrics counter
@@ -237,3 +501,15 @@ class DefaultTriggerMessageProcessor(MessageProcessor):
         self.invalid_messages_received.inc(1)
         lc = self.service_binding.logger()
         lc.warn("received invalid message")
+
+    def stop(self):
+        """
+        stop dispatches the pending micro-batches, refuses further messages and waits, up to
+        WORKER_POOL_STOP_TIMEOUT seconds, for the pipeline executions already queued on the
+        shards and the worker pool to complete.
+        """
+        if self.micro_batcher is not None:
+            self.micro_batcher.stop()
+        if self.sharded_dispatcher is not None:
+            self.sharded_dispatcher.stop(WORKER_POOL_STOP_TIMEOUT)
+        self.worker_pool.stop(WORKER_POOL_STOP_TIMEOUT)
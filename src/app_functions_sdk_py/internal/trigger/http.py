@@ -6,27 +6,51 @@ This module provides the `HttpTrigger` class, which implements the `Trigger` abs
 allowing the pipeline to be triggered by a RESTful POST call to
 http://[host]:[port]/api/v3/trigger/.
 
+By default the pipeline of each request is executed on a bounded pool of worker threads and
+awaited, so a slow pipeline doesn't block the other requests served by the web server, such as
+the ping health checks. Requests received once the configured max concurrency is reached are
+rejected with 503 and a Retry-After header, and requests whose pipeline doesn't complete within
+Service.RequestTimeout are answered with 504.
+
 Classes:
     - HttpTrigger: Handles HTTP requests and processes messages using the provided service binding
     and message processor.
 """
 
+import asyncio
+import concurrent.futures
+import math
 import threading
 from http import HTTPStatus
 from typing import Optional
 
+import isodate
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import PlainTextResponse
+from isodate import ISO8601Error
 
 from .messageprocessor import MessageProcessor
 from .servicebinding import ServiceBinding
+from ..common.config import HttpTriggerConfig
 from ..constants import API_TRIGGER_ROUTE
+from ..runtime import MessageError
+from ...contracts import errors
 from ...contracts.clients.utils.request import HTTPMethod
 from ...contracts.common.constants import CONTENT_TYPE, CORRELATION_HEADER
-from ...interfaces import Trigger, Deferred, MessageEnvelope
+from ...interfaces import Trigger, Deferred, MessageEnvelope, AppFunctionContext, FunctionPipeline
 from ...sync.waitgroup import WaitGroup
 
+EXECUTION_MODE_EXECUTOR = "executor"
+EXECUTION_MODE_INLINE = "inline"
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_RETRY_AFTER = "1s"
+
+RETRY_AFTER_HEADER = "Retry-After"
+EXECUTOR_THREAD_PREFIX = "http-trigger"
+
 
+# pylint: disable=too-many-instance-attributes
 class HttpTrigger(Trigger):
     """
     Represents a HTTP trigger.
@@ -38,6 +62,10 @@ class HttpTrigger(Trigger):
         self.router = router
         self.done = None
         self.waiting_group = None
+        self.executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.in_flight: Optional[threading.BoundedSemaphore] = None
+        self.request_timeout: Optional[float] = None
+        self.retry_after = "1"
 
     def initialize(self, ctx_done: threading.Event, app_wg: WaitGroup) -> Optional[Deferred]:
         """
@@ -46,10 +74,63 @@ class HttpTrigger(Trigger):
         lc = self.service_binding.logger()
 
         lc.info("Initializing HTTP trigger")
+        self._initialize_executor(self.service_binding.config().Trigger.Http)
         self.router.add_api_route(API_TRIGGER_ROUTE, self.request_handler,
                                   methods=[HTTPMethod.POST.value])
         lc.info("HTTP trigger initialized")
 
+        def stop():
+            if self.executor is not None:
+                lc.info("Stopping HTTP trigger executor")
+                self.executor.shutdown(wait=True, cancel_futures=True)
+
+        return stop
+
+    def _initialize_executor(self, http_config: HttpTriggerConfig):
+        """
+        _initialize_executor creates the bounded pool of workers executing the pipelines of the
+        requests, unless the inline execution mode is configured
+        """
+        lc = self.service_binding.logger()
+
+        execution_mode = http_config.ExecutionMode.strip().lower() or EXECUTION_MODE_EXECUTOR
+        if execution_mode not in (EXECUTION_MODE_EXECUTOR, EXECUTION_MODE_INLINE):
+            raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
+                                          f"invalid ExecutionMode value "
+                                          f"'{http_config.ExecutionMode}', must be "
+                                          f"'{EXECUTION_MODE_EXECUTOR}' or "
+                                          f"'{EXECUTION_MODE_INLINE}'")
+        if execution_mode == EXECUTION_MODE_INLINE:
+            lc.info("HTTP Trigger executing the pipelines inline")
+            return
+
+        if http_config.MaxConcurrency <= 0:
+            http_config.MaxConcurrency = DEFAULT_MAX_CONCURRENCY
+
+        retry_after = http_config.RetryAfter or DEFAULT_RETRY_AFTER
+        try:
+            self.retry_after = str(math.ceil(
+                isodate.parse_duration("PT" + retry_after.upper()).total_seconds()))
+        except ISO8601Error as e:
+            raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
+                                          f"invalid RetryAfter value '{retry_after}': {e}")
+
+        request_timeout = self.service_binding.config().Service.RequestTimeout
+        if len(request_timeout) > 0:
+            try:
+                self.request_timeout = isodate.parse_duration(
+                    "PT" + request_timeout.upper()).total_seconds()
+            except ISO8601Error as e:
+                lc.warn("invalid Service.RequestTimeout value '%s', HTTP Trigger requests will "
+                        "not time out: %s", request_timeout, e)
+
+        self.in_flight = threading.BoundedSemaphore(http_config.MaxConcurrency)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=http_config.MaxConcurrency, thread_name_prefix=EXECUTOR_THREAD_PREFIX)
+
+        lc.info("HTTP Trigger executing the pipelines with %d max concurrency and %s seconds "
+                "deadline", http_config.MaxConcurrency, self.request_timeout)
+
     async def request_handler(self, request: Request) -> Response:
         """
         Handles incoming HTTP requests and processes the message using the provided service binding
@@ -59,13 +140,13 @@ class HttpTrigger(Trigger):
 
         body = await request.body()
 
-        lc.debug(f"Request Body read, byte count: {len(body)}")
+        lc.debug("Request Body read, byte count: %d", len(body))
 
         content_type = request.headers.get(CONTENT_TYPE, "")
         correlation_id = request.headers.get(CORRELATION_HEADER, "")
 
-        lc.trace(f"Received message from http, X-Correlation-ID: {correlation_id}")
-        lc.debug(f"Received message from http, Content-Type: {content_type}")
+        lc.trace("Received message from http, X-Correlation-ID: %s", correlation_id)
+        lc.debug("Received message from http, Content-Type: %s", content_type)
 
         envelope = MessageEnvelope(
             correlationID=correlation_id,
@@ -76,15 +157,33 @@ class HttpTrigger(Trigger):
 
         default_pipeline = self.service_binding.get_default_pipeline()
         try:
-            target_data = self.service_binding.decode_message(app_context, envelope)
+            if self.executor is None:
+                message_error = await self._process_inline(app_context, envelope,
+                                                           default_pipeline)
+            else:
+                # the slot is owned by _process_in_executor, which releases it once the message
+                # is processed rather than when the request completes
+                if not self.in_flight.acquire(  # pylint: disable=consider-using-with
+                        blocking=False):
+                    lc.warn(f"HTTP Trigger max concurrency reached, rejecting request "
+                            f"({CORRELATION_HEADER}={correlation_id})")
+                    return PlainTextResponse(status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                                             content="too many requests in progress",
+                                             headers={RETRY_AFTER_HEADER: self.retry_after})
+                message_error = await self._process_in_executor(app_context, envelope,
+                                                                default_pipeline)
         except (ValueError, TypeError) as e:
             return PlainTextResponse(status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                                      content=f"failed to decode message: {e}")
+        except asyncio.TimeoutError:
+            lc.error(f"HTTP Trigger request deadline of {self.request_timeout} seconds exceeded "
+                     f"({CORRELATION_HEADER}={correlation_id})")
+            return PlainTextResponse(status_code=HTTPStatus.GATEWAY_TIMEOUT,
+                                     content="failed to process message before the request "
+                                             "deadline")
 
-        message_error = self.service_binding.process_message(
-            app_context, target_data, default_pipeline)
         if message_error is not None:
-            return PlainTextResponse(status_code=message_error.code,
+            return PlainTextResponse(status_code=message_error.err_code,
                                      content=f"failed to process message: {message_error.err}")
 
         response_content_type = app_context.response_content_type()
@@ -94,6 +193,44 @@ class HttpTrigger(Trigger):
         if response_content_type is not None and len(response_content_type) > 0:
             response.headers[CONTENT_TYPE] = response_content_type
         if response_data:
-            lc.trace(f"Sent http response message, X-Correlation-ID: {correlation_id}")
+            lc.trace("Sent http response message, X-Correlation-ID: %s", correlation_id)
 
         return response
+
+    async def _process_inline(self, app_context: AppFunctionContext, envelope: MessageEnvelope,
+                              pipeline: FunctionPipeline) -> Optional[MessageError]:
+        target_data = self.service_binding.decode_message(app_context, envelope)
+        if pipeline.is_async:
+            # await the pipeline on the runtime's event loop rather than blocking this one
+            return await asyncio.wrap_future(self.service_binding.submit_message(
+                app_context, target_data, pipeline))
+        return self.service_binding.process_message(app_context, target_data, pipeline)
+
+    async def _process_in_executor(self, app_context: AppFunctionContext,
+                                   envelope: MessageEnvelope,
+                                   pipeline: FunctionPipeline) -> Optional[MessageError]:
+        """
+        executes the pipeline off the event loop of the web server and waits up to the request
+        timeout for its result. The in-flight slot acquired by the caller is released once the
+        pipeline completes, even when the request has already timed out.
+        """
+        try:
+            if pipeline.is_async:
+                target_data = self.service_binding.decode_message(app_context, envelope)
+                future = self.service_binding.submit_message(app_context, target_data, pipeline)
+            else:
+                future = self.executor.submit(self._process, app_context, envelope, pipeline)
+        except BaseException:
+            self.in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self.in_flight.release())
+
+        # shield the pipeline so it isn't cancelled when the deadline is exceeded, as the
+        # worker thread executing it can't be interrupted anyway
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)),
+                                      self.request_timeout)
+
+    def _process(self, app_context: AppFunctionContext, envelope: MessageEnvelope,
+                 pipeline: FunctionPipeline) -> Optional[MessageError]:
+        target_data = self.service_binding.decode_message(app_context, envelope)
+        return self.service_binding.process_message(app_context, target_data, pipeline)
@@ -183,9 +183,9 @@ class MessageBusTrigger(Trigger):
                                                     f"topic '{publish_topic}' for pipeline "
                                                     f"'{pipeline.id}': {e}")
                 return
-            self.service_binding.logger().debug(f"MessageBus trigger: published response message "
-                                                f"for pipeline '{pipeline.id}' on topic "
-                                                f"'{publish_topic}' with {len(ctx.response_data())}"
-                                                f" bytes")
-            self.service_binding.logger().trace(f"MessageBus trigger published message: "
-                                                f"{CORRELATION_HEADER}={ctx.correlation_id()}")
+            self.service_binding.logger().debug("MessageBus trigger: published response message "
+                                                "for pipeline '%s' on topic '%s' with %d bytes",
+                                                pipeline.id, publish_topic,
+                                                len(ctx.response_data()))
+            self.service_binding.logger().trace("MessageBus trigger published message: %s=%s",
+                                                CORRELATION_HEADER, ctx.correlation_id())
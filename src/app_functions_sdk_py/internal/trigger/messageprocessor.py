@@ -15,7 +15,8 @@ Usage:
 Example:
     class MyMessageProcessor(MessageProcessor):
         def message_received(self, ctx: AppFunctionContext, envelope: MessageEnvelope,
-                             output_handler: PipelineResponseHandler):
+                             output_handler: PipelineResponseHandler,
+                             on_processed: Optional[Callable[[], Any]] = None):
             # Implementation here
             pass
 
@@ -24,7 +25,7 @@ Example:
             pass
 """
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Any, Callable, Optional
 
 from ...interfaces import FunctionPipeline, AppFunctionContext
 from ...interfaces.messaging import MessageEnvelope
@@ -40,10 +41,13 @@ class MessageProcessor(ABC):
     @abstractmethod
     def message_received(self, ctx: AppFunctionContext,
                          envelope: MessageEnvelope,
-                         output_handler: PipelineResponseHandler):
+                         output_handler: PipelineResponseHandler,
+                         on_processed: Optional[Callable[[], Any]] = None):
         """
         message_received provides runtime orchestration to pass the envelope to configured
-        pipeline(s)
+        pipeline(s). The pipelines may still be executing once it returns; on_processed, if
+        given, is called once the executions of all the pipelines for the message have completed
+        or been discarded, or once the message is found to match none or fails to be decoded.
         """
 
     @abstractmethod
@@ -0,0 +1,144 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+This module provides the `MicroBatcher` class, which collects the messages received for each
+function pipeline into micro-batches, so that the pipeline executes once per batch rather than
+once per message.
+
+Classes:
+    - BatchItem: A message of a micro-batch, along with the future resolved with its outcome.
+    - MicroBatcher: Collects the messages per pipeline and dispatches a batch once it holds
+    max_size messages or its first message has waited max_wait seconds.
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from ...contracts.clients.logger import Logger
+from ...interfaces import AppFunctionContext, FunctionPipeline
+
+DEFAULT_MAX_WAIT = "0.01s"
+
+FLUSHER_THREAD_NAME = "micro-batch-flusher"
+
+
+class BatchItem(NamedTuple):
+    """ A message of a micro-batch, along with the future resolved with its MessageError. """
+    ctx: AppFunctionContext
+    data: Any
+    future: concurrent.futures.Future
+
+
+class _Batch(NamedTuple):
+    pipeline: FunctionPipeline
+    items: List[BatchItem]
+    deadline: float
+
+
+class MicroBatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    MicroBatcher collects the messages received for each pipeline and hands each batch to the
+    dispatch callable once it holds max_size messages, from the thread adding the last message,
+    or once its first message has waited max_wait seconds, from a flusher thread started on
+    first use. dispatch is responsible for resolving the future of every item of the batch.
+    """
+
+    def __init__(self, lc: Logger, max_size: int, max_wait: float,
+                 dispatch: Callable[[FunctionPipeline, List[BatchItem]], Any]):
+        self._lc = lc
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._dispatch = dispatch
+        self._cond = threading.Condition()
+        self._batches: dict[FunctionPipeline, _Batch] = {}
+        self._flusher: Optional[threading.Thread] = None
+        self._stopped = False
+
+    @property
+    def max_size(self) -> int:
+        """ Returns the maximum number of messages of a batch. """
+        return self._max_size
+
+    @property
+    def max_wait(self) -> float:
+        """ Returns the maximum number of seconds a message waits for its batch to fill. """
+        return self._max_wait
+
+    def add(self, pipeline: FunctionPipeline, ctx: AppFunctionContext,
+            data: Any) -> concurrent.futures.Future:
+        """
+        add appends the message to the pending batch of the pipeline and returns a future
+        resolved with the MessageError of the message, if any, once its batch is executed.
+        Raises RuntimeError if the batcher is stopped.
+        """
+        future = concurrent.futures.Future()
+        full = None
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("micro-batcher is stopped")
+            batch = self._batches.get(pipeline)
+            if batch is None:
+                batch = _Batch(pipeline, [], time.monotonic() + self._max_wait)
+                self._batches[pipeline] = batch
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._run_flusher,
+                                                     name=FLUSHER_THREAD_NAME, daemon=True)
+                    self._flusher.start()
+                self._cond.notify()
+            batch.items.append(BatchItem(ctx, data, future))
+            if len(batch.items) >= self._max_size:
+                full = self._batches.pop(pipeline)
+
+        if full is not None:
+            self._dispatch_batch(full)
+        return future
+
+    def stop(self):
+        """
+        stop refuses any further message and dispatches the batches still pending
+        """
+        with self._cond:
+            if self._stopped:
+                return
+            self._stopped = True
+            pending = list(self._batches.values())
+            self._batches.clear()
+            flusher = self._flusher
+            self._cond.notify()
+
+        for batch in pending:
+            self._dispatch_batch(batch)
+        if flusher is not None:
+            flusher.join()
+
+    def _run_flusher(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    expired = [batch for batch in self._batches.values() if batch.deadline <= now]
+                    if expired:
+                        for batch in expired:
+                            del self._batches[batch.pipeline]
+                        break
+                    timeout = None
+                    if self._batches:
+                        timeout = min(batch.deadline for batch in self._batches.values()) - now
+                    self._cond.wait(timeout)
+
+            for batch in expired:
+                self._dispatch_batch(batch)
+
+    def _dispatch_batch(self, batch: _Batch):
+        try:
+            self._dispatch(batch.pipeline, batch.items)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._lc.error(f"failed to dispatch micro-batch of pipeline {batch.pipeline.id}: {e}")
+            for item in batch.items:
+                if not item.future.done():
+                    item.future.set_exception(e)
@@ -6,6 +6,12 @@ This module defines the MQTT trigger for the application functions SDK.
 
 The MQTT trigger is responsible for connecting to an external MQTT broker, subscribing to topics,
 and processing incoming messages. It also handles publishing responses to a specified topic.
+
+Incoming messages are handed from the paho network loop to a bounded pool of workers, which
+decode them and pass them to the pipelines. A message remains in flight until the executions of
+all of its pipelines have completed or been discarded. Once the configured number of in-flight
+messages is reached the trigger either pauses the paho loop, so that unacknowledged QoS 1/2
+messages remain in the broker, or drops the new message.
 """
 
 import threading
@@ -19,6 +25,7 @@ from isodate import ISO8601Error
 import paho.mqtt.client as pahomqtt
 
 from .messageprocessor import MessageProcessor
+from .workerpool import WorkerPool, OVERFLOW_POLICY_BLOCK
 from ..common.config import ExternalMqttConfig
 from ...bootstrap.interface.secret import SecretProvider
 from ...bootstrap.timer import new_timer
@@ -37,6 +44,12 @@ from ...utils.strconv import parse_int
 DEFAULT_RETRY_DURATION = 600
 DEFAULT_RETRY_INTERVAL = 5
 DEFAULT_CONNECT_TIMEOUT = 30
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_IN_FLIGHT = 256
+DISPATCHER_STOP_TIMEOUT = 10
+
+BACKPRESSURE_MODE_PAUSE = "pause"
+BACKPRESSURE_MODE_DROP = "drop"
 
 
 # pylint: disable=too-many-instance-attributes
@@ -54,8 +67,11 @@ class MqttTrigger(Trigger):
         self.publish_topic = None
         self.done = None
         self.waiting_group = None
+        self.dispatcher: Optional[WorkerPool] = None
+        self.in_flight: Optional[threading.BoundedSemaphore] = None
+        self.pause_on_backpressure = True
 
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals, too-many-statements
     def initialize(self, ctx_done: threading.Event, app_wg: WaitGroup) -> Optional[Deferred]:
         """
         Initializes the Trigger for an external MQTT broker
@@ -107,6 +123,8 @@ class MqttTrigger(Trigger):
         if broker_config.RetryInterval <= 0:
             broker_config.RetryInterval = DEFAULT_RETRY_INTERVAL
 
+        self._initialize_dispatcher(broker_config)
+
         mqtt_client_config = MQTTClientConfig(
             broker_address=broker_url.hostname,
             topic=topics,
@@ -152,9 +170,42 @@ class MqttTrigger(Trigger):
         def disconnect():
             lc.info("Disconnecting from broker for MQTT trigger")
             self.mqtt_client.disconnect()
+            self.dispatcher.stop(DISPATCHER_STOP_TIMEOUT)
 
         return disconnect
 
+    def _initialize_dispatcher(self, broker_config: ExternalMqttConfig):
+        """
+        _initialize_dispatcher creates the bounded pool of workers processing the received messages
+        """
+        lc = self.service_binding.logger()
+
+        backpressure_mode = broker_config.BackpressureMode.strip().lower()
+        if len(backpressure_mode) == 0:
+            backpressure_mode = BACKPRESSURE_MODE_PAUSE
+        if backpressure_mode not in (BACKPRESSURE_MODE_PAUSE, BACKPRESSURE_MODE_DROP):
+            raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
+                                          f"invalid BackpressureMode value "
+                                          f"'{broker_config.BackpressureMode}', must be "
+                                          f"'{BACKPRESSURE_MODE_PAUSE}' or "
+                                          f"'{BACKPRESSURE_MODE_DROP}'")
+
+        if broker_config.MaxConcurrency <= 0:
+            broker_config.MaxConcurrency = DEFAULT_MAX_CONCURRENCY
+
+        if broker_config.MaxInFlight <= 0:
+            broker_config.MaxInFlight = DEFAULT_MAX_IN_FLIGHT
+
+        self.pause_on_backpressure = backpressure_mode == BACKPRESSURE_MODE_PAUSE
+        self.in_flight = threading.BoundedSemaphore(broker_config.MaxInFlight)
+        # the in-flight semaphore already bounds the queue, so submitting never blocks or rejects
+        self.dispatcher = WorkerPool(lc, broker_config.MaxConcurrency, broker_config.MaxInFlight,
+                                     OVERFLOW_POLICY_BLOCK)
+
+        lc.info("MQTT Trigger processing messages with %d max concurrency and %d max in-flight "
+                "messages, '%s' once reached", broker_config.MaxConcurrency,
+                broker_config.MaxInFlight, backpressure_mode)
+
     # pylint: disable=unused-argument, too-many-arguments, too-many-positional-arguments
     def on_connect_handler(self, client: pahomqtt.Client, userdata: Any, flags: dict,
                            rc: int, properties):
@@ -202,20 +253,31 @@ class MqttTrigger(Trigger):
         )
 
         lc.debug(
-            f"MQTT Trigger: Received message with {len(msg_envelope.payload)} bytes "
-            f"on topic '{msg_envelope.receivedTopic}'. "
-            f"Content-Type={msg_envelope.contentType}")
-        lc.trace(f"{CORRELATION_HEADER}={correlation_id}")
+            "MQTT Trigger: Received message with %d bytes on topic '%s'. Content-Type=%s",
+            len(msg_envelope.payload), msg_envelope.receivedTopic, msg_envelope.contentType)
+        lc.trace("%s=%s", CORRELATION_HEADER, correlation_id)
 
         ctx = self.service_binding.build_context(msg_envelope)
 
         def process_message():
             try:
-                self.message_processor.message_received(ctx, msg_envelope, self.response_handler)
+                self.message_processor.message_received(ctx, msg_envelope, self.response_handler,
+                                                        on_processed=self.in_flight.release)
             except Exception as e:  # pylint: disable=broad-except
                 lc.error("MQTT Trigger: Failed to process message on pipeline(s): %s", e)
 
-        threading.Thread(target=process_message).start()
+        # Blocking here blocks the paho network loop, so no further message is read from the
+        # broker connection (nor acknowledged) until an in-flight message completes. The slot
+        # is released by the message processor once the pipeline executions for the message
+        # have completed or been discarded, or here if the message is discarded by the pool.
+        if not self.in_flight.acquire(  # pylint: disable=consider-using-with
+                blocking=self.pause_on_backpressure):
+            lc.warn("MQTT Trigger: max in-flight messages reached, dropping message received on "
+                    "topic '%s' (%s=%s)", msg_envelope.receivedTopic, CORRELATION_HEADER,
+                    correlation_id)
+            return
+
+        self.dispatcher.submit(process_message, on_discard=self.in_flight.release)
 
     def response_handler(self, app_ctx: AppFunctionContext, pipeline: FunctionPipeline):
         """
@@ -43,10 +43,12 @@ Example:
             # Implementation here
             pass
 """
+import concurrent.futures
 from abc import ABC, abstractmethod
 from typing import Any
 
 from ..common.config import ConfigurationStruct
+from ..runtime import MessageError
 from ...bootstrap.interface.secret import SecretProvider
 from ...contracts.clients.logger import Logger
 from ...interfaces import FunctionPipeline, AppFunctionContext
@@ -80,6 +82,22 @@ class ServiceBinding(ABC):
         decoded data
         """
 
+    @abstractmethod
+    def submit_message(self, ctx: AppFunctionContext, data: Any,
+                       pipeline: FunctionPipeline) -> concurrent.futures.Future:
+        """
+        schedules the processing of the decoded data by an async pipeline on the runtime's event
+        loop and returns a future resolving to the processing error, if any
+        """
+
+    @abstractmethod
+    def process_batch(self, ctxs: list[AppFunctionContext], data: list[Any],
+                      pipeline: FunctionPipeline) -> list[MessageError | None]:
+        """
+        process the decoded data of a micro-batch of messages and returns the processing error
+        of each message, if any
+        """
+
     @abstractmethod
     def logger(self) -> Logger:
         """
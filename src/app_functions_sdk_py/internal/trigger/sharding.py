@@ -0,0 +1,116 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+This module provides the `ShardedDispatcher` class, which executes the function pipelines on a
+fixed set of single-threaded shards, so that the messages of different devices are processed in
+parallel while the messages of each device are processed strictly in the order received.
+
+Classes:
+    - ShardedDispatcher: Hashes the shard key of each message to one of its shards, each a
+    WorkerPool of a single worker thread with its own bounded queue.
+
+Functions:
+    - new_shard_key_func: Returns the function extracting the shard key of a message per the
+    configured ShardKey and TopicLevel.
+"""
+
+import time
+import zlib
+from typing import Any, Callable, Optional
+
+from .workerpool import WorkerPool, OVERFLOW_POLICY_BLOCK
+from ...constants import KEY_DEVICE_NAME, TOPIC_LEVEL_SEPERATOR
+from ...contracts.clients.logger import Logger
+from ...interfaces import AppFunctionContext
+from ...interfaces.messaging import MessageEnvelope
+
+SHARD_KEY_DEVICE_NAME = "deviceName"
+SHARD_KEY_TOPIC = "topic"
+
+SHARD_KEYS = (SHARD_KEY_DEVICE_NAME, SHARD_KEY_TOPIC)
+
+DEFAULT_SHARD_QUEUE_SIZE = 1024
+
+ShardKeyFunc = Callable[[AppFunctionContext, MessageEnvelope], str]
+
+
+def new_shard_key_func(shard_key: str, topic_level: int = 0) -> ShardKeyFunc:
+    """
+    new_shard_key_func returns the function extracting the shard key of a message. The
+    deviceName key is the device name of the decoded Event, or the received topic when the
+    message isn't an Event. The topic key is the topic level at the 1-based topic_level index,
+    counted from the end when negative, or the whole received topic when topic_level is 0 or out
+    of range. Raises ValueError if the shard key isn't supported.
+    """
+    shard_key = shard_key.strip() or SHARD_KEY_DEVICE_NAME
+    if shard_key not in SHARD_KEYS:
+        raise ValueError(f"unsupported shard key '{shard_key}', must be one of "
+                         f"{', '.join(SHARD_KEYS)}")
+
+    def topic_key(_: AppFunctionContext, envelope: MessageEnvelope) -> str:
+        topic = envelope.receivedTopic
+        if topic_level == 0:
+            return topic
+        levels = topic.split(TOPIC_LEVEL_SEPERATOR)
+        index = topic_level - 1 if topic_level > 0 else topic_level
+        if -len(levels) <= index < len(levels):
+            return levels[index]
+        return topic
+
+    def device_name_key(ctx: AppFunctionContext, envelope: MessageEnvelope) -> str:
+        device_name, found = ctx.get_value(KEY_DEVICE_NAME)
+        return device_name if found else envelope.receivedTopic
+
+    return topic_key if shard_key == SHARD_KEY_TOPIC else device_name_key
+
+
+class ShardedDispatcher:
+    """
+    ShardedDispatcher executes the submitted tasks on a fixed number of shards, each a WorkerPool
+    of a single worker thread, selected by hashing the key of the task. Tasks sharing a key are
+    therefore executed one at a time in the order submitted. The overflow policy applies per
+    shard when its queue is full.
+
+    Attributes:
+        shards (list[WorkerPool]): The shards, whose queue_depth gauges report the number of tasks
+         waiting on each shard.
+        key_func (ShardKeyFunc): Extracts the shard key of a message, its deviceName by default.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(self, lc: Logger, shard_count: int,
+                 queue_size: int = DEFAULT_SHARD_QUEUE_SIZE,
+                 overflow_policy: str = OVERFLOW_POLICY_BLOCK,
+                 key_func: Optional[ShardKeyFunc] = None):
+        if shard_count <= 0:
+            raise ValueError(f"invalid shard count {shard_count}, must be greater than 0")
+        self.shards = [WorkerPool(lc, 1, queue_size, overflow_policy)
+                       for _ in range(shard_count)]
+        self.key_func = key_func or new_shard_key_func(SHARD_KEY_DEVICE_NAME)
+
+    def message_key(self, ctx: AppFunctionContext, envelope: MessageEnvelope) -> str:
+        """ Returns the shard key of the message. """
+        return self.key_func(ctx, envelope)
+
+    def shard_index(self, key: str) -> int:
+        """ Returns the index of the shard executing the tasks of the key. """
+        # crc32 rather than hash() so that a key maps to the same shard across restarts
+        return zlib.crc32(key.encode("utf-8")) % len(self.shards)
+
+    def submit(self, key: str, fn: Callable, *args: Any,
+               on_discard: Optional[Callable[[], Any]] = None) -> bool:
+        """
+        submit queues fn(*args) on the shard of the key. Returns False if the task was refused,
+        in which case on_discard is called as with WorkerPool.submit.
+        """
+        return self.shards[self.shard_index(key)].submit(fn, *args, on_discard=on_discard)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        stop refuses any further task and waits up to timeout seconds in total for the shards to
+        drain the tasks already queued.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for shard in self.shards:
+            shard.stop(None if deadline is None else max(deadline - time.monotonic(), 0))
@@ -0,0 +1,203 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+This module provides the `WorkerPool` class, a bounded pool of long-lived worker threads used by
+the triggers to execute function pipelines without spawning a new thread per message.
+
+Classes:
+    - WorkerPool: Executes submitted tasks on a fixed maximum number of worker threads, queueing
+    pending tasks in a bounded queue and applying the configured overflow policy when the queue
+    is full.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from pyformance import meters
+
+from ...contracts.clients.logger import Logger
+
+OVERFLOW_POLICY_BLOCK = "block"
+OVERFLOW_POLICY_DROP_OLDEST = "drop-oldest"
+OVERFLOW_POLICY_REJECT = "reject"
+
+OVERFLOW_POLICIES = (OVERFLOW_POLICY_BLOCK, OVERFLOW_POLICY_DROP_OLDEST, OVERFLOW_POLICY_REJECT)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_QUEUE_SIZE = 1024
+
+# how long a submitter blocked on a full queue waits before checking whether the pool is stopped
+BLOCKED_SUBMIT_INTERVAL = 0.1
+
+
+class _Task(NamedTuple):
+    fn: Callable
+    args: tuple
+    on_discard: Optional[Callable[[], Any]]
+
+
+# pylint: disable=too-many-instance-attributes
+class WorkerPool:
+    """
+    WorkerPool executes submitted tasks on at most max_workers long-lived threads. Worker threads
+    are started on demand and pending tasks wait in a queue bounded by queue_size. When the queue
+    is full the overflow policy decides whether the caller blocks (block), the oldest pending task
+    is discarded (drop-oldest) or the new task is refused (reject).
+
+    Attributes:
+        queue_depth (meters.CallbackGauge): Number of tasks waiting for a worker.
+        rejected (meters.Counter): Number of tasks discarded by the overflow policy.
+    """
+
+    def __init__(self, lc: Logger, max_workers: int = DEFAULT_MAX_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 overflow_policy: str = OVERFLOW_POLICY_BLOCK):
+        overflow_policy = overflow_policy.strip().lower()
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unsupported overflow policy '{overflow_policy}', must be one of "
+                             f"{', '.join(OVERFLOW_POLICIES)}")
+
+        self._lc = lc
+        self._max_workers = max_workers if max_workers > 0 else DEFAULT_MAX_WORKERS
+        self._overflow_policy = overflow_policy
+        self._tasks = queue.Queue(maxsize=queue_size if queue_size > 0 else DEFAULT_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        # serializes the tasks put on the queue with the sentinels put by stop, so that no task is
+        # queued after the sentinels, where no worker would execute it
+        self._put_lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._idle = 0
+        self._stopped = False
+        self.queue_depth = meters.CallbackGauge(callback=self._tasks.qsize, key="")
+        self.rejected = meters.Counter("")
+
+    @property
+    def max_workers(self) -> int:
+        """ Returns the maximum number of worker threads. """
+        return self._max_workers
+
+    @property
+    def overflow_policy(self) -> str:
+        """ Returns the overflow policy applied when the queue is full. """
+        return self._overflow_policy
+
+    def submit(self, fn: Callable, *args: Any,
+               on_discard: Optional[Callable[[], Any]] = None) -> bool:
+        """
+        submit queues fn(*args) for execution on a worker thread. Returns False if the task was
+        refused because the pool is stopped or the queue is full under the reject policy.
+        on_discard, if provided, is called whenever the task is refused or later dropped by the
+        drop-oldest policy, so callers can release any resource held for it.
+        """
+        task = _Task(fn, args, on_discard)
+
+        with self._lock:
+            if self._stopped:
+                self._discard(task)
+                return False
+            if self._idle == 0 and len(self._workers) < self._max_workers:
+                self._start_worker()
+
+        if self._overflow_policy == OVERFLOW_POLICY_BLOCK:
+            return self._put_blocking(task)
+
+        dropped = []
+        try:
+            with self._put_lock:
+                while True:
+                    if self._stopped:
+                        dropped.append(task)
+                        return False
+                    try:
+                        self._tasks.put_nowait(task)
+                        return True
+                    except queue.Full:
+                        if self._overflow_policy == OVERFLOW_POLICY_REJECT:
+                            self.rejected.inc(1)
+                            dropped.append(task)
+                            return False
+
+                    # drop-oldest: evict the longest waiting task to make room for the new one,
+                    # unless stopped, as the queue may then hold the sentinels stopping the workers
+                    if self._stopped:
+                        continue
+                    try:
+                        dropped.append(self._tasks.get_nowait())
+                        self.rejected.inc(1)
+                    except queue.Empty:
+                        continue
+        finally:
+            # the discard callbacks are called without holding the lock, as they may submit
+            for discarded in dropped:
+                self._discard(discarded)
+
+    def _put_blocking(self, task: _Task) -> bool:
+        """
+        waits for the queue to have room for the task, refusing it once the pool is stopped
+        """
+        # checked before taking the lock too, so that the blocked submitters don't hold up stop
+        while not self._stopped:
+            with self._put_lock:
+                if self._stopped:
+                    break
+                try:
+                    self._tasks.put(task, timeout=BLOCKED_SUBMIT_INTERVAL)
+                    return True
+                except queue.Full:
+                    pass
+        self._discard(task)
+        return False
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        stop refuses any further task, lets the workers drain the tasks already queued and waits
+        up to timeout seconds in total for them to exit. The submitters blocked on a full queue
+        have their task refused.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            workers = list(self._workers)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._put_lock:
+            for _ in workers:
+                try:
+                    self._tasks.put(None, timeout=None if deadline is None
+                                    else max(deadline - time.monotonic(), 0))
+                except queue.Full:
+                    self._lc.warn("worker pool stopped before its queued tasks were executed")
+                    break
+        for worker in workers:
+            worker.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def _start_worker(self):
+        worker = threading.Thread(target=self._run_worker, daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _run_worker(self):
+        while True:
+            with self._lock:
+                self._idle += 1
+            task = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+            if task is None:
+                return
+            try:
+                task.fn(*task.args)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._lc.error(f"worker pool task failed: {e}")
+
+    def _discard(self, task: Optional[_Task]):
+        if task is None or task.on_discard is None:
+            return
+        try:
+            task.on_discard()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._lc.error(f"worker pool discard callback failed: {e}")
@@ -28,12 +28,16 @@ Note:
 
 See Also:
     - `MqttMessageClient` in `mqtt.client` for the MQTT client implementation.
+    - `LoopbackMessageClient` in `loopback.client` for the in-memory client delivering the
+      published messages to its own subscribers.
     - `MessageBusConfig` in `interfaces.messaging` for the configuration structure.
 """
 from .mqtt.client import MqttMessageClient
 from .nats.client import NatsMessageClient
+from .loopback.client import LoopbackMessageClient
 from ..contracts.clients.logger import Logger
-from ..interfaces.messaging import MessageBusConfig, MessageClient, MQTT, HostInfo, NATS_CORE
+from ..interfaces.messaging import MessageBusConfig, MessageClient, MQTT, HostInfo, NATS_CORE, \
+    LOOPBACK
 from ..internal.common.config import MessageBusInfo
 
 
@@ -60,5 +64,7 @@ def new_message_client(message_bus_info: MessageBusInfo, logger: Logger) -> Mess
         return MqttMessageClient(message_bus_config)
     if message_bus_config.type.lower() == NATS_CORE:
         return NatsMessageClient(message_bus_config, logger)
+    if message_bus_config.type.lower() == LOOPBACK:
+        return LoopbackMessageClient(message_bus_config)
 
     raise ValueError(f"Unsupported message client type: {type}")
@@ -0,0 +1,121 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+Provides the loopback MessageClient, which delivers the published messages to the subscribed
+topic queues of the same client in memory, without any broker.
+
+The loopback client is meant for exercising the message bus trigger and the function pipelines
+end to end without the network, as done by the tests and the throughput benchmarks. Topics are
+matched as MQTT topic filters, where a '+' level matches any single level and a trailing '#'
+level matches any remaining levels.
+"""
+import copy
+import queue
+import threading
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+from ...constants import TOPIC_WILDCARD, TOPIC_SINGLE_LEVEL_WILDCARD, TOPIC_LEVEL_SEPERATOR
+from ...interfaces.messaging import MessageBusConfig, MessageClient, MessageEnvelope, \
+    TopicMessageQueue
+
+DEFAULT_MATCH_CACHE_SIZE = 1024
+
+
+def topic_filter_matches(topic_filter: str, topic: str) -> bool:
+    """
+    topic_filter_matches returns whether the topic matches the MQTT topic filter
+    """
+    if topic_filter == topic:
+        return True
+    topic_levels = topic.split(TOPIC_LEVEL_SEPERATOR)
+    filter_levels = topic_filter.split(TOPIC_LEVEL_SEPERATOR)
+    for index, level in enumerate(filter_levels):
+        if level == TOPIC_WILDCARD:
+            return True
+        if index >= len(topic_levels):
+            return False
+        if level not in (TOPIC_SINGLE_LEVEL_WILDCARD, topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+def subscription_matches(subscriptions: dict[str, tuple[queue.Queue, ...]],
+                         cache_size: int = DEFAULT_MATCH_CACHE_SIZE) \
+        -> Callable[[str], tuple[queue.Queue, ...]]:
+    """
+    subscription_matches returns the function returning the queues of the subscriptions matching
+    a topic, whose result is kept in an LRU cache of cache_size topics
+    """
+    def matches(topic: str) -> tuple[queue.Queue, ...]:
+        return tuple(message_queue
+                     for topic_filter, topic_queues in subscriptions.items()
+                     if topic_filter_matches(topic_filter, topic)
+                     for message_queue in topic_queues)
+
+    return lru_cache(maxsize=cache_size)(matches)
+
+
+class LoopbackMessageClient(MessageClient):
+    """
+    Implements a MessageClient delivering each published message to the queues subscribed to a
+    topic filter matching the publish topic, with the receivedTopic of the delivered envelope
+    set to the publish topic.
+
+    The subscriptions are replaced rather than modified on subscribe and unsubscribe, so that
+    publish reads them without locking. The queues matching the most recent publish topics are
+    kept in an LRU cache until the subscriptions change.
+
+    Since no broker connection ends the subscriptions, disconnect puts None on each subscribed
+    queue and error queue to wake up their consumers, which the triggers skip before checking
+    whether the service is shutting down.
+    """
+
+    def __init__(self, message_bus_config: Optional[MessageBusConfig] = None):
+        self._message_bus_config = message_bus_config
+        self._subscriptions: dict[str, tuple[queue.Queue, ...]] = {}
+        self._matches = subscription_matches(self._subscriptions)
+        self._error_queues: list[queue.Queue] = []
+        self._subscription_mutex = threading.Lock()
+
+    def connect(self):
+        """ connect does nothing, the loopback client doesn't connect to any broker """
+
+    def publish(self, message: MessageEnvelope, topic: str):
+        for message_queue in self._matches(topic):
+            # each subscriber receives its own envelope, as it would from a broker
+            message_envelope = copy.copy(message)
+            message_envelope.receivedTopic = topic
+            message_queue.put(message_envelope)
+
+    def subscribe(self, topic_queues: List[TopicMessageQueue], error_queue: queue.Queue):
+        with self._subscription_mutex:
+            subscriptions = dict(self._subscriptions)
+            for topic_queue in topic_queues:
+                subscriptions[topic_queue.topic] = \
+                    subscriptions.get(topic_queue.topic, ()) + (topic_queue.message_queue,)
+            self._subscriptions = subscriptions
+            self._matches = subscription_matches(subscriptions)
+            if error_queue is not None:
+                self._error_queues.append(error_queue)
+
+    def unsubscribe(self, topics: List[str]):
+        with self._subscription_mutex:
+            self._subscriptions = {topic_filter: topic_queues
+                                   for topic_filter, topic_queues in self._subscriptions.items()
+                                   if topic_filter not in topics}
+            self._matches = subscription_matches(self._subscriptions)
+
+    def disconnect(self):
+        """
+        disconnect removes all the subscriptions and wakes up the consumers of their queues
+        """
+        with self._subscription_mutex:
+            subscriptions, self._subscriptions = self._subscriptions, {}
+            error_queues, self._error_queues = self._error_queues, []
+            self._matches = subscription_matches(self._subscriptions)
+        for topic_queues in subscriptions.values():
+            for message_queue in topic_queues:
+                message_queue.put(None)
+        for error_queue in error_queues:
+            error_queue.put(None)
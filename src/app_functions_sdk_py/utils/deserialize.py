@@ -7,55 +7,43 @@ and a target data class, then recursively converts the input into an instance of
 a list of instances if the input is a list.
 This process includes handling of nested data classes and lists of data classes, making it
 versatile for various configuration data formats encountered in the EdgeX framework.
+
+The decoding plan of each dataclass, i.e. the decoder of each of its fields, is compiled once and
+cached so that decoding many objects of the same type, such as the readings of an Event, doesn't
+inspect the dataclass again for each object.
 """
 
 from dataclasses import is_dataclass, fields
-from typing import Any, get_origin, get_args
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Callable, Union, get_origin, get_args
 
 from app_functions_sdk_py.utils.strconv import parse_bool
 
 KEY_DELIMITER = '/'
 KEEPER_TOPIC_PREFIX = 'edgex/configs'
 
+# types whose constructor returns the provided value unchanged when it already has that exact type
+_IDENTITY_TYPES = (str, int, float)
+
+Decoder = Callable[[Any], Any]
+
 
 def deserialize_list(data: list, data_class: Any) -> list:
     """Recursively deserialize a list of items."""
-    item_type = get_args(data_class)[0]
-    return [deserialize_to_dataclass(item, item_type) for item in data]
+    decode_item = _item_decoder(get_args(data_class)[0])
+    return [decode_item(item) for item in data]
 
 
 def deserialize_dict(data: dict, key_type: Any, value_type: Any) -> dict:
     """Recursively deserialize a dictionary with specific key and value types."""
-    deserialized_dict = {}
-    for key, value in data.items():
-        deserialized_key = key_type(key)
-        deserialized_value = deserialize_field(value, value_type)
-        deserialized_dict[deserialized_key] = deserialized_value
-    return deserialized_dict
+    decode_value = field_decoder(value_type)
+    return {key_type(key): decode_value(value) for key, value in data.items()}
 
 
 def deserialize_field(value: Any, field_type: Any) -> Any:
     """Deserialize a single field value."""
-    # pylint: disable=too-many-return-statements
-    if value is None:
-        return value
-    if is_dataclass(field_type):
-        return deserialize_to_dataclass(value, field_type)
-    if get_origin(field_type) is list:
-        return deserialize_list(value, field_type)
-    if get_origin(field_type) is dict:
-        key_type, value_type = get_args(field_type)
-        return deserialize_dict(value, key_type, value_type)
-    if field_type is bool and isinstance(value, str):
-        # Convert string to boolean is tricky in Python while both bool("False") and bool("True")
-        # return True, so use custom function to handle it
-        return parse_bool(value)
-    try:
-        # Attempt to convert value to the appropriate field type
-        return field_type(value)
-    except (TypeError, ValueError):
-        # If direct conversion fails, treat it as a nested dataclass
-        return deserialize_to_dataclass(value, field_type)
+    return field_decoder(field_type)(value)
 
 
 def deserialize_to_dataclass(data: dict | list, data_class: Any) -> Any:
@@ -69,10 +57,109 @@ def deserialize_to_dataclass(data: dict | list, data_class: Any) -> Any:
     if not is_dataclass(data_class):
         return data
 
-    field_types = {f.name: f.type for f in fields(data_class)}
+    return dataclass_decode_plan(data_class)(data)
+
+
+@lru_cache(maxsize=None)
+def dataclass_decode_plan(data_class: Any) -> Decoder:
+    """
+    Compiles and caches the decoding plan of a dataclass, i.e. a constructor function building an
+    instance of the dataclass from a dictionary. The fields of the dataclass and the decoder of
+    each field are resolved once per dataclass rather than for each decoded object.
+    """
+    decoders = {f.name: field_decoder(f.type) for f in fields(data_class)}
+
+    def decode(data: dict) -> Any:
+        # Only keep keys that exist in the dataclass
+        return data_class(**{key: decoders[key](value)
+                             for key, value in data.items() if key in decoders})
+
+    return decode
+
+
+def field_decoder(field_type: Any) -> Decoder:
+    """
+    Returns the decoder of a single field value of the provided type, which is compiled once and
+    cached for hashable types.
+    """
+    try:
+        hash(field_type)
+    except TypeError:
+        return _compile_field_decoder(field_type)
+    return _cached_field_decoder(field_type)
+
+
+@lru_cache(maxsize=None)
+def _cached_field_decoder(field_type: Any) -> Decoder:
+    return _compile_field_decoder(field_type)
+
+
+def _compile_field_decoder(field_type: Any) -> Decoder:
+    # pylint: disable=too-many-return-statements
+    if is_dataclass(field_type):
+        return _optional(_dataclass_decoder(field_type))
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+    if origin is list:
+        if not args:
+            return _optional(lambda value: deserialize_list(value, field_type))
+        decode_item = _item_decoder(args[0])
+        return _optional(lambda value: [decode_item(item) for item in value])
+    if origin is dict:
+        if len(args) != 2:
+            return _optional(lambda value: deserialize_dict(value, *args))
+        key_type, value_type = args
+        decode_value = field_decoder(value_type)
+        return _optional(lambda value: {key_type(key): decode_value(item)
+                                        for key, item in value.items()})
+
+    if field_type is bool:
+        # Convert string to boolean is tricky in Python while both bool("False") and bool("True")
+        # return True, so use custom function to handle it
+        return _optional(lambda value: parse_bool(value) if isinstance(value, str) else bool(value))
+
+    if field_type is Any or origin in (Union, UnionType):
+        # such types cannot be instantiated so the value is kept as is, as a nested dataclass
+        # with the given type is never found
+        return _optional(_item_decoder(field_type))
+
+    is_identity_type = field_type in _IDENTITY_TYPES
+
+    def decode(value: Any) -> Any:
+        if is_identity_type and value.__class__ is field_type:
+            return value
+        try:
+            # Attempt to convert value to the appropriate field type
+            return field_type(value)
+        except (TypeError, ValueError):
+            # If direct conversion fails, treat it as a nested dataclass
+            return deserialize_to_dataclass(value, field_type)
+
+    return _optional(decode)
+
+
+def _optional(decode: Decoder) -> Decoder:
+    return lambda value: None if value is None else decode(value)
+
+
+def _item_decoder(item_type: Any) -> Decoder:
+    """ Returns the decoder applying deserialize_to_dataclass to a value of the provided type. """
+    if not is_dataclass(item_type):
+        return lambda item: deserialize_list(item, item_type) if isinstance(item, list) else item
+    return _dataclass_decoder(item_type)
+
+
+def _dataclass_decoder(data_class: Any) -> Decoder:
+    # the plan is resolved on first use so that recursive dataclasses can be compiled
+    plan = None
 
-    # Only keep keys that exist in the dataclass
-    init_values = {key: deserialize_field(value, field_types[key])
-                   for key, value in data.items() if key in field_types}
+    def decode(value: Any) -> Any:
+        nonlocal plan
+        if isinstance(value, list):
+            return deserialize_list(value, data_class)
+        if plan is None:
+            plan = dataclass_decode_plan(data_class)
+        return plan(value)
 
-    return data_class(**init_values)
+    return decode
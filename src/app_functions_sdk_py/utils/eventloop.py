@@ -0,0 +1,41 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+This module provides the functions closing the resources bound to an asyncio event loop, such as
+the connection pools of the AsyncAppFunctions, when the owner of the event loop stops it.
+
+Functions:
+    - close_with_loop: Registers the coroutine function closing a resource bound to the running
+    event loop.
+    - close_loop_resources: Awaits the closing of the resources registered on the running event
+    loop.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable
+
+_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list]" = \
+    weakref.WeakKeyDictionary()
+_closers_lock = threading.Lock()
+
+
+def close_with_loop(aclose: Callable[[], Awaitable[Any]]):
+    """
+    close_with_loop registers aclose to be awaited by close_loop_resources on the running event
+    loop, so that the resource it closes doesn't outlive the loop it is bound to
+    """
+    loop = asyncio.get_running_loop()
+    with _closers_lock:
+        _closers.setdefault(loop, []).append(aclose)
+
+
+async def close_loop_resources():
+    """
+    close_loop_resources awaits the closing of the resources registered on the running event
+    loop, ignoring the errors closing them
+    """
+    with _closers_lock:
+        closers = _closers.pop(asyncio.get_running_loop(), [])
+    await asyncio.gather(*(aclose() for aclose in closers), return_exceptions=True)
@@ -5,15 +5,16 @@ This module provides help functions
 """
 import os
 import base64
-import json
-from typing import Any, Optional, Tuple
+import functools
+import weakref
+from typing import Any, Callable, Optional, Tuple
 
 from ..constants import ENV_KEY_SECURITY_SECRET_STORE
 from ..contracts import errors
-from ..contracts.clients.utils.common import convert_any_to_dict
 from ..contracts.common import constants
 from ..contracts.common.constants import ENV_OPTIMIZE_EVENT_PAYLOAD, VALUE_TRUE
 from ..contracts.dtos.event import Event
+from .serialize import to_jsonable, encode_json, encode_jsonable, json_backend
 
 value_types = [
     constants.VALUE_TYPE_BOOL, constants.VALUE_TYPE_STRING,
@@ -33,6 +34,85 @@ value_types = [
 ]
 
 
+class _EventEncoding:  # pylint: disable=too-few-public-methods
+    """ The encodings of an Event, valid as long as the fingerprint of the Event is unchanged """
+    __slots__ = ("fingerprint", "encoded")
+
+    def __init__(self, fingerprint: tuple):
+        self.fingerprint = fingerprint
+        self.encoded: dict[tuple, bytes] = {}
+
+
+# id of the Event -> encodings of the Event, removed once the Event is garbage collected
+_event_encodings: dict[int, _EventEncoding] = {}
+
+
+def _items(tags: Optional[dict]) -> tuple:
+    return tuple(tags.items()) if tags else ()
+
+
+def _event_fingerprint(event: Event) -> tuple:
+    readings = event.readings or ()
+    return (tuple(event.__dict__.values()), _items(event.tags), len(readings),
+            tuple((tuple(r.__dict__.values()), _items(r.tags)) for r in readings))
+
+
+def invalidate_event_encoding(event: Event):
+    """ invalidate_event_encoding discards the encodings memoized for the Event """
+    entry = _event_encodings.get(id(event))
+    if entry is not None:
+        entry.encoded.clear()
+
+
+def encode_event(event: Event) -> bytes:
+    """ encode_event encodes the Event to JSON, memoizing the encoding so that chained export
+    functions don't encode the same Event again. The encoding is keyed by the content type and
+    the optimize event payload flag, and is recomputed whenever the fields, readings or tags of
+    the Event change. The Event itself is never modified. """
+    optimize = os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE
+    key = (constants.CONTENT_TYPE_JSON, optimize, json_backend())
+    fingerprint = _event_fingerprint(event)
+
+    event_id = id(event)
+    entry = _event_encodings.get(event_id)
+    if entry is None:
+        entry = _event_encodings[event_id] = _EventEncoding(fingerprint)
+        weakref.finalize(event, _event_encodings.pop, event_id, None)
+    elif entry.fingerprint != fingerprint:
+        entry.fingerprint = fingerprint
+        entry.encoded.clear()
+    else:
+        encoded = entry.encoded.get(key)
+        if encoded is not None:
+            return encoded
+
+    encoded = entry.encoded[key] = _encode_event(event, optimize)
+    return encoded
+
+
+def _encode_event(event: Event, optimize: bool) -> bytes:
+    any_dict = to_jsonable(event)
+
+    # since bytes is not JSON serializable, we should do base64 encode
+    for r in any_dict["readings"]:
+        if r["valueType"] == constants.VALUE_TYPE_BINARY and \
+                isinstance(r["binaryValue"], (bytes, bytearray)):
+            r["binaryValue"] = base64.b64encode(r["binaryValue"]).decode()
+
+    if optimize:
+        # reduce the fields by removing the dict key
+        for r in any_dict["readings"]:
+            del r["id"]
+            del r["deviceName"]
+            del r["profileName"]
+            if any_dict["origin"] == r["origin"]:
+                del r["origin"]
+            if len(any_dict["readings"]) == 1 and any_dict["sourceName"] == r["resourceName"]:
+                del r["resourceName"]
+
+    return encode_jsonable(any_dict)
+
+
 def coerce_type(param: Any) -> Tuple[bytes, Optional[errors.EdgeX]]:
     """ CoerceType will accept a string, bytes, or json.Marshaller type and
     convert it to a bytes for use and consistency in the SDK """
@@ -43,27 +123,9 @@ def coerce_type(param: Any) -> Tuple[bytes, Optional[errors.EdgeX]]:
         return param, None
 
     try:
-        # since bytes is not JSON serializable, we should do base64 encode
         if isinstance(param, Event):
-            for r in param.readings:
-                if r.valueType == constants.VALUE_TYPE_BINARY:
-                    r.binaryValue = base64.b64encode(r.binaryValue).decode()
-
-        any_dict = convert_any_to_dict(param)
-
-        if isinstance(param, Event) and os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
-            # reduce the fields by removing the dict key
-            for r in any_dict["readings"]:
-                del r["id"]
-                del r["deviceName"]
-                del r["profileName"]
-                if any_dict["origin"] == r["origin"]:
-                    del r["origin"]
-                if len(any_dict["readings"]) == 1 and any_dict["sourceName"] == r["resourceName"]:
-                    del r["resourceName"]
-
-        json_encoded_data = json.dumps(any_dict).encode('utf-8')
-        return json_encoded_data, None
+            return encode_event(param), None
+        return encode_json(param), None
     except TypeError as e:
         return bytes(), errors.new_common_edgex(
             errors.ErrKind.CONTRACT_INVALID,
@@ -94,3 +156,10 @@ def delete_empty_and_trim(str_list: list[str]) -> list[str]:
         if s != "":
             result.append(s)
     return result
+
+
+def function_name(func: Callable) -> str:
+    """ function_name returns the name identifying the function, unwrapping functools.partial """
+    if isinstance(func, functools.partial):
+        func = func.func
+    return getattr(func, "__name__", type(func).__name__)
@@ -0,0 +1,178 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+"""
+The module defines the encoder registry used to convert objects such as DTOs into their JSON
+compatible form and to encode them into JSON bytes.
+
+The encoder of each class is resolved once and cached, so that encoding many objects of the same
+class, such as the readings of an Event, doesn't inspect each object again. The conversion follows
+the same rules as `convert_any_to_dict`: dictionaries and lists are converted recursively, objects
+with a `__dict__` are converted into the dictionary of their attributes and any other value is
+kept as is.
+
+JSON bytes are emitted by the standard json module, or by orjson or msgspec when installed and
+selected through the EDGEX_JSON_ENCODER environment variable or use_json_backend.
+"""
+
+import functools
+import json
+import os
+from typing import Any, Callable, Optional, Tuple
+
+from ..constants import ENV_KEY_JSON_ENCODER
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_MSGSPEC = "msgspec"
+JSON_BACKEND_STDLIB = "json"
+JSON_BACKEND_AUTO = "auto"
+JSON_BACKENDS_AUTO = (JSON_BACKEND_ORJSON, JSON_BACKEND_MSGSPEC, JSON_BACKEND_STDLIB)
+
+Encoder = Callable[[Any], Any]
+
+# classes which are kept as is, checked by exact class before looking up the registry
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+_encoders: dict[type, Encoder] = {}
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    Converts an object into its JSON compatible form using the encoder registered for its class.
+    """
+    cls = obj.__class__
+    if cls in _PRIMITIVE_TYPES:
+        return obj
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        encoder = _register_encoder(obj)
+    return encoder(obj)
+
+
+def register_encoder(cls: type, encoder: Encoder):
+    """
+    Registers the encoder converting the instances of the provided class into their JSON
+    compatible form, replacing the default encoder resolved for the class.
+    """
+    _encoders[cls] = encoder
+
+
+def _register_encoder(obj: Any) -> Encoder:
+    if isinstance(obj, dict):
+        encoder = _encode_dict
+    elif hasattr(obj, '__dict__'):
+        encoder = _encode_object
+    elif isinstance(obj, list):
+        encoder = _encode_list
+    else:
+        encoder = _encode_as_is
+    _encoders[obj.__class__] = encoder
+    return encoder
+
+
+def _encode_dict(obj: dict) -> dict:
+    return {k: v if v.__class__ in _PRIMITIVE_TYPES else to_jsonable(v) for k, v in obj.items()}
+
+
+def _encode_object(obj: Any) -> dict:
+    return {k: v if v.__class__ in _PRIMITIVE_TYPES else to_jsonable(v)
+            for k, v in obj.__dict__.items()}
+
+
+def _encode_list(obj: list) -> list:
+    return [v if v.__class__ in _PRIMITIVE_TYPES else to_jsonable(v) for v in obj]
+
+
+def _encode_as_is(obj: Any) -> Any:
+    return obj
+
+
+def _encode_unsupported(obj: Any) -> Any:
+    # mirrors the standard json module which only accepts float subclasses, e.g. numpy.float64
+    if isinstance(obj, float):
+        return float(obj)
+    if hasattr(obj, '__dict__'):
+        return to_jsonable(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode('utf-8')
+
+
+def _stdlib_encode(obj: Any) -> bytes:
+    return json.dumps(to_jsonable(obj)).encode('utf-8')
+
+
+def _new_backend(backend: str) -> Optional[Tuple[Callable[[Any], bytes], Callable[[Any], bytes]]]:
+    """
+    Returns the functions encoding any object and an object already in JSON compatible form. orjson
+    and msgspec encode dataclasses natively from their attributes and fall back to the registry for
+    the other objects.
+    """
+    if backend == JSON_BACKEND_ORJSON and orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS  # pylint: disable=no-member
+        dumps = functools.partial(orjson.dumps,  # pylint: disable=no-member
+                                  default=_encode_unsupported, option=options)
+        return dumps, dumps
+    if backend == JSON_BACKEND_MSGSPEC and msgspec is not None:
+        encode = msgspec.json.Encoder(enc_hook=_encode_unsupported).encode
+        return encode, encode
+    if backend == JSON_BACKEND_STDLIB:
+        return _stdlib_encode, _stdlib_dumps
+    return None
+
+
+_encode, _dumps = _stdlib_encode, _stdlib_dumps
+_backend = JSON_BACKEND_STDLIB  # pylint: disable=invalid-name
+
+
+def use_json_backend(backend: str) -> str:
+    """
+    Selects the library emitting JSON bytes and returns the name of the selected backend. The
+    backend is one of json (default), orjson, msgspec or auto, which selects orjson or msgspec
+    when installed. The standard json module is used when the requested backend is not installed.
+    Note that orjson and msgspec emit compact JSON, without whitespace between the items.
+    """
+    global _encode, _dumps, _backend  # pylint: disable=global-statement
+    backend = backend.strip().lower()
+    candidates = JSON_BACKENDS_AUTO if backend == JSON_BACKEND_AUTO else (backend,)
+    for candidate in candidates:
+        functions = _new_backend(candidate)
+        if functions is not None:
+            (_encode, _dumps), _backend = functions, candidate
+            return candidate
+    _encode, _dumps, _backend = _stdlib_encode, _stdlib_dumps, JSON_BACKEND_STDLIB
+    return JSON_BACKEND_STDLIB
+
+
+def json_backend() -> str:
+    """ Returns the name of the library emitting JSON bytes. """
+    return _backend
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encodes an object into JSON bytes. Raises TypeError if the object is not JSON serializable.
+    """
+    return _encode(obj)
+
+
+def encode_jsonable(obj: Any) -> bytes:
+    """
+    Encodes an object already converted into its JSON compatible form, e.g. by to_jsonable, into
+    JSON bytes. Raises TypeError if the object is not JSON serializable.
+    """
+    return _dumps(obj)
+
+
+use_json_backend(os.getenv(ENV_KEY_JSON_ENCODER, JSON_BACKEND_STDLIB))
@@ -1,6 +1,7 @@
 #  Copyright (C) 2024 IOTech Ltd
 #  SPDX-License-Identifier: Apache-2.0
 import unittest
+import unittest.mock
 
 from src.app_functions_sdk_py.bootstrap.di.container import Container, Get
 
@@ -94,6 +95,34 @@ class TestContainer(unittest.TestCase):
         self.assertIsNotNone(result.foo)
         self.assertEqual(foo_name, result.foo.foo_message)
 
+    def test_read_optimized_get_publishes_instances(self):
+        instance_count = 0
+
+        def service_constructor(get: Get):
+            nonlocal instance_count
+            instance_count += 1
+            return instance_count
+
+        container = Container({_service_name: service_constructor}, read_optimized=True)
+        self.assertIsNone(container.get("unknownService"))
+        self.assertEqual(1, container.get(_service_name))
+        self.assertEqual({_service_name: 1}, container._instances)
+
+        # instances published in the snapshot are returned without acquiring the lock
+        with unittest.mock.patch.object(container, "mutex") as mutex:
+            self.assertEqual(1, container.get(_service_name))
+            mutex.__enter__.assert_not_called()
+        self.assertEqual(1, instance_count)
+
+    def test_read_optimized_update_replaces_published_instance(self):
+        container = Container({_service_name: lambda get: "original"}, read_optimized=True)
+        self.assertEqual("original", container.get(_service_name))
+        snapshot = container._instances
+
+        container.update({_service_name: lambda get: "replacement"})
+        self.assertEqual("replacement", container.get(_service_name))
+        self.assertEqual({_service_name: "original"}, snapshot)
+
 
 if __name__ == '__main__':
     unittest.main()
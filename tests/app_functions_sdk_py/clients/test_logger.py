@@ -1,9 +1,13 @@
 # Copyright (C) 2024 IOTech Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+import logging
+import threading
 import unittest
 from unittest.mock import patch
 from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO, TRACE, DEBUG, WARN, ERROR
+from src.app_functions_sdk_py.contracts.clients.logger import AsyncLogSink, Logger
 
 
 class TestEdgeXLogger(unittest.TestCase):
@@ -49,10 +53,98 @@ class TestEdgeXLogger(unittest.TestCase):
         self.logger.set_log_level('DEBUG')
         self.assertEqual(self.logger.logger.level, DEBUG)
 
+    def test_is_enabled_for(self):
+        self.assertTrue(self.logger.is_enabled_for(INFO))
+        self.assertTrue(self.logger.is_enabled_for(ERROR))
+        self.assertFalse(self.logger.is_enabled_for(DEBUG))
+        self.assertFalse(self.logger.is_debug_enabled())
+        self.logger.set_log_level('TRACE')
+        self.assertTrue(self.logger.is_enabled_for(TRACE))
+        self.assertTrue(self.logger.is_debug_enabled())
+
+    def test_is_enabled_for_default(self):
+        class MinimalLogger(Logger):
+            def trace(self, msg, *args, **kwargs):
+                pass
+
+            def debug(self, msg, *args, **kwargs):
+                pass
+
+            def info(self, msg, *args, **kwargs):
+                pass
+
+            def warn(self, msg, *args, **kwargs):
+                pass
+
+            def error(self, msg, *args, **kwargs):
+                pass
+
+            def set_log_level(self, level_name: str):
+                pass
+
+        logger = MinimalLogger()
+        self.assertTrue(logger.is_enabled_for(TRACE))
+        self.assertTrue(logger.is_debug_enabled())
+
+    @patch.object(logging.Logger, 'debug')
+    def test_debug_discarded_below_level(self, mock_debug):
+        self.logger.debug('test debug %s', 'arg')
+        mock_debug.assert_not_called()
+        self.logger.set_log_level('DEBUG')
+        self.logger.debug('test debug %s', 'arg')
+        mock_debug.assert_called_once_with('test debug %s', 'arg')
+
     def test_set_log_level_to_invalid_level_raises_value_error(self):
         with self.assertRaises(ValueError):
             self.logger.set_log_level('INVALID')
 
 
+class TestAsyncLogSink(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.logger = EdgeXLogger('test_async_sink', INFO)
+        # pylint: disable=protected-access
+        self.logger._handler.setStream(self.stream)
+
+    def test_records_written_on_stop(self):
+        self.logger.start_async(queue_size=1000, batch_size=16)
+
+        def log(n: int):
+            for i in range(50):
+                self.logger.info("thread %d record %d", n, i)
+
+        threads = [threading.Thread(target=log, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.logger.debug("not enabled")
+        self.logger.stop_async(5)
+        self.logger.info("synchronous")
+
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(201, len(lines))
+        self.assertIn("msg=thread 3 record 49", self.stream.getvalue())
+        self.assertTrue(lines[-1].endswith("msg=synchronous"))
+        self.assertNotIn("not enabled", self.stream.getvalue())
+
+    def test_dropped_when_queue_full(self):
+        release = threading.Event()
+        handler = logging.StreamHandler(self.stream)
+        handler.format = lambda record: release.wait(5) and record.getMessage()
+        sink = AsyncLogSink(handler, queue_size=2, batch_size=1)
+        logger = logging.getLogger('test_async_sink_dropped')
+        logger.addHandler(sink.queue_handler)
+
+        for i in range(10):
+            logger.warning("record %d", i)
+        release.set()
+        sink.stop(5)
+
+        written = len(self.stream.getvalue().splitlines())
+        self.assertGreaterEqual(sink.dropped.get_count(), 7)
+        self.assertEqual(10, written + sink.dropped.get_count())
+
+
 if __name__ == '__main__':
     unittest.main()
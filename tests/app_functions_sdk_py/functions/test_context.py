@@ -0,0 +1,70 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import sys
+import threading
+import unittest
+
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.functions.context import Context
+
+
+class TestContext(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = EdgeXLogger('test_service', INFO)
+        self.dic = Container()
+        self.dic.update({LoggingClientInterfaceName: lambda get: self.logger})
+
+    def test_clone_copies_values_on_write(self):
+        ctx = Context("id", self.dic, "application/json")
+        ctx.add_value("Key", "value")
+        clone = ctx.clone()
+        self.assertEqual({"key": "value"}, clone.get_values())
+
+        clone.add_value("other", "clone")
+        ctx.remove_value("key")
+        self.assertEqual({}, ctx.get_values())
+        self.assertEqual({"key": "value", "other": "clone"}, clone.get_values())
+        self.assertEqual("value-clone", clone.apply_values("{key}-{other}"))
+        with self.assertRaises(KeyError):
+            ctx.remove_value("key")
+
+    def test_services_shared_and_refreshed(self):
+        ctx = Context("id", self.dic, "")
+        self.assertIs(self.logger, ctx.logger())
+        self.assertIs(self.logger, ctx.clone().logger())
+        self.assertIs(self.logger, Context("other", self.dic, "").logger())
+
+        other_logger = EdgeXLogger('other_service', INFO)
+        self.dic.update({LoggingClientInterfaceName: lambda get: other_logger})
+        self.assertIs(other_logger, ctx.logger())
+
+    def test_services_resolved_while_updated(self):
+        ctx = Context("id", self.dic, "")
+        stop = threading.Event()
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        resolved = []
+
+        def resolve():
+            while not stop.is_set():
+                resolved.append(ctx.logger())
+
+        readers = [threading.Thread(target=resolve) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for _ in range(1000):
+            self.dic.update({LoggingClientInterfaceName: lambda get: self.logger})
+        stop.set()
+        for reader in readers:
+            reader.join(5)
+        self.assertNotIn(None, resolved)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(Context("id", self.dic, ""), "__dict__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
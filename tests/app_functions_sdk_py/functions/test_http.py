@@ -1,9 +1,11 @@
 # Copyright (C) 2024 IOTech Ltd
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import threading
 import unittest
 import uuid
 from functools import partial
+from itertools import product
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from unittest.mock import Mock
 
@@ -19,6 +21,7 @@ from src.app_functions_sdk_py.functions.http import (EXPORT_METHOD_POST, EXPORT_
                                                      SECRET_VALUE_KEY, HTTP_REQUEST_HEADERS,
                                                      CONTINUE_ON_SEND_ERROR, RETURN_INPUT_DATA,
                                                      new_http_sender)
+from src.app_functions_sdk_py.internal.runtime.asyncexec import AsyncPipelineExecutor
 
 msgStr = "test message"
 path = "/some-path/foo"
@@ -214,15 +217,19 @@ class TestHttp(unittest.TestCase):
             TestData("Failed PUT with missed replacement", badFormatPath, True, False, True, True, False, ""),
         ]
 
-        for test in tests:
-            with self.subTest(msg=test.name):
+        for test, is_async in product(tests, (False, True)):
+            with self.subTest(msg=test.name, is_async=is_async):
                 self.ctx.add_value("test", "foo")
                 self.ctx.set_retry_data(None)
                 sender = new_http_sender(f"http://{self.test_mock_server.server_address[0]}:{self.test_mock_server.server_address[1]}"+test.path, "", test.persist_on_error)
                 sender.return_input_data = test.return_input_data
                 sender.continue_on_send_error = test.continue_on_send_error
 
-                if test.expected_method == HTTPMethod.POST.value:
+                if is_async:
+                    send = sender.http_post_async if test.expected_method == HTTPMethod.POST.value \
+                        else sender.http_put_async
+                    continue_executing, result_data = asyncio.run(send(self.ctx, msgStr))
+                elif test.expected_method == HTTPMethod.POST.value:
                     continue_executing, result_data = sender.http_post(self.ctx, msgStr)
                 else:
                     continue_executing, result_data = sender.http_put(self.ctx, msgStr)
@@ -237,3 +244,17 @@ class TestHttp(unittest.TestCase):
 
                 self.assertEqual(test.retry_data_set, self.ctx.retry_data() is not None)
                 self.ctx.remove_value("test")
+
+    def test_async_client_closed_on_stop(self):
+        executor = AsyncPipelineExecutor(self.logger)
+        sender = new_http_sender(f"http://{self.test_mock_server.server_address[0]}:"
+                                 f"{self.test_mock_server.server_address[1]}{path}", "", False)
+        continue_executing, _ = executor.submit(sender.http_post_async(self.ctx, msgStr)) \
+            .result(5)
+        self.assertTrue(continue_executing)
+        clients = list(sender._async_clients.values())
+        self.assertEqual(1, len(clients))
+        self.assertFalse(clients[0].is_closed)
+
+        executor.stop(5)
+        self.assertTrue(clients[0].is_closed)
@@ -0,0 +1,125 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import functools
+import os
+import pickle
+import unittest
+from typing import Any, Tuple
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.bootstrap.container.configuration import ConfigurationName
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.container.secret import SecretProviderName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.bootstrap.interface.secret import SecretProvider
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.functions.processpool import new_process_pool_stage, \
+    snapshot_context, restore_context
+from src.app_functions_sdk_py.interfaces import AppFunctionContext, FunctionPipeline
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct
+from src.app_functions_sdk_py.internal.runtime import FunctionsPipelineRuntime
+
+SERVICE_KEY = "AppService-UnitTest"
+
+
+def to_upper(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+    ctx.add_value("pid", str(os.getpid()))
+    ctx.remove_value("removed")
+    return True, data.upper()
+
+
+def sign(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+    key = ctx.secret_provider().get_secrets("signing", "key")["key"]
+    ctx.set_response_data(f"{data}:{key}".encode())
+    return True, f"{data}:{key}"
+
+
+def failing(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+    ctx.set_retry_data(data.encode())
+    return False, errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        secret_provider = MagicMock(spec=SecretProvider)
+        config = ConfigurationStruct()
+        config.Writable.Pipeline.ProcessPoolSize = 2
+        secret_provider.get_secrets.return_value = {"key": "secret"}
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+            SecretProviderName: lambda get: secret_provider,
+            ConfigurationName: lambda get: config,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+
+    def tearDown(self):
+        self.runtime.stop(5)
+
+    def new_context(self) -> Context:
+        ctx = Context("correlation-id", self.dic, "text/plain")
+        ctx.add_value("kept", "value")
+        ctx.add_value("removed", "value")
+        return ctx
+
+    def test_snapshot_round_trip(self):
+        ctx = self.new_context()
+        ctx.set_response_data(b"response")
+        snapshot = pickle.loads(pickle.dumps(snapshot_context(ctx, {"signing": {"key": "k"}})))
+
+        restored = Context("", self.dic, "")
+        restore_context(restored, snapshot)
+        self.assertEqual("correlation-id", restored.correlation_id())
+        self.assertEqual("text/plain", restored.input_content_type())
+        self.assertEqual(b"response", restored.response_data())
+        self.assertEqual(("value", True), restored.get_value("kept"))
+        self.assertEqual({"signing": {"key": "k"}}, snapshot.secrets)
+
+    def test_unpicklable_function(self):
+        with self.assertRaises(TypeError):
+            new_process_pool_stage(lambda ctx, data: (True, data))
+
+    def test_partial_function_name(self):
+        stage = new_process_pool_stage(functools.partial(failing), to_upper)
+        self.assertEqual("ProcessPoolStage(failing, to_upper)", stage.__name__)
+
+    def test_execute_pipeline(self):
+        results = []
+
+        def capture(_: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            results.append(data)
+            return False, None
+
+        stage = new_process_pool_stage(to_upper, sign, secret_names=["signing"])
+        self.assertEqual("ProcessPoolStage(to_upper, sign)", stage.__name__)
+        pipeline = FunctionPipeline("test", ["#"], stage, capture)
+        ctx = self.new_context()
+        self.assertIsNone(self.runtime.execute_pipeline(ctx, "in", pipeline))
+
+        self.assertEqual(["IN:secret"], results)
+        self.assertEqual(b"IN:secret", ctx.response_data())
+        self.assertEqual(("value", True), ctx.get_value("kept"))
+        self.assertFalse(ctx.get_value("removed")[1])
+        self.assertNotEqual(str(os.getpid()), ctx.get_value("pid")[0])
+
+    def test_execute_pipeline_error(self):
+        pipeline = FunctionPipeline("test", ["#"], new_process_pool_stage(failing))
+        ctx = self.new_context()
+        message_error = self.runtime.execute_pipeline(ctx, "in", pipeline)
+
+        self.assertIsNotNone(message_error)
+        self.assertEqual(1, pipeline.processing_errors.get_count())
+        self.assertEqual(b"in", ctx.retry_data())
+
+    def test_execute_in_process(self):
+        ctx = self.new_context()
+        self.assertEqual((True, "IN"), new_process_pool_stage(to_upper)(ctx, "in"))
+        self.assertEqual((str(os.getpid()), True), ctx.get_value("pid"))
+
+
+if __name__ == '__main__':
+    unittest.main()
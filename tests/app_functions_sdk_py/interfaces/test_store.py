@@ -0,0 +1,112 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import unittest
+from typing import Any, Optional, Tuple
+
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.contracts.dtos.store_object import StoredObject
+from src.app_functions_sdk_py.interfaces.store import StoreClient
+
+
+class DictStoreClient(StoreClient):
+    """ StoreClient keeping the objects in a dict, implementing only the required methods """
+
+    def __init__(self):
+        self.objects = {}
+
+    def store(self, o: StoredObject) -> Tuple[str, Optional[errors.EdgeX]]:
+        if o.payload is None:
+            return "", errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID, "no payload")
+        o.id = str(len(self.objects))
+        self.objects[o.id] = o
+        return o.id, None
+
+    def retrieve_from_store(self, app_service_key: str) \
+            -> Tuple[list[StoredObject], Optional[errors.EdgeX]]:
+        return [o for o in self.objects.values() if o.appServiceKey == app_service_key], None
+
+    def update(self, o: StoredObject) -> Optional[errors.EdgeX]:
+        if o.id not in self.objects:
+            return errors.new_common_edgex(errors.ErrKind.ENTITY_DOES_NOT_EXIST, "not found")
+        self.objects[o.id] = o
+        return None
+
+    def remove_from_store(self, o: StoredObject) -> Optional[errors.EdgeX]:
+        if self.objects.pop(o.id, None) is None:
+            return errors.new_common_edgex(errors.ErrKind.ENTITY_DOES_NOT_EXIST, "not found")
+        return None
+
+    def disconnect(self) -> Optional[errors.EdgeX]:
+        return None
+
+
+def new_object(payload: Any = None, next_retry_at: int = 0) -> StoredObject:
+    return StoredObject(retryCount=0, appServiceKey="test", payload=payload,
+                        nextRetryAt=next_retry_at)
+
+
+class TestStoreClientDefaults(unittest.TestCase):
+
+    def setUp(self):
+        self.client = DictStoreClient()
+        self.objects = [new_object(str(i).encode()) for i in range(3)]
+
+    def test_store_many(self):
+        ids, err = self.client.store_many(self.objects)
+        self.assertIsNone(err)
+        self.assertEqual(["0", "1", "2"], ids)
+
+        ids, err = self.client.store_many([new_object(b"3"), new_object()])
+        self.assertIsNotNone(err)
+        self.assertEqual(["3"], ids)
+
+    def test_count(self):
+        self.assertEqual((0, None), self.client.count("test"))
+        self.client.store_many(self.objects)
+        self.assertEqual((3, None), self.client.count("test"))
+        self.assertEqual((0, None), self.client.count("other"))
+
+    def test_retrieve_page_from_store(self):
+        self.client.store_many([new_object(str(i).encode(), next_retry_at=(i * 3) % 5)
+                                for i in range(5)])
+
+        page, cursor, err = self.client.retrieve_page_from_store("test", None, 2)
+        self.assertIsNone(err)
+        self.assertEqual([0, 1], [o.nextRetryAt for o in page])
+        # objects removed in between pages don't shift the following pages
+        self.client.remove_from_store(page[0])
+        page, cursor, err = self.client.retrieve_page_from_store("test", cursor, 2)
+        self.assertEqual([2, 3], [o.nextRetryAt for o in page])
+        page, cursor, err = self.client.retrieve_page_from_store("test", cursor, 2)
+        self.assertEqual(([4], None), ([o.nextRetryAt for o in page], cursor))
+
+        page, cursor, err = self.client.retrieve_page_from_store("test", None, 10, due_before=3)
+        self.assertEqual(([1, 2], None), ([o.nextRetryAt for o in page], cursor))
+        _, _, err = self.client.retrieve_page_from_store("test", None, 0)
+        self.assertIsNotNone(err)
+
+    def test_iterate_from_store(self):
+        self.client.store_many([new_object(str(i).encode(), next_retry_at=i % 2)
+                                for i in range(5)])
+        pages = list(self.client.iterate_from_store("test", 2))
+        self.assertEqual([[0, 0], [0, 1], [1]],
+                         [[o.nextRetryAt for o in page] for page, _ in pages])
+        self.assertEqual(["0", "2", "4", "1", "3"], [o.id for page, _ in pages for o in page])
+
+    def test_update_many(self):
+        self.client.store_many(self.objects)
+        for o in self.objects:
+            o.retryCount = 1
+        self.assertIsNone(self.client.update_many(self.objects))
+        self.assertTrue(all(o.retryCount == 1 for o in self.client.objects.values()))
+        self.assertIsNotNone(self.client.update_many([new_object()]))
+
+    def test_remove_many(self):
+        self.client.store_many(self.objects)
+        self.assertIsNone(self.client.remove_many(self.objects[:2]))
+        self.assertEqual(["2"], list(self.client.objects))
+        self.assertIsNotNone(self.client.remove_many(self.objects[:1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from src.app_functions_sdk_py.internal.common.config import StoreAndForwardInfo
+from src.app_functions_sdk_py.internal.runtime.backoff import RetryBackoff, new_retry_backoff
+
+
+class TestRetryBackoff(unittest.TestCase):
+
+    def test_delay(self):
+        backoff = RetryBackoff(5, 60, 0)
+        self.assertEqual([5, 10, 20, 40, 60, 60],
+                         [backoff.delay(retry_count) for retry_count in range(1, 7)])
+        self.assertEqual(60, backoff.delay(10_000))
+        self.assertEqual(10_000 + 20_000, backoff.next_retry_at(3, 10_000))
+
+    def test_jitter(self):
+        backoff = RetryBackoff(5, 60, 0.5)
+        for _ in range(100):
+            self.assertTrue(20 <= backoff.delay(4) <= 40)
+
+    def test_no_backoff(self):
+        backoff = new_retry_backoff(StoreAndForwardInfo(RetryInterval="5m"))
+        self.assertEqual(0, backoff.delay(5))
+        self.assertEqual(10_000, backoff.next_retry_at(5, 10_000))
+
+    def test_new_retry_backoff(self):
+        backoff = new_retry_backoff(StoreAndForwardInfo(
+            RetryInterval="0.5s", MaxRetryBackoff="1h", RetryBackoffJitter=2))
+        self.assertEqual((0.5, 3600, 1), (backoff.interval, backoff.max_backoff, backoff.jitter))
+        backoff = new_retry_backoff(StoreAndForwardInfo(RetryInterval="5m", MaxRetryBackoff="x"))
+        self.assertEqual(0, backoff.max_backoff)
+
+
+if __name__ == '__main__':
+    unittest.main()
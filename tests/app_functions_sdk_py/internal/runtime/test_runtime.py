@@ -0,0 +1,551 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import asyncio
+import json
+import threading
+import time
+import unittest
+from functools import partial
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock
+
+import cbor2
+
+from src.app_functions_sdk_py.bootstrap.container.configuration import ConfigurationName
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.container.metrics import MetricsManagerInterfaceName, \
+    metrics_manager_from
+from src.app_functions_sdk_py.bootstrap.container.store import StoreClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.bootstrap.interface.metrics import MetricsManager
+from src.app_functions_sdk_py.constants import KEY_DEVICE_NAME, KEY_RECEIVEDTOPIC
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.contracts.common.constants import CONTENT_TYPE_CBOR
+from src.app_functions_sdk_py.contracts.dtos.event import Event
+from src.app_functions_sdk_py.contracts.dtos.store_object import StoredObject
+from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.interfaces import AppFunctionContext, FunctionPipeline, \
+    batch_app_function
+from src.app_functions_sdk_py.interfaces.messaging import MessageEnvelope
+from src.app_functions_sdk_py.interfaces.store import StoreClient
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct, \
+    StoreAndForwardInfo
+from src.app_functions_sdk_py.internal.runtime import FunctionsPipelineRuntime
+from src.app_functions_sdk_py.internal.runtime.asyncexec import ASYNC_LOOP_THREAD_NAME, \
+    SYNC_WORKER_THREAD_PREFIX
+from src.app_functions_sdk_py.internal.store.sqlite.client import new_sqlite_client
+from src.app_functions_sdk_py.sync.waitgroup import WaitGroup
+
+SERVICE_KEY = "AppService-UnitTest"
+
+EVENT = {
+    "apiVersion": "v3",
+    "id": "6ac1a3ea-5b26-4d2c-a8d5-2e0a1b9bdfe4",
+    "deviceName": "device1",
+    "profileName": "profile1",
+    "sourceName": "source1",
+    "origin": 1,
+    "readings": [],
+}
+
+ADD_EVENT_REQUEST = {
+    "apiVersion": "v3",
+    "requestId": "82eb2e26-0f24-48aa-ae4c-de9dac3fb9bc",
+    "event": EVENT,
+}
+
+ADD_EVENT_REQUEST_PAYLOAD = json.dumps(ADD_EVENT_REQUEST).encode()
+
+
+class CustomType:
+    """ A custom target type used by the tests """
+    instances = 0
+
+    def __init__(self):
+        CustomType.instances += 1
+        self.name = ""
+        self.value = 0
+
+
+class TestDecodeMessage(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+        })
+        self.ctx = Context("", self.dic, "")
+
+    def new_runtime(self, target_type) -> FunctionsPipelineRuntime:
+        return FunctionsPipelineRuntime(SERVICE_KEY, target_type, self.dic)
+
+    @staticmethod
+    def new_envelope(payload: bytes) -> MessageEnvelope:
+        return MessageEnvelope(receivedTopic="test/topic", correlationID="123", payload=payload)
+
+    def test_raw_target_type(self):
+        for target_type in (bytes, bytes()):
+            with self.subTest(target_type):
+                runtime = self.new_runtime(target_type)
+                data = runtime.decode_message(self.ctx, self.new_envelope(b"raw"))
+                self.assertEqual(b"raw", data)
+                self.assertEqual(("test/topic", True), self.ctx.get_value(KEY_RECEIVEDTOPIC))
+
+    def test_event_target_type(self):
+        for target_type in (None, Event, Event()):
+            with self.subTest(target_type):
+                runtime = self.new_runtime(target_type)
+                data = runtime.decode_message(self.ctx, self.new_envelope(ADD_EVENT_REQUEST_PAYLOAD))
+                self.assertIsInstance(data, Event)
+                self.assertEqual("device1", data.deviceName)
+                self.assertEqual(("device1", True), self.ctx.get_value(KEY_DEVICE_NAME))
+
+    def test_custom_target_type_factory(self):
+        runtime = self.new_runtime(CustomType)
+        payload = b'{"name": "test", "value": 5}'
+
+        first = runtime.decode_message(self.ctx, self.new_envelope(payload))
+        instances = CustomType.instances
+        second = runtime.decode_message(self.ctx, self.new_envelope(b'{"name": "other"}'))
+
+        self.assertIsInstance(first, CustomType)
+        self.assertEqual(("test", 5), (first.name, first.value))
+        self.assertEqual(("other", 0), (second.name, second.value))
+        self.assertEqual(instances + 1, CustomType.instances)
+
+    def test_custom_target_type_instance_not_retained(self):
+        prototype = CustomType()
+        prototype.value = 7
+        runtime = self.new_runtime(prototype)
+
+        first = runtime.decode_message(self.ctx, self.new_envelope(b'{"name": "test"}'))
+        second = runtime.decode_message(self.ctx, self.new_envelope(b'{"value": 1}'))
+
+        self.assertEqual(("test", 7), (first.name, first.value))
+        self.assertEqual(("", 1), (second.name, second.value))
+        self.assertEqual(("", 7), (prototype.name, prototype.value))
+
+    def test_custom_target_type_invalid_payload(self):
+        runtime = self.new_runtime(lambda: CustomType())
+        self.assertIsNone(runtime.decode_message(self.ctx, self.new_envelope(b"not json")))
+
+
+class TestProcessEventPayload(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        dic = Container()
+        dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, dic)
+
+    def test_payloads(self):
+        tests = [
+            ("add event request", ADD_EVENT_REQUEST_PAYLOAD, "application/json"),
+            ("event", json.dumps(EVENT).encode(), "application/json"),
+            ("content type with charset", ADD_EVENT_REQUEST_PAYLOAD,
+             "application/json; charset=utf-8"),
+            ("cbor add event request", cbor2.dumps(ADD_EVENT_REQUEST), CONTENT_TYPE_CBOR),
+            ("cbor event", cbor2.dumps(EVENT), CONTENT_TYPE_CBOR),
+        ]
+        for name, payload, content_type in tests:
+            with self.subTest(name):
+                envelope = MessageEnvelope(payload=payload, contentType=content_type)
+                event = self.runtime.process_event_payload(envelope)
+                self.assertIsInstance(event, Event)
+                self.assertEqual(EVENT["id"], event.id)
+                self.assertEqual("device1", event.deviceName)
+                self.assertEqual(content_type, envelope.contentType)
+
+    def test_invalid_payload(self):
+        with self.assertRaises(errors.EdgeX):
+            self.runtime.process_event_payload(MessageEnvelope(payload=b"not an event"))
+
+
+class TestAsyncPipeline(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+        self.threads = []
+
+    def tearDown(self):
+        self.runtime.stop(5)
+
+    async def async_append(self, _: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        await asyncio.sleep(0)
+        self.threads.append(threading.current_thread().name)
+        return True, data + "-async"
+
+    def sync_append(self, _: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        self.threads.append(threading.current_thread().name)
+        return True, data + "-sync"
+
+    def test_is_async(self):
+        pipeline = FunctionPipeline("test", ["#"], self.sync_append)
+        self.assertFalse(pipeline.is_async)
+        pipeline.transforms = (self.sync_append, partial(self.async_append, None))
+        self.assertTrue(pipeline.is_async)
+
+    def test_execute_pipeline(self):
+        results = []
+
+        def capture(_: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            results.append(data)
+            return False, None
+
+        pipeline = FunctionPipeline("test", ["#"], self.async_append,
+                                    self.sync_append, capture)
+        self.assertIsNone(self.runtime.execute_pipeline(Context("", self.dic, ""), "in", pipeline))
+
+        self.assertEqual(["in-async-sync"], results)
+        self.assertEqual(ASYNC_LOOP_THREAD_NAME, self.threads[0])
+        self.assertTrue(self.threads[1].startswith(SYNC_WORKER_THREAD_PREFIX))
+
+    def test_execute_pipeline_error(self):
+        async def failing(_: AppFunctionContext, __: Any) -> Tuple[bool, Any]:
+            return False, errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+
+        pipeline = FunctionPipeline("test", ["#"], failing, self.sync_append)
+        message_error = self.runtime.execute_pipeline(Context("", self.dic, ""), "in", pipeline)
+
+        self.assertIsNotNone(message_error)
+        self.assertEqual(1, pipeline.processing_errors.get_count())
+        self.assertEqual([], self.threads)
+
+    def test_submit_message_in_flight(self):
+        async def wait(_: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            await asyncio.sleep(0.2)
+            return True, data
+
+        pipeline = FunctionPipeline("test", ["#"], wait)
+        start = time.monotonic()
+        futures = [self.runtime.submit_message(Context("", self.dic, ""), i, pipeline)
+                   for i in range(200)]
+        for future in futures:
+            self.assertIsNone(future.result(5))
+        # all executions are awaited concurrently on the event loop thread
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_submit_after_stop(self):
+        self.runtime.stop(5)
+        pipeline = FunctionPipeline("test", ["#"], self.async_append)
+        with self.assertRaises(RuntimeError):
+            self.runtime.submit_message(Context("", self.dic, ""), "in", pipeline)
+
+
+class TestBatchPipeline(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+        self.runtime.store_forward.store_for_later_retry = MagicMock()
+        self.batch_sizes = []
+
+    @batch_app_function
+    def batch_double(self, ctxs: List[AppFunctionContext],
+                     data: List[Any]) -> List[Tuple[bool, Any]]:
+        self.batch_sizes.append(len(ctxs))
+        return [(True, d * 2) for d in data]
+
+    @staticmethod
+    def fail_odd(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        if data % 4 == 2:
+            ctx.set_retry_data(str(data).encode())
+            return False, errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+        return True, data
+
+    def new_contexts(self, count: int) -> List[Context]:
+        return [Context(str(i), self.dic, "") for i in range(count)]
+
+    def test_execute_pipeline_batch(self):
+        results = {}
+
+        def capture(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            results[ctx.correlation_id()] = data
+            return True, data
+
+        pipeline = FunctionPipeline("test", ["#"], self.batch_double, self.fail_odd,
+                                    self.batch_double, capture)
+        ctxs = self.new_contexts(4)
+        message_errors = self.runtime.process_batch(ctxs, [1, 2, 3, 4], pipeline)
+
+        self.assertIsNone(message_errors[1])
+        self.assertIsNotNone(message_errors[0])
+        self.assertIsNotNone(message_errors[2])
+        self.assertEqual({"1": 8, "3": 16}, results)
+        # the failed messages are no longer part of the batch once they failed
+        self.assertEqual([4, 2], self.batch_sizes)
+        self.assertEqual(2, pipeline.processing_errors.get_count())
+        stored = self.runtime.store_forward.store_for_later_retry.call_args_list
+        self.assertEqual([(b"2", ctxs[0], pipeline, 1), (b"6", ctxs[2], pipeline, 1)],
+                         [c.args for c in stored])
+
+    def test_execute_pipeline_batch_raising(self):
+        def raise_on_two(_: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            if data == 2:
+                raise ValueError("raised")
+            return True, data
+
+        pipeline = FunctionPipeline("test", ["#"], raise_on_two, self.batch_double)
+        message_errors = self.runtime.process_batch(self.new_contexts(3), [1, 2, 3], pipeline)
+
+        self.assertIsNone(message_errors[0])
+        self.assertIsNotNone(message_errors[1])
+        self.assertIsNone(message_errors[2])
+        # the raising message is no longer part of the batch once it failed
+        self.assertEqual([2], self.batch_sizes)
+        self.assertEqual(1, pipeline.processing_errors.get_count())
+
+    def test_execute_pipeline_with_batch_function(self):
+        pipeline = FunctionPipeline("test", ["#"], self.batch_double, self.fail_odd)
+        ctx = Context("", self.dic, "")
+        self.assertIsNone(self.runtime.execute_pipeline(ctx, 2, pipeline))
+        self.assertEqual([1], self.batch_sizes)
+        self.assertIsNotNone(self.runtime.execute_pipeline(ctx, 1, pipeline))
+
+    def test_batch_function_result_count(self):
+        @batch_app_function
+        def drop_last(_: List[AppFunctionContext], data: List[Any]) -> List[Tuple[bool, Any]]:
+            return [(True, d) for d in data[:-1]]
+
+        pipeline = FunctionPipeline("test", ["#"], drop_last)
+        message_errors = self.runtime.execute_pipeline_batch(self.new_contexts(2), [1, 2],
+                                                             pipeline)
+        self.assertTrue(all(message_error is not None for message_error in message_errors))
+
+
+class TestPipelinePlan(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.config = ConfigurationStruct()
+        self.config.Writable.StoreAndForward = StoreAndForwardInfo()
+        metrics_manager = MagicMock(spec=MetricsManager)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+            ConfigurationName: lambda get: self.config,
+            MetricsManagerInterfaceName: lambda get: metrics_manager,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+        self.runtime.store_forward.store_for_later_retry = MagicMock()
+        self.calls = []
+
+    def append(self, name: str):
+        def func(_: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+            self.calls.append(name)
+            return True, data + name
+        func.__name__ = name
+        return func
+
+    @staticmethod
+    def failing(ctx: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        ctx.set_retry_data(data.encode())
+        return False, errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+
+    def test_plan_compiled_when_transforms_set(self):
+        self.runtime.add_function_pipeline("test", ["#"], self.append("a"))
+        pipeline = self.runtime.get_pipeline_by_id("test")
+        plan = pipeline.plan
+        self.assertIsNotNone(plan)
+
+        self.runtime.set_functions_pipeline_transforms("test", self.append("b"), self.append("c"))
+        self.assertIsNot(plan, pipeline.plan)
+        self.assertIsNone(self.runtime.execute_pipeline(Context("", self.dic, ""), "", pipeline))
+        self.assertEqual(["b", "c"], self.calls)
+
+    def test_start_position(self):
+        pipeline = FunctionPipeline("test", ["#"], self.append("a"), self.append("b"),
+                                    self.append("c"))
+        for store_forward_enabled in (False, True):
+            with self.subTest(store_forward_enabled=store_forward_enabled):
+                self.config.Writable.StoreAndForward.Enabled = store_forward_enabled
+                self.calls = []
+                self.runtime.execute_pipeline(Context("", self.dic, ""), "", pipeline, 1, True)
+                self.assertEqual(["b", "c"], self.calls)
+
+    def test_store_for_later_retry(self):
+        pipeline = FunctionPipeline("test", ["#"], self.append("a"), self.failing)
+        ctx = Context("", self.dic, "")
+
+        self.assertIsNotNone(self.runtime.execute_pipeline(ctx, "in", pipeline))
+        self.runtime.store_forward.store_for_later_retry.assert_not_called()
+
+        self.config.Writable.StoreAndForward.Enabled = True
+        self.assertIsNotNone(self.runtime.execute_pipeline(ctx, "in", pipeline))
+        self.runtime.store_forward.store_for_later_retry.assert_called_once_with(
+            b"ina", ctx, pipeline, 1)
+
+    def test_function_metrics(self):
+        metrics_manager = metrics_manager_from(self.dic.get)
+        self.runtime.add_function_pipeline("plain", ["#"], self.append("a"))
+        self.assertEqual([], self.runtime.get_pipeline_by_id("plain").function_metrics)
+        metrics_manager.register.reset_mock()
+
+        self.config.Writable.Telemetry.Metrics = {"PipelineFunctionProcessingTime": True}
+        self.runtime.add_function_pipeline("test", ["#"], self.append("a"), self.failing)
+        pipeline = self.runtime.get_pipeline_by_id("test")
+        self.assertEqual(["a", "failing"], [m.name for m in pipeline.function_metrics])
+        registered = {c.args[0]: c.args[2] for c in metrics_manager.register.call_args_list}
+        self.assertEqual({"pipeline": "test", "function": "failing", "index": "1"},
+                         registered["PipelineFunctionErrors-test-1"])
+        self.assertIn("PipelineFunctionProcessingTime-test-0", registered)
+
+        for _ in range(2):
+            self.runtime.execute_pipeline(Context("", self.dic, ""), "in", pipeline)
+        first, second = pipeline.function_metrics
+        self.assertEqual(2, first.processing_time.get_count())
+        self.assertEqual(0, first.processing_errors.get_count())
+        self.assertEqual(2, second.processing_time.get_count())
+        self.assertEqual(2, second.processing_errors.get_count())
+
+        self.runtime.set_functions_pipeline_transforms("test", self.append("b"))
+        metrics_manager.unregister.assert_any_call("PipelineFunctionErrors-test-1")
+        self.assertEqual(["b"], [m.name for m in pipeline.function_metrics])
+        self.assertEqual(2, pipeline.processing_errors.get_count())
+
+
+class TestStoreForwardRetryLoop(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.config = ConfigurationStruct()
+        self.config.Writable.StoreAndForward = StoreAndForwardInfo(Enabled=True,
+                                                                   RetryInterval="0.1s")
+        store_client = MagicMock(spec=StoreClient)
+        store_client.count.return_value = (0, None)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+            ConfigurationName: lambda get: self.config,
+            MetricsManagerInterfaceName: lambda get: MagicMock(spec=MetricsManager),
+            StoreClientInterfaceName: lambda get: store_client,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+        self.retried = threading.Semaphore(0)
+        self.runtime.store_forward.retry_stored_data = lambda _: self.retried.release()
+
+    def start(self) -> Tuple[threading.Event, WaitGroup]:
+        done = threading.Event()
+        wait_group = WaitGroup()
+        self.runtime.start_store_and_forward(wait_group, done, WaitGroup(), threading.Event(),
+                                             SERVICE_KEY)
+        self.assertTrue(self.runtime.store_forward.is_retry_loop_running())
+        return done, wait_group
+
+    def stop(self, done: threading.Event, wait_group: WaitGroup):
+        start = time.monotonic()
+        done.set()
+        self.runtime.wake_store_and_forward()
+        wait_group.wait()
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertFalse(self.runtime.store_forward.is_retry_loop_running())
+
+    def test_sub_second_retry_interval(self):
+        done, wait_group = self.start()
+        for _ in range(3):
+            self.assertTrue(self.retried.acquire(timeout=1))
+        self.stop(done, wait_group)
+        # the loop sleeps until each retry is due rather than spinning
+        self.assertLess(self.runtime.store_forward.retry_loop_wakeups.get_count(), 10)
+
+    def test_trigger_retry_wakes_up_loop(self):
+        self.config.Writable.StoreAndForward.RetryInterval = "1h"
+        done, wait_group = self.start()
+        self.assertFalse(self.retried.acquire(timeout=0.1))
+
+        self.runtime.store_forward.data_count.inc(1)
+        self.runtime.store_forward.trigger_retry()
+        self.assertTrue(self.retried.acquire(timeout=1))
+        self.stop(done, wait_group)
+        self.assertEqual(2, self.runtime.store_forward.retry_loop_wakeups.get_count())
+
+
+class TestStoreForwardRetry(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.config = ConfigurationStruct()
+        self.config.Writable.StoreAndForward = StoreAndForwardInfo(Enabled=True, MaxRetryCount=5,
+                                                                   RetryBatchSize=2)
+        self.store_client = new_sqlite_client(":memory:", logger)
+        self.addCleanup(self.store_client.disconnect)
+        self.dic = Container()
+        self.dic.update({
+            LoggingClientInterfaceName: lambda get: logger,
+            ConfigurationName: lambda get: self.config,
+            MetricsManagerInterfaceName: lambda get: MagicMock(spec=MetricsManager),
+            StoreClientInterfaceName: lambda get: self.store_client,
+        })
+        self.runtime = FunctionsPipelineRuntime(SERVICE_KEY, None, self.dic)
+        self.exported = []
+        self.runtime.add_function_pipeline("test", ["#"], self.export)
+        self.export_error = None
+
+    def export(self, _: AppFunctionContext, data: Any) -> Tuple[bool, Any]:
+        self.exported.append(data)
+        if self.export_error is not None:
+            return False, self.export_error
+        return True, data
+
+    def store(self, count: int) -> List[StoredObject]:
+        pipeline = self.runtime.get_pipeline_by_id("test")
+        items = [StoredObject(retryCount=0, pipelineId="test", version=pipeline.hash,
+                              appServiceKey=SERVICE_KEY, payload=f"data{index}".encode())
+                 for index in range(count)]
+        _, err = self.store_client.store_many(items)
+        self.assertIsNone(err)
+        self.runtime.store_forward.data_count.inc(count)
+        return items
+
+    def test_retry_in_batches(self):
+        items = self.store(5)
+        self.runtime.store_forward.retry_stored_data(SERVICE_KEY)
+
+        self.assertEqual([item.payload for item in items], self.exported)
+        self.assertEqual((0, None), self.store_client.count(SERVICE_KEY))
+        self.assertEqual(0, self.runtime.store_forward.data_count.get_count())
+
+    def test_failed_retries_updated(self):
+        self.store(5)
+        self.export_error = errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+        self.runtime.store_forward.retry_stored_data(SERVICE_KEY)
+
+        self.assertEqual(5, len(self.exported))
+        stored, err = self.store_client.retrieve_from_store(SERVICE_KEY)
+        self.assertIsNone(err)
+        self.assertEqual([1] * 5, [item.retryCount for item in stored])
+        self.assertEqual(5, self.runtime.store_forward.data_count.get_count())
+
+    def test_failed_retries_backoff(self):
+        self.config.Writable.StoreAndForward.RetryInterval = "1m"
+        self.config.Writable.StoreAndForward.MaxRetryBackoff = "1h"
+        self.store(5)
+        self.export_error = errors.new_common_edgex(errors.ErrKind.SERVER_ERROR, "failed")
+        start = int(time.time() * 1000)
+        self.runtime.store_forward.retry_stored_data(SERVICE_KEY)
+
+        stored, err = self.store_client.retrieve_from_store(SERVICE_KEY)
+        self.assertIsNone(err)
+        for item in stored:
+            self.assertTrue(start + 60_000 <= item.nextRetryAt <= time.time() * 1000 + 60_000)
+
+        # the failed items are not due on the next retry
+        self.runtime.store_forward.retry_stored_data(SERVICE_KEY)
+        self.assertEqual(5, len(self.exported))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import unittest
+from types import SimpleNamespace
+
+from src.app_functions_sdk_py.internal.runtime import topic_matches
+from src.app_functions_sdk_py.internal.runtime.topicindex import TopicIndex
+
+PIPELINE_TOPICS = {
+    "all": ["#"],
+    "exact": ["edgex/events/device/profile/dev1/source"],
+    "device": ["edgex/events/device/+/dev1/#"],
+    "multi": ["edgex/events/device/profile1/#", "edgex/events/device/profile2/+"],
+    "prefix-level": ["edgex/events/+/prof"],
+    "wildcard-first": ["+/events/device"],
+    "no-match": ["other/+/topic"],
+}
+
+INCOMING_TOPICS = [
+    "edgex/events/device/profile/dev1/source",
+    "edgex/events/device/profile/dev2/source",
+    "edgex/events/device/profile1/dev9/source",
+    "edgex/events/device/profile2/dev9",
+    "edgex/events/device/profile2",
+    "edgex/events/device/profile",
+    "edgex/events/x/profile/more",
+    "edgex/events/device",
+    "app/events/device/extra",
+    "other/topic",
+    "",
+]
+
+
+class TestTopicIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.pipelines = [SimpleNamespace(id=pipeline_id, topics=topics)
+                          for pipeline_id, topics in PIPELINE_TOPICS.items()]
+
+    def test_matches_same_pipelines_as_topic_matches(self):
+        index = TopicIndex(self.pipelines)
+        for incoming_topic in INCOMING_TOPICS:
+            with self.subTest(incoming_topic):
+                expected = [p.id for p in self.pipelines
+                            if topic_matches(incoming_topic, p.topics)]
+                actual = [p.id for p in index.match(incoming_topic)]
+                self.assertEqual(expected, actual)
+
+    def test_empty_index(self):
+        self.assertEqual((), TopicIndex([]).match("edgex/events"))
+
+    def test_lookups_are_cached(self):
+        index = TopicIndex(self.pipelines)
+        index.match(INCOMING_TOPICS[0])
+        index.match(INCOMING_TOPICS[0])
+        self.assertEqual(1, index.match.cache_info().hits)
+
+
+if __name__ == '__main__':
+    unittest.main()
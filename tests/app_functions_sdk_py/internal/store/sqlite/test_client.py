@@ -2,6 +2,7 @@
 #  SPDX-License-Identifier: Apache-2.0
 import base64
 import copy
+import json
 import sqlite3
 import unittest
 import uuid
@@ -159,3 +160,120 @@ class TestSqliteClient(unittest.TestCase):
                 self.assertIsNone(err)
                 self.assertTrue(len(objects) == 1)
                 self.assertEqual(test.to_update, objects[0])
+
+    def test_bulk_operations(self):
+        objects = [StoredObject(
+            appServiceKey="test-app-service",
+            payload=f"test{index}".encode(),
+            retryCount=0,
+            pipelineId="test-pipeline",
+            version="v3",
+            correlationID=f"test{index}"
+        ) for index in range(5)]
+
+        ids, err = self.client.store_many(objects)
+        self.assertIsNone(err)
+        self.assertEqual([o.id for o in objects], ids)
+        # storing again leaves the objects unchanged
+        _, err = self.client.store_many(objects[:1])
+        self.assertIsNone(err)
+
+        for o in objects:
+            o.retryCount = 1
+        err = self.client.update_many(objects[:3])
+        self.assertIsNone(err)
+        err = self.client.remove_many(objects[3:])
+        self.assertIsNone(err)
+
+        stored, err = self.client.retrieve_from_store("test-app-service")
+        self.assertIsNone(err)
+        self.assertEqual(objects[:3], sorted(stored, key=lambda o: o.correlationID))
+
+        no_id = copy.deepcopy(objects[0])
+        no_id.id = ""
+        self.assertIsNotNone(self.client.update_many([no_id]))
+        self.assertIsNotNone(self.client.remove_many([no_id]))
+
+    def test_pagination(self):
+        objects = [StoredObject(
+            appServiceKey="test-app-service",
+            payload=f"test{index}".encode(),
+            retryCount=0,
+            pipelineId="test-pipeline",
+            version="v3",
+            correlationID=f"test{index}"
+        ) for index in range(5)]
+        _, err = self.client.store_many(objects)
+        self.assertIsNone(err)
+        _, err = self.client.store(StoredObject(
+            appServiceKey="other-app-service", payload=b"other", retryCount=0, version="v3"))
+        self.assertIsNone(err)
+
+        count, err = self.client.count("test-app-service")
+        self.assertIsNone(err)
+        self.assertEqual(5, count)
+
+        pages = []
+        for page, err in self.client.iterate_from_store("test-app-service", 2):
+            self.assertIsNone(err)
+            pages.append(page)
+            # removing the objects of a page doesn't shift the following pages
+            self.assertIsNone(self.client.remove_many(page))
+        self.assertEqual([objects[0:2], objects[2:4], objects[4:]], pages)
+        self.assertEqual((0, None), self.client.count("test-app-service"))
+
+        pages = list(self.client.iterate_from_store("test-app-service", 0))
+        self.assertEqual(1, len(pages))
+        self.assertIsNotNone(pages[0][1])
+
+    def test_due_before(self):
+        objects = [StoredObject(
+            appServiceKey="test-app-service",
+            payload=f"test{index}".encode(),
+            retryCount=1,
+            version="v3",
+            nextRetryAt=next_retry_at
+        ) for index, next_retry_at in enumerate((3000, 1000, 0, 2000, 5000))]
+        _, err = self.client.store_many(objects)
+        self.assertIsNone(err)
+
+        pages = list(self.client.iterate_from_store("test-app-service", 2, 3000))
+        self.assertEqual([([objects[2], objects[1]], None), ([objects[3]], None)], pages)
+
+        objects[2].nextRetryAt = 4000
+        self.assertIsNone(self.client.update_many(objects[2:3]))
+        page, _, err = self.client.retrieve_page_from_store("test-app-service", None, 10)
+        self.assertIsNone(err)
+        self.assertEqual([objects[index] for index in (1, 3, 0, 2, 4)], page)
+
+    def test_migrate_version_1(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE store (id character PRIMARY KEY, "
+                     "app_service_key character NOT NULL, created int NOT NULL, "
+                     "content text NOT NULL)")
+        legacy = StoredObject(
+            id=str(uuid.uuid4()),
+            appServiceKey="test-app-service",
+            payload=base64.b64encode(b"test").decode(),
+            retryCount=2,
+            pipelineId="test-pipeline",
+            pipelinePosition=1,
+            version="v3",
+            correlationID="test",
+            contextData={"key": "value"}
+        )
+        conn.execute("INSERT INTO store VALUES (?, ?, ?, ?)",
+                     (legacy.id, legacy.appServiceKey, 1, json.dumps(legacy.__dict__)))
+        conn.commit()
+
+        client = Client(conn, self.logger)
+        objects, err = client.retrieve_from_store("test-app-service")
+        self.assertIsNone(err)
+        legacy.payload = b"test"
+        self.assertEqual([legacy], objects)
+        self.assertEqual(2, conn.execute("PRAGMA user_version").fetchone()[0])
+        self.assertEqual(b"test", conn.execute("SELECT payload FROM store").fetchone()[0])
+
+        # the migrated database is left as is when the client is created again
+        client = Client(conn, self.logger)
+        self.assertEqual((1, None), client.count("test-app-service"))
@@ -0,0 +1,2 @@
+#  Copyright (C) 2024 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
@@ -0,0 +1,98 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import threading
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct
+from src.app_functions_sdk_py.internal.constants import API_TRIGGER_ROUTE
+from src.app_functions_sdk_py.internal.trigger.http import HttpTrigger, RETRY_AFTER_HEADER, \
+    EXECUTION_MODE_INLINE
+
+
+class TestHttpTrigger(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.config = ConfigurationStruct()
+        self.config.Service.RequestTimeout = "5s"
+        self.config.Trigger.Http.MaxConcurrency = 1
+
+        self.service_binding = MagicMock()
+        self.service_binding.config.return_value = self.config
+        self.service_binding.get_default_pipeline.return_value.is_async = False
+        self.service_binding.build_context.return_value.response_data.return_value = b"done"
+        self.service_binding.build_context.return_value.response_content_type.return_value = ""
+        self.service_binding.decode_message.side_effect = lambda ctx, envelope: envelope.payload
+
+        def process_message(*_):
+            self.started.set()
+            self.release.wait(5)
+
+        self.service_binding.process_message.side_effect = process_message
+
+        self.router = FastAPI()
+        self.trigger = HttpTrigger(self.service_binding, MagicMock(), self.router)
+
+    def tearDown(self):
+        self.release.set()
+
+    def start(self) -> TestClient:
+        self.trigger.initialize(threading.Event(), MagicMock())
+        return TestClient(self.router)
+
+    def test_invalid_execution_mode(self):
+        self.config.Trigger.Http.ExecutionMode = "unknown"
+        with self.assertRaises(errors.EdgeX):
+            self.trigger.initialize(threading.Event(), MagicMock())
+
+    def test_inline_execution_mode(self):
+        self.config.Trigger.Http.ExecutionMode = EXECUTION_MODE_INLINE
+        self.release.set()
+        client = self.start()
+        self.assertIsNone(self.trigger.executor)
+        response = client.post(API_TRIGGER_ROUTE, content=b"data")
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertEqual(b"done", response.content)
+
+    def test_rejects_when_max_concurrency_reached(self):
+        self.config.Trigger.Http.RetryAfter = "3s"
+        client = self.start()
+        responses = []
+        first = threading.Thread(
+            target=lambda: responses.append(client.post(API_TRIGGER_ROUTE, content=b"first")))
+        first.start()
+        self.assertTrue(self.started.wait(5))
+
+        rejected = client.post(API_TRIGGER_ROUTE, content=b"second")
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE, rejected.status_code)
+        self.assertEqual("3", rejected.headers[RETRY_AFTER_HEADER])
+
+        self.release.set()
+        first.join(5)
+        self.assertEqual(HTTPStatus.OK, responses[0].status_code)
+        self.assertEqual(b"done", responses[0].content)
+
+    def test_request_deadline(self):
+        self.config.Service.RequestTimeout = "0.2s"
+        client = self.start()
+
+        response = client.post(API_TRIGGER_ROUTE, content=b"data")
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT, response.status_code)
+
+        # the slot is released once the pipeline completes, not when the deadline is exceeded
+        rejected = client.post(API_TRIGGER_ROUTE, content=b"data")
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE, rejected.status_code)
+        self.release.set()
+        self.trigger.executor.shutdown(wait=True)
+        self.assertTrue(self.trigger.in_flight.acquire(blocking=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
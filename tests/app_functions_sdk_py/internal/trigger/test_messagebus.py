@@ -0,0 +1,96 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import queue
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.container.messaging import MessagingClientName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.interfaces import FunctionPipeline
+from src.app_functions_sdk_py.interfaces.messaging import MessageEnvelope, TopicMessageQueue
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct
+from src.app_functions_sdk_py.internal.trigger.defaultservicebinding import \
+    DefaultTriggerMessageProcessor
+from src.app_functions_sdk_py.internal.trigger.messagebus import MessageBusTrigger
+from src.app_functions_sdk_py.messaging.loopback.client import LoopbackMessageClient
+from src.app_functions_sdk_py.sync.waitgroup import WaitGroup
+
+
+class TestMessageBusTrigger(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.client = LoopbackMessageClient()
+        self.dic = Container({
+            LoggingClientInterfaceName: lambda get: logger,
+            MessagingClientName: lambda get: self.client,
+        })
+        self.config = ConfigurationStruct()
+        self.config.MessageBus.BaseTopicPrefix = "edgex"
+        self.config.Trigger.SubscribeTopics = "events/#"
+        self.config.Trigger.PublishTopic = "responses"
+
+        self.pipeline = FunctionPipeline("test", ["#"], self.respond)
+        self.service_binding = MagicMock()
+        self.service_binding.config.return_value = self.config
+        self.service_binding.logger.return_value = logger
+        self.service_binding.get_matching_pipelines.return_value = [self.pipeline]
+        self.service_binding.build_context.side_effect = \
+            lambda envelope: Context(envelope.correlationID, self.dic, "")
+        self.service_binding.decode_message.side_effect = lambda ctx, envelope: envelope.payload
+        self.service_binding.process_message.side_effect = \
+            lambda ctx, data, pipeline: pipeline.transforms[0](ctx, data)
+
+    @staticmethod
+    def respond(ctx, data):
+        ctx.set_response_data(data.upper())
+        return True, data
+
+    def test_publishes_responses(self):
+        processor = DefaultTriggerMessageProcessor(self.service_binding, MagicMock())
+        trigger = MessageBusTrigger(self.service_binding, processor, self.dic)
+        ctx_done = threading.Event()
+        wait_group = WaitGroup()
+        disconnect = trigger.initialize(ctx_done, wait_group)
+        self.addCleanup(wait_group.wait)
+        self.addCleanup(processor.stop)
+        self.addCleanup(disconnect)
+        self.addCleanup(ctx_done.set)
+        responses = queue.Queue()
+        self.client.subscribe([TopicMessageQueue("edgex/responses", responses)], None)
+
+        self.client.publish(MessageEnvelope(correlationID="1", payload=b"data"),
+                            "edgex/events/device-1")
+        response = responses.get(timeout=5)
+        self.assertEqual("edgex/responses", response.receivedTopic)
+        self.assertEqual("1", response.correlationID)
+        self.assertEqual(b"DATA", response.payload)
+
+    def test_on_processed_once_pipelines_complete(self):
+        release = threading.Event()
+        pipelines = [FunctionPipeline(str(index), ["#"],
+                                      lambda ctx, data: (release.wait(5), data))
+                     for index in range(2)]
+        self.service_binding.get_matching_pipelines.return_value = pipelines
+        processor = DefaultTriggerMessageProcessor(self.service_binding, MagicMock())
+        self.addCleanup(processor.stop)
+        self.addCleanup(release.set)
+
+        processed = threading.Event()
+        processor.message_received(None, MessageEnvelope(payload=b"data"), None, processed.set)
+        self.assertFalse(processed.wait(0.2))
+        release.set()
+        self.assertTrue(processed.wait(5))
+
+        self.service_binding.get_matching_pipelines.return_value = []
+        unmatched = threading.Event()
+        processor.message_received(None, MessageEnvelope(payload=b"data"), None, unmatched.set)
+        self.assertTrue(unmatched.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
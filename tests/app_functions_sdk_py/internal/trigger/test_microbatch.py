@@ -0,0 +1,68 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.interfaces import FunctionPipeline
+from src.app_functions_sdk_py.internal.trigger.microbatch import MicroBatcher, \
+    FLUSHER_THREAD_NAME
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.lock = threading.Lock()
+        self.pipeline = FunctionPipeline("test", ["#"])
+
+    def dispatch(self, pipeline, items):
+        with self.lock:
+            self.batches.append((pipeline.id, [item.data for item in items],
+                                 threading.current_thread().name))
+        for item in items:
+            item.future.set_result(None)
+
+    def test_dispatches_full_batches(self):
+        batcher = MicroBatcher(MagicMock(), 3, 60, self.dispatch)
+        futures = [batcher.add(self.pipeline, MagicMock(), i) for i in range(7)]
+
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], [batch[1] for batch in self.batches])
+        self.assertTrue(all(future.done() for future in futures[:6]))
+        self.assertFalse(futures[6].done())
+
+        batcher.stop()
+        self.assertEqual([6], self.batches[-1][1])
+        self.assertTrue(futures[6].done())
+        with self.assertRaises(RuntimeError):
+            batcher.add(self.pipeline, MagicMock(), 7)
+
+    def test_dispatches_after_max_wait(self):
+        batcher = MicroBatcher(MagicMock(), 100, 0.05, self.dispatch)
+        other = FunctionPipeline("other", ["#"])
+        start = time.monotonic()
+        futures = [batcher.add(self.pipeline, MagicMock(), 1),
+                   batcher.add(other, MagicMock(), 2),
+                   batcher.add(self.pipeline, MagicMock(), 3)]
+
+        for future in futures:
+            self.assertIsNone(future.result(5))
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(sorted([("test", [1, 3], FLUSHER_THREAD_NAME),
+                                 ("other", [2], FLUSHER_THREAD_NAME)]), sorted(self.batches))
+        batcher.stop()
+
+    def test_dispatch_failure(self):
+        def failing(*_):
+            raise ValueError("failed")
+
+        batcher = MicroBatcher(MagicMock(), 2, 60, failing)
+        futures = [batcher.add(self.pipeline, MagicMock(), i) for i in range(2)]
+        for future in futures:
+            self.assertIsInstance(future.exception(1), ValueError)
+        batcher.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.internal.common.config import ExternalMqttConfig
+from src.app_functions_sdk_py.internal.trigger.mqtt import MqttTrigger, BACKPRESSURE_MODE_DROP, \
+    DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_IN_FLIGHT
+
+
+class TestMqttTriggerDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.received = threading.Semaphore(0)
+        self.on_processed = []
+        self.message_processor = MagicMock()
+
+        # the pipelines are left executing once message_received returns, until processed
+        def message_received(*_, on_processed=None):
+            self.on_processed.append(on_processed)
+            self.received.release()
+
+        self.message_processor.message_received.side_effect = message_received
+        self.trigger = MqttTrigger(MagicMock(), self.message_processor)
+
+    def tearDown(self):
+        self.processed()
+        if self.trigger.dispatcher is not None:
+            self.trigger.dispatcher.stop(5)
+
+    def processed(self):
+        while self.on_processed:
+            self.on_processed.pop(0)()
+
+    @staticmethod
+    def new_message():
+        message = MagicMock()
+        message.payload = b'{"key": "value"}'
+        message.topic = "test/topic"
+        return message
+
+    def test_defaults(self):
+        config = ExternalMqttConfig()
+        self.trigger._initialize_dispatcher(config)
+        self.assertEqual(DEFAULT_MAX_CONCURRENCY, config.MaxConcurrency)
+        self.assertEqual(DEFAULT_MAX_IN_FLIGHT, config.MaxInFlight)
+        self.assertTrue(self.trigger.pause_on_backpressure)
+
+    def test_invalid_backpressure_mode(self):
+        with self.assertRaises(errors.EdgeX):
+            self.trigger._initialize_dispatcher(ExternalMqttConfig(BackpressureMode="unknown"))
+
+    def test_drop_when_max_in_flight_reached(self):
+        self.trigger._initialize_dispatcher(
+            ExternalMqttConfig(MaxConcurrency=1, MaxInFlight=2, BackpressureMode=BACKPRESSURE_MODE_DROP))
+
+        for _ in range(2):
+            self.trigger.message_handler(MagicMock(), None, self.new_message())
+            self.assertTrue(self.received.acquire(timeout=5))
+
+        # the messages remain in flight until their pipelines have been processed
+        self.trigger.message_handler(MagicMock(), None, self.new_message())
+        self.assertFalse(self.received.acquire(timeout=0.2))
+        self.assertEqual(2, self.message_processor.message_received.call_count)
+
+        self.processed()
+        self.trigger.message_handler(MagicMock(), None, self.new_message())
+        self.assertTrue(self.received.acquire(timeout=5))
+        self.assertEqual(3, self.message_processor.message_received.call_count)
+
+    def test_pause_when_max_in_flight_reached(self):
+        self.trigger._initialize_dispatcher(ExternalMqttConfig(MaxConcurrency=1, MaxInFlight=1))
+
+        self.trigger.message_handler(MagicMock(), None, self.new_message())
+        self.assertTrue(self.received.acquire(timeout=5))
+
+        paused_handler = threading.Thread(
+            target=self.trigger.message_handler, args=(MagicMock(), None, self.new_message()))
+        paused_handler.start()
+        paused_handler.join(0.2)
+        self.assertTrue(paused_handler.is_alive(), "handler should block while at max in-flight")
+
+        self.processed()
+        paused_handler.join(5)
+        self.assertFalse(paused_handler.is_alive())
+        self.assertTrue(self.received.acquire(timeout=5))
+        self.assertEqual(2, self.message_processor.message_received.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
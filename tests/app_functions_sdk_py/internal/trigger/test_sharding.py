@@ -0,0 +1,141 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
+from src.app_functions_sdk_py.bootstrap.di.container import Container
+from src.app_functions_sdk_py.constants import KEY_DEVICE_NAME
+from src.app_functions_sdk_py.contracts import errors
+from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, INFO
+from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.interfaces import FunctionPipeline
+from src.app_functions_sdk_py.interfaces.messaging import MessageEnvelope
+from src.app_functions_sdk_py.internal.common.config import ConfigurationStruct
+from src.app_functions_sdk_py.internal.constants import PIPELINE_SHARD_QUEUE_DEPTH_NAME, \
+    SHARD_ID_TXT
+from src.app_functions_sdk_py.internal.trigger.defaultservicebinding import \
+    DefaultTriggerMessageProcessor
+from src.app_functions_sdk_py.internal.trigger.sharding import ShardedDispatcher, \
+    new_shard_key_func, SHARD_KEY_DEVICE_NAME, SHARD_KEY_TOPIC
+
+TOPIC = "edgex/events/device/service/profile/device-1/source"
+
+
+class TestShardKey(unittest.TestCase):
+
+    def setUp(self):
+        self.dic = Container()
+        self.envelope = MessageEnvelope(receivedTopic=TOPIC)
+
+    def test_device_name(self):
+        key = new_shard_key_func(SHARD_KEY_DEVICE_NAME)
+        ctx = Context("", self.dic, "")
+        self.assertEqual(TOPIC, key(ctx, self.envelope))
+        ctx.add_value(KEY_DEVICE_NAME, "device-2")
+        self.assertEqual("device-2", key(ctx, self.envelope))
+
+    def test_topic_level(self):
+        ctx = Context("", self.dic, "")
+        for topic_level, expected in ((0, TOPIC), (1, "edgex"), (-2, "device-1"), (8, TOPIC)):
+            with self.subTest(topic_level=topic_level):
+                key = new_shard_key_func(SHARD_KEY_TOPIC, topic_level)
+                self.assertEqual(expected, key(ctx, self.envelope))
+
+    def test_unsupported_key(self):
+        with self.assertRaises(ValueError):
+            new_shard_key_func("unknown")
+
+
+class TestShardedDispatcher(unittest.TestCase):
+
+    def test_ordered_per_key(self):
+        dispatcher = ShardedDispatcher(MagicMock(), 4, 100)
+        results = {}
+        lock = threading.Lock()
+
+        def task(key: str, value: int):
+            time.sleep(0.001 if value % 2 else 0)
+            with lock:
+                results.setdefault(key, []).append(value)
+
+        for value in range(50):
+            for key in ("a", "b", "c", "d", "e"):
+                self.assertTrue(dispatcher.submit(key, task, key, value))
+        dispatcher.stop(10)
+
+        self.assertEqual({key: list(range(50)) for key in "abcde"}, results)
+        self.assertTrue(all(shard.queue_depth.get_value() == 0 for shard in dispatcher.shards))
+
+    def test_message_key(self):
+        ctx = Context("", Container(), "")
+        ctx.add_value(KEY_DEVICE_NAME, "device-2")
+        envelope = MessageEnvelope(receivedTopic=TOPIC)
+        self.assertEqual("device-2", ShardedDispatcher(MagicMock(), 1).message_key(ctx, envelope))
+        dispatcher = ShardedDispatcher(MagicMock(), 1,
+                                       key_func=new_shard_key_func(SHARD_KEY_TOPIC, -2))
+        self.assertEqual("device-1", dispatcher.message_key(ctx, envelope))
+
+    def test_invalid_shard_count(self):
+        with self.assertRaises(ValueError):
+            ShardedDispatcher(MagicMock(), 0)
+
+
+class TestShardedMessageProcessor(unittest.TestCase):
+
+    def setUp(self):
+        logger = EdgeXLogger('test_service', INFO)
+        self.dic = Container()
+        self.dic.update({LoggingClientInterfaceName: lambda get: logger})
+        self.config = ConfigurationStruct()
+        self.config.Trigger.Sharding.Shards = 4
+        self.config.Trigger.Sharding.ShardKey = SHARD_KEY_TOPIC
+        self.config.Trigger.Sharding.TopicLevel = -2
+
+        self.processed = {}
+        self.lock = threading.Lock()
+        self.pipeline = FunctionPipeline("test", ["#"], self.record)
+
+        self.service_binding = MagicMock()
+        self.service_binding.config.return_value = self.config
+        self.service_binding.logger.return_value = logger
+        self.service_binding.get_matching_pipelines.return_value = [self.pipeline]
+        self.service_binding.build_context.side_effect = \
+            lambda envelope: Context(envelope.correlationID, self.dic, "")
+        self.service_binding.decode_message.side_effect = lambda ctx, envelope: envelope.payload
+        self.service_binding.process_message.side_effect = \
+            lambda ctx, data, pipeline: pipeline.transforms[0](ctx, data)
+        self.metrics_manager = MagicMock()
+
+    def record(self, _, data):
+        device, value = data
+        with self.lock:
+            self.processed.setdefault(device, []).append(value)
+        return True, data
+
+    def test_ordered_per_device(self):
+        processor = DefaultTriggerMessageProcessor(self.service_binding, self.metrics_manager)
+        for value in range(100):
+            for device in ("device-1", "device-2", "device-3"):
+                topic = f"edgex/events/device/service/profile/{device}/source"
+                processor.message_received(
+                    None, MessageEnvelope(receivedTopic=topic, payload=(device, value)), None)
+        processor.stop()
+
+        self.assertEqual({device: list(range(100))
+                          for device in ("device-1", "device-2", "device-3")}, self.processed)
+        registered = [c.args[0] for c in self.metrics_manager.register.call_args_list]
+        for index in range(4):
+            self.assertIn(PIPELINE_SHARD_QUEUE_DEPTH_NAME.replace(SHARD_ID_TXT, str(index)),
+                          registered)
+
+    def test_invalid_shard_key(self):
+        self.config.Trigger.Sharding.ShardKey = "unknown"
+        with self.assertRaises(errors.EdgeX):
+            DefaultTriggerMessageProcessor(self.service_binding, self.metrics_manager)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.app_functions_sdk_py.internal.trigger.workerpool import WorkerPool, \
+    OVERFLOW_POLICY_BLOCK, OVERFLOW_POLICY_DROP_OLDEST, OVERFLOW_POLICY_REJECT
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def blocking_task(self):
+        self.started.set()
+        self.release.wait(5)
+
+    def test_invalid_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            WorkerPool(MagicMock(), 1, 1, "unknown")
+
+    def test_executes_tasks_on_bounded_workers(self):
+        pool = WorkerPool(MagicMock(), 2, 100, OVERFLOW_POLICY_BLOCK)
+        results = []
+        lock = threading.Lock()
+
+        def task(value: int):
+            with lock:
+                results.append((value, threading.current_thread().name))
+
+        for i in range(50):
+            self.assertTrue(pool.submit(task, i))
+        pool.stop(5)
+
+        self.assertEqual(list(range(50)), sorted(r[0] for r in results))
+        self.assertLessEqual(len({r[1] for r in results}), 2)
+
+    def test_reject_policy(self):
+        pool = WorkerPool(MagicMock(), 1, 1, OVERFLOW_POLICY_REJECT)
+        discarded = MagicMock()
+
+        self.assertTrue(pool.submit(self.blocking_task))
+        self.assertTrue(self.started.wait(5))
+        self.assertTrue(pool.submit(lambda: None))
+        self.assertFalse(pool.submit(lambda: None, on_discard=discarded))
+
+        discarded.assert_called_once()
+        self.assertEqual(1, pool.rejected.get_count())
+        self.assertEqual(1, pool.queue_depth.get_value())
+
+    def test_drop_oldest_policy(self):
+        pool = WorkerPool(MagicMock(), 1, 1, OVERFLOW_POLICY_DROP_OLDEST)
+        oldest_discarded = MagicMock()
+        executed = []
+
+        self.assertTrue(pool.submit(self.blocking_task))
+        self.assertTrue(self.started.wait(5))
+        self.assertTrue(pool.submit(executed.append, "oldest", on_discard=oldest_discarded))
+        self.assertTrue(pool.submit(executed.append, "newest"))
+
+        oldest_discarded.assert_called_once()
+        self.assertEqual(1, pool.rejected.get_count())
+
+        self.release.set()
+        pool.stop(5)
+        self.assertEqual(["newest"], executed)
+
+    def test_drop_oldest_racing_stop(self):
+        pool = WorkerPool(MagicMock(), 1, 1, OVERFLOW_POLICY_DROP_OLDEST)
+        self.assertTrue(pool.submit(self.blocking_task))
+        self.assertTrue(self.started.wait(5))
+        self.assertTrue(pool.submit(lambda: None))
+        put_nowait = pool._tasks.put_nowait
+
+        def stop_then_put_nowait(task):
+            # stop begins once submit has checked it, replacing the queued task by a sentinel
+            pool._stopped = True
+            pool._tasks.get_nowait()
+            put_nowait(None)
+            pool._tasks.put_nowait = put_nowait
+            put_nowait(task)
+
+        pool._tasks.put_nowait = stop_then_put_nowait
+        discarded = MagicMock()
+        self.assertFalse(pool.submit(lambda: None, on_discard=discarded))
+
+        discarded.assert_called_once()
+        self.assertIsNone(pool._tasks.get_nowait())
+
+    def test_blocked_submit_racing_stop(self):
+        pool = WorkerPool(MagicMock(), 1, 1, OVERFLOW_POLICY_BLOCK)
+        self.assertTrue(pool.submit(self.blocking_task))
+        self.assertTrue(self.started.wait(5))
+        self.assertTrue(pool.submit(lambda: None))
+
+        discarded = MagicMock()
+        submitted = []
+        submitter = threading.Thread(
+            target=lambda: submitted.append(pool.submit(lambda: None, on_discard=discarded)))
+        submitter.start()
+        start = time.monotonic()
+        # the queue stays full as the worker is stuck, so stop gives up once timed out
+        pool.stop(0.5)
+        self.assertLess(time.monotonic() - start, 2)
+        submitter.join(5)
+
+        self.assertEqual([False], submitted)
+        discarded.assert_called_once()
+
+    def test_submit_after_stop(self):
+        pool = WorkerPool(MagicMock(), 1, 1)
+        pool.stop(5)
+        discarded = MagicMock()
+        self.assertFalse(pool.submit(lambda: None, on_discard=discarded))
+        discarded.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import queue
+import unittest
+
+from src.app_functions_sdk_py.interfaces.messaging import MessageEnvelope, TopicMessageQueue, \
+    LOOPBACK
+from src.app_functions_sdk_py.internal.common.config import MessageBusInfo
+from src.app_functions_sdk_py.messaging import new_message_client
+from src.app_functions_sdk_py.messaging.loopback.client import LoopbackMessageClient, \
+    topic_filter_matches, subscription_matches
+
+
+class TestTopicFilterMatches(unittest.TestCase):
+
+    def test_matches(self):
+        for topic_filter, topic, expected in (
+                ("edgex/events", "edgex/events", True),
+                ("edgex/events", "edgex/events/device", False),
+                ("edgex/#", "edgex/events/device", True),
+                ("edgex/#", "edgex", True),
+                ("#", "edgex/events", True),
+                ("edgex/+/device", "edgex/events/device", True),
+                ("edgex/+/device", "edgex/events/other", False),
+                ("edgex/+", "edgex/events/device", False),
+                ("edgex/events/device", "edgex/events", False)):
+            with self.subTest(topic_filter=topic_filter, topic=topic):
+                self.assertEqual(expected, topic_filter_matches(topic_filter, topic))
+
+
+class TestSubscriptionMatches(unittest.TestCase):
+
+    def test_cache_bounded(self):
+        events = queue.Queue()
+        matches = subscription_matches({"edgex/events/#": (events,)}, cache_size=2)
+        for device in range(10):
+            self.assertEqual((events,), matches(f"edgex/events/profile/device-{device}"))
+        self.assertEqual((), matches("edgex/other"))
+        self.assertEqual(2, matches.cache_info().currsize)
+
+
+class TestLoopbackMessageClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = LoopbackMessageClient()
+        self.events = queue.Queue()
+        self.device = queue.Queue()
+        self.errors = queue.Queue()
+        self.client.connect()
+        self.client.subscribe([TopicMessageQueue("edgex/events/#", self.events),
+                               TopicMessageQueue("edgex/events/+/device-1", self.device)],
+                              self.errors)
+
+    def test_publish(self):
+        message = MessageEnvelope(correlationID="1", payload=b"data")
+        self.client.publish(message, "edgex/events/profile/device-1")
+        self.client.publish(message, "edgex/events/profile/device-2")
+        self.client.publish(message, "edgex/other")
+
+        received = [self.events.get_nowait(), self.events.get_nowait()]
+        self.assertTrue(self.events.empty())
+        self.assertEqual(["edgex/events/profile/device-1", "edgex/events/profile/device-2"],
+                         [envelope.receivedTopic for envelope in received])
+        self.assertEqual(["1", "1"], [envelope.correlationID for envelope in received])
+        device_message = self.device.get_nowait()
+        self.assertTrue(self.device.empty())
+        self.assertEqual(b"data", device_message.payload)
+        self.assertIsNot(received[0], device_message)
+        self.assertEqual("", message.receivedTopic)
+
+    def test_unsubscribe(self):
+        self.client.publish(MessageEnvelope(), "edgex/events/profile/device-1")
+        self.client.unsubscribe(["edgex/events/#"])
+        self.client.publish(MessageEnvelope(), "edgex/events/profile/device-1")
+
+        self.assertEqual(1, self.events.qsize())
+        self.assertEqual(2, self.device.qsize())
+
+    def test_disconnect(self):
+        self.client.disconnect()
+        self.client.publish(MessageEnvelope(), "edgex/events/profile/device-1")
+
+        self.assertIsNone(self.events.get_nowait())
+        self.assertIsNone(self.device.get_nowait())
+        self.assertIsNone(self.errors.get_nowait())
+        self.assertTrue(self.events.empty() and self.device.empty() and self.errors.empty())
+
+    def test_new_message_client(self):
+        client = new_message_client(MessageBusInfo(Type=LOOPBACK), None)
+        self.assertIsInstance(client, LoopbackMessageClient)
+
+
+if __name__ == '__main__':
+    unittest.main()
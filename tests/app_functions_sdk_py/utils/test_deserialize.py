@@ -0,0 +1,62 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import unittest
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.app_functions_sdk_py.utils.deserialize import deserialize_to_dataclass, \
+    dataclass_decode_plan
+
+
+@dataclass
+class Item:
+    name: str = ""
+    count: int = 0
+    enabled: bool = False
+
+
+@dataclass
+class Container:
+    items: list[Item] = field(default_factory=list)
+    by_name: dict[str, Item] = field(default_factory=dict)
+    main: Item = field(default_factory=Item)
+    optional: Optional[Item] = None
+    extra: Any = None
+
+
+class TestDeserialize(unittest.TestCase):
+
+    def test_nested_dataclasses(self):
+        data = {
+            "items": [{"name": "a", "count": "1", "enabled": "true"}, {"name": "b"}],
+            "by_name": {"c": {"name": "c", "enabled": "false"}},
+            "main": {"name": "main", "count": 2, "unknown": "ignored"},
+            "optional": {"name": "kept as is"},
+            "extra": {"any": "value"},
+        }
+        result = deserialize_to_dataclass(data, Container)
+
+        self.assertEqual([Item("a", 1, True), Item("b")], result.items)
+        self.assertEqual({"c": Item("c", 0, False)}, result.by_name)
+        self.assertEqual(Item("main", 2), result.main)
+        self.assertEqual({"name": "kept as is"}, result.optional)
+        self.assertEqual({"any": "value"}, result.extra)
+
+    def test_list_of_dataclasses(self):
+        result = deserialize_to_dataclass([{"name": "a"}, {"count": 3}], list[Item])
+        self.assertEqual([Item("a"), Item(count=3)], result)
+
+    def test_none_values(self):
+        result = deserialize_to_dataclass({"name": None, "count": None}, Item)
+        self.assertEqual(Item(None, None), result)
+
+    def test_non_dataclass_target(self):
+        data = {"name": "a"}
+        self.assertIs(data, deserialize_to_dataclass(data, dict))
+
+    def test_plan_is_cached(self):
+        self.assertIs(dataclass_decode_plan(Item), dataclass_decode_plan(Item))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,19 @@
 #  Copyright (C) 2024 IOTech Ltd
 #  SPDX-License-Identifier: Apache-2.0
+import base64
+import json
+import os
 import unittest
 import uuid
+from unittest.mock import patch
 
 from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
 from src.app_functions_sdk_py.bootstrap.di.container import Container
 from src.app_functions_sdk_py.utils import helper
 from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, DEBUG
+from src.app_functions_sdk_py.contracts.common.constants import ENV_OPTIMIZE_EVENT_PAYLOAD, \
+    VALUE_TRUE, VALUE_TYPE_STRING
+from src.app_functions_sdk_py.contracts.dtos.event import new_event
 from src.app_functions_sdk_py.functions.context import Context
 
 
@@ -27,3 +34,50 @@ class TestHelper(unittest.TestCase):
         self.assertEqual(2, len(results))
         self.assertEqual("Hel lo", results[0])
         self.assertEqual("test", results[1])
+
+    def test_coerce_type_event_encoding_is_memoized(self):
+        event = new_event("profile1", "device1", "source1")
+        event.add_binary_reading("binary", b"TestData", "text/plain")
+
+        first, err = helper.coerce_type(event)
+        self.assertIsNone(err)
+        second, err = helper.coerce_type(event)
+        self.assertIsNone(err)
+
+        self.assertIs(first, second)
+        self.assertEqual(b"TestData", event.readings[0].binaryValue)
+        self.assertEqual(base64.b64encode(b"TestData").decode(),
+                         json.loads(first)["readings"][0]["binaryValue"])
+
+    def test_coerce_type_event_encoding_is_invalidated(self):
+        event = new_event("profile1", "device1", "source1")
+        event.add_base_reading("r1", VALUE_TYPE_STRING, "Hello")
+        encoded, _ = helper.coerce_type(event)
+
+        changes = [
+            ("add reading", lambda: event.add_base_reading("r2", VALUE_TYPE_STRING, "World")),
+            ("change reading value", lambda: setattr(event.readings[0], "value", "Bye")),
+            ("add reading tag", lambda: event.readings[0].tags.update({"key": "value"})),
+            ("add event tag", lambda: event.tags.update({"key": "value"})),
+            ("change event field", lambda: setattr(event, "sourceName", "source2")),
+        ]
+        for name, change in changes:
+            with self.subTest(name):
+                change()
+                updated, err = helper.coerce_type(event)
+                self.assertIsNone(err)
+                self.assertNotEqual(encoded, updated)
+                self.assertEqual(json.loads(updated), json.loads(helper.encode_json(event)))
+                encoded = updated
+
+    def test_coerce_type_event_encoding_keyed_by_optimize_flag(self):
+        event = new_event("profile1", "device1", "source1")
+        event.add_base_reading("r1", VALUE_TYPE_STRING, "Hello")
+        encoded, _ = helper.coerce_type(event)
+
+        with patch.dict(os.environ, {ENV_OPTIMIZE_EVENT_PAYLOAD: VALUE_TRUE}):
+            optimized, _ = helper.coerce_type(event)
+
+        self.assertNotIn("deviceName", json.loads(optimized)["readings"][0])
+        self.assertIn("deviceName", json.loads(encoded)["readings"][0])
+        self.assertIs(encoded, helper.coerce_type(event)[0])
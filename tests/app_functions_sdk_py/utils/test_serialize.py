@@ -0,0 +1,90 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import json
+import unittest
+from dataclasses import dataclass, field
+
+from src.app_functions_sdk_py.contracts.dtos.event import Event
+from src.app_functions_sdk_py.contracts.dtos.reading import BaseReading
+from src.app_functions_sdk_py.utils.serialize import to_jsonable, encode_json, register_encoder, \
+    use_json_backend, json_backend, JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON, JSON_BACKEND_MSGSPEC
+
+
+@dataclass
+class Inner:
+    name: str = "inner"
+    values: list = field(default_factory=lambda: [1, 2.5, None])
+
+
+@dataclass
+class Outer:
+    inner: Inner = field(default_factory=Inner)
+    items: list = field(default_factory=lambda: [Inner("a"), {"key": Inner("b")}])
+    data: dict = field(default_factory=lambda: {"flag": True, "nested": [[Inner("c")]]})
+    raw: tuple = (1, 2)
+
+
+class Point:
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+class TestSerialize(unittest.TestCase):
+
+    def test_to_jsonable(self):
+        expected = {
+            "inner": {"name": "inner", "values": [1, 2.5, None]},
+            "items": [{"name": "a", "values": [1, 2.5, None]},
+                      {"key": {"name": "b", "values": [1, 2.5, None]}}],
+            "data": {"flag": True, "nested": [[{"name": "c", "values": [1, 2.5, None]}]]},
+            "raw": (1, 2),
+        }
+        self.assertEqual(expected, to_jsonable(Outer()))
+
+    def test_encode_json(self):
+        event = Event(apiVersion="v3", id="1", deviceName="device1", profileName="profile1",
+                      sourceName="source1", origin=10)
+        event.readings.append(BaseReading(resourceName="temperature", valueType="Float64",
+                                          value="20.5", tags={"unit": "C"}))
+        expected = {
+            "apiVersion": "v3", "id": "1", "deviceName": "device1", "profileName": "profile1",
+            "sourceName": "source1", "origin": 10,
+            "readings": [{"resourceName": "temperature", "valueType": "Float64", "origin": 0,
+                          "deviceName": "", "profileName": "", "id": "", "value": "20.5",
+                          "units": "", "binaryValue": None, "objectValue": None,
+                          "tags": {"unit": "C"}, "mediaType": ""}],
+            "tags": {},
+        }
+        self.assertEqual(expected, json.loads(encode_json(event)))
+
+    def test_encode_json_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            encode_json({"value": b"bytes"})
+
+    def test_json_backends(self):
+        data = {"event": Event(deviceName="device1"), 1: [1.5, None, True]}
+        expected = {"event": to_jsonable(Event(deviceName="device1")), "1": [1.5, None, True]}
+        try:
+            for backend in (JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON, JSON_BACKEND_MSGSPEC):
+                with self.subTest(backend):
+                    selected = use_json_backend(backend)
+                    self.assertIn(selected, (backend, JSON_BACKEND_STDLIB))
+                    self.assertEqual(selected, json_backend())
+                    self.assertEqual(expected, json.loads(encode_json(data)))
+                    with self.assertRaises(TypeError):
+                        encode_json({"value": object()})
+        finally:
+            use_json_backend(JSON_BACKEND_STDLIB)
+
+    def test_unknown_json_backend(self):
+        self.assertEqual(JSON_BACKEND_STDLIB, use_json_backend("unknown"))
+
+    def test_register_encoder(self):
+        register_encoder(Point, lambda p: [p.x, p.y])
+        self.assertEqual({"point": [1, 2]}, json.loads(encode_json({"point": Point(1, 2)})))
+
+
+if __name__ == '__main__':
+    unittest.main()